@@ -0,0 +1,82 @@
+import argparse
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.enums.file_mode import FileReadMode
+from src.services.file_reader import FileReader
+
+
+def time_call(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def to_pipe(copy):
+    def run():
+        drain = subprocess.Popen(["cat"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+        copy(drain.stdin)
+        drain.stdin.close()
+        drain.wait()
+    return run
+
+
+def to_file(target: Path, copy):
+    def run():
+        with open(target, 'wb') as output:
+            copy(output)
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cat -b throughput with and without sendfile")
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logger = logging.getLogger(__name__)
+    reader = FileReader(logger)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "source.bin"
+        with open(source, 'wb') as f:
+            block = os.urandom(1024 * 1024)
+            f.writelines(block for _ in range(args.size_mb))
+        target = Path(tmp) / "target.bin"
+
+        def chunked(output):
+            for chunk in reader.iter_chunks(source, FileReadMode.bytes):
+                output.write(chunk)
+
+        def zero_copy(output):
+            reader.copy_into(source, output)
+
+        results = {
+            "/dev/null: chunked": time_call(to_file(Path(os.devnull), chunked), args.repeat),
+            "/dev/null: sendfile": time_call(to_file(Path(os.devnull), zero_copy), args.repeat),
+            "file: chunked": time_call(to_file(target, chunked), args.repeat),
+            "file: sendfile": time_call(to_file(target, zero_copy), args.repeat),
+        }
+        if shutil.which("cat"):
+            results["pipe: chunked"] = time_call(to_pipe(chunked), args.repeat)
+            results["pipe: sendfile"] = time_call(to_pipe(zero_copy), args.repeat)
+
+    print(f"{args.size_mb} MiB file, best of {args.repeat}")
+    for label, seconds in results.items():
+        print(f"{label:<28} {seconds * 1000:10.1f} ms {args.size_mb / 1024 / seconds:8.2f} GiB/s")
+
+
+if __name__ == "__main__":
+    main()
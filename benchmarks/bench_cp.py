@@ -0,0 +1,82 @@
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.enums.reflink_mode import ReflinkMode
+from src.services.file_copier import FileCopier
+
+
+def time_call(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cp throughput of the copy engine against shutil.copy2")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--small-files", type=int, default=2000)
+    parser.add_argument("--sparse-gb", type=int, default=2, help="Apparent size of the sparse image (1 MiB data per 256 MiB)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dir", default=None, help="Directory on the filesystem to test (default: system temp)")
+    args = parser.parse_args()
+
+    logger = logging.getLogger(__name__)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        source = Path(tmp) / "big.bin"
+        with open(source, 'wb') as f:
+            block = os.urandom(1024 * 1024)
+            f.writelines(block for _ in range(args.size_mb))
+        small = []
+        for i in range(args.small_files):
+            path = Path(tmp) / f"small_{i}.bin"
+            path.write_bytes(block[:4096])
+            small.append(path)
+        target = Path(tmp) / "copy.bin"
+
+        variants = {"shutil.copy2": shutil.copy2}
+        for mode in ReflinkMode:
+            copier = FileCopier(logger, reflink=mode)
+            try:
+                method = copier.copy_file(source, target).method
+            except OSError as e:
+                print(f"--reflink={mode.value}: {e}")
+                continue
+            variants[f"--reflink={mode.value} ({method})"] = copier.copy_file
+
+        print(f"{args.size_mb} MiB file and {args.small_files} x 4 KiB files, best of {args.repeat}")
+        for label, copy in variants.items():
+            big_seconds = time_call(lambda copy=copy: copy(source, target), args.repeat)
+            small_seconds = time_call(lambda copy=copy: [copy(path, target) for path in small], args.repeat)
+            print(
+                f"{label:<34} {big_seconds * 1000:9.1f} ms {args.size_mb / 1024 / big_seconds:6.2f} GiB/s"
+                f" | small files {small_seconds * 1000:8.1f} ms"
+            )
+
+        sparse = Path(tmp) / "sparse.img"
+        with open(sparse, 'wb') as f:
+            f.truncate(args.sparse_gb * 1024 ** 3)
+            for offset in range(0, args.sparse_gb * 1024 ** 3, 256 * 1024 * 1024):
+                f.seek(offset)
+                f.write(block)
+        print(f"\n{args.sparse_gb} GiB sparse image, {sparse.stat().st_blocks * 512 // 1024 ** 2} MiB allocated")
+        for label, copy in (("shutil.copy2", shutil.copy2), ("cp", FileCopier(logger).copy_file)):
+            seconds = time_call(lambda copy=copy: copy(sparse, target), args.repeat)
+            allocated = target.stat().st_blocks * 512 // 1024 ** 2
+            print(f"{label:<34} {seconds * 1000:9.1f} ms {allocated:8d} MiB allocated")
+
+
+if __name__ == "__main__":
+    main()
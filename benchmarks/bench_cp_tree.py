@@ -0,0 +1,76 @@
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.services.file_copier import FileCopier
+from src.services.tree_copier import ParallelTreeCopier
+
+
+def build_tree(root: Path, directories: int, files_per_directory: int, file_size: int) -> None:
+    payload = b"x" * file_size
+    for i in range(directories):
+        directory = root / f"dir_{i // 32}" / f"sub_{i}"
+        directory.mkdir(parents=True)
+        for j in range(files_per_directory):
+            (directory / f"file_{j}.txt").write_bytes(payload)
+
+
+def time_copy(copy, source: Path, destination: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        shutil.rmtree(destination, ignore_errors=True)
+        os.sync()
+        start = time.perf_counter()
+        copy(source, destination)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cp -r of many small files against shutil.copytree")
+    parser.add_argument("--directories", type=int, default=200)
+    parser.add_argument("--files", type=int, default=100, help="Files per directory")
+    parser.add_argument("--file-size", type=int, default=4096)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dir", default=None, help="Directory on the filesystem to test (default: system temp)")
+    args = parser.parse_args()
+
+    logger = logging.getLogger(__name__)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        source = Path(tmp) / "src"
+        destination = Path(tmp) / "dst"
+        build_tree(source, args.directories, args.files, args.file_size)
+        total = args.directories * args.files
+
+        variants = {"shutil.copytree": shutil.copytree}
+        for workers in args.workers:
+            copier = ParallelTreeCopier(logger, FileCopier(logger), workers=workers)
+            variants[f"cp -r --workers {workers}"] = copier.copy
+
+        print(f"{total} files of {args.file_size} B in {args.directories} directories, best of {args.repeat}")
+        for label, copy in variants.items():
+            seconds = time_copy(copy, source, destination, args.repeat)
+            print(f"{label:<26} {seconds * 1000:9.1f} ms {total / seconds:10.0f} files/s")
+
+        copier = ParallelTreeCopier(logger, FileCopier(logger), workers=max(args.workers))
+        for label, checksum in (("cp -r --update", False), ("cp -r --update --checksum", True)):
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                copier.copy(source, destination, update=True, checksum=checksum)
+                best = min(best, time.perf_counter() - start)
+            print(f"{label:<26} {best * 1000:9.1f} ms {total / best:10.0f} files/s (unchanged tree)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.services.directory_lister import DirectoryLister, lookup_group_name, lookup_owner_name
+
+
+def time_call(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure uid/gid name lookup cost in ls -l")
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lister = DirectoryLister(logging.getLogger(__name__))
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.files):
+            (Path(tmp) / f"file_{i:07d}").touch()
+        entries = sorted(lister.scan(tmp, with_stat=True), key=lambda e: e.name)
+        paths = [Path(entry.path) for entry in entries]
+
+        def per_entry_lookups():
+            for path in paths:
+                path.owner()
+                path.group()
+
+        def cached_lookups():
+            lookup_owner_name.cache_clear()
+            lookup_group_name.cache_clear()
+            lister.format_long(entries)
+
+        results = {
+            "Path.owner()/group() per entry": time_call(per_entry_lookups, args.repeat),
+            "ls -l (cached names)": time_call(cached_lookups, args.repeat),
+            "ls -l --numeric-ids": time_call(lambda: lister.format_long(entries, numeric_ids=True), args.repeat),
+        }
+
+    print(f"{args.files} entries, best of {args.repeat}")
+    for label, seconds in results.items():
+        print(f"{label:<34} {seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
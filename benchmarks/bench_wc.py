@@ -0,0 +1,68 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.services.word_count import WordCounter, count_file
+
+
+def naive_count(path: str) -> tuple[int, int, int]:
+    lines = words = size = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            lines += line.endswith(b"\n")
+            words += len(line.split())
+            size += len(line)
+    return lines, words, size
+
+
+def time_call(func) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure wc throughput against a naive line iterator")
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--files", type=int, default=4, help="Number of files for the parallel run")
+    args = parser.parse_args()
+
+    line = b"2024-01-01T00:00:00 INFO request handled path=/api/items status=200 took=12ms\n"
+    block = line * (1024 * 1024 // len(line))
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "big.log"
+        with open(source, 'wb') as f:
+            f.writelines(block for _ in range(args.size_mb))
+        size_gb = source.stat().st_size / 1e9
+
+        naive_seconds, naive_result = time_call(lambda: naive_count(str(source)))
+        chunked_seconds, chunked_result = time_call(lambda: count_file(str(source)))
+        assert naive_result == chunked_result, (naive_result, chunked_result)
+        lines_seconds, _ = time_call(lambda: count_file(str(source), count_words=False))
+
+        copies = [source]
+        for i in range(1, args.files):
+            copy = Path(tmp) / f"big_{i}.log"
+            os.link(source, copy)
+            copies.append(copy)
+        counter = WordCounter(logging.getLogger(__name__))
+        parallel_seconds, _ = time_call(lambda: list(counter.count(copies)))
+
+    print(f"{size_gb:.2f} GB file, {chunked_result[0]} lines, {chunked_result[1]} words")
+    print(f"{'naive line iterator':<32} {naive_seconds:8.2f} s {size_gb / naive_seconds:6.2f} GB/s")
+    print(f"{'chunked count':<32} {chunked_seconds:8.2f} s {size_gb / chunked_seconds:6.2f} GB/s")
+    print(f"{'chunked count, lines only':<32} {lines_seconds:8.2f} s {size_gb / lines_seconds:6.2f} GB/s")
+    label = f"process pool, {args.files} files"
+    print(f"{label:<32} {parallel_seconds:8.2f} s {size_gb * args.files / parallel_seconds:6.2f} GB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.services.zip_writer import ParallelZipWriter
+
+
+def build_tree(root: Path, files: int, size_mb: int) -> None:
+    root.mkdir()
+    line = b"2024-01-01 12:00:00 INFO request handled in 12ms path=/api/v1/items status=200\n"
+    per_file = size_mb * 1024 * 1024 // files
+    for i in range(files):
+        with open(root / f"part_{i}.log", 'wb') as f:
+            written = 0
+            while written < per_file:
+                block = line * 512 + os.urandom(256)
+                f.write(block)
+                written += len(block)
+
+
+def build_small_tree(root: Path, files: int) -> None:
+    root.mkdir()
+    for i in range(files):
+        (root / f"note_{i}.txt").write_bytes(b"small file %d\n" % i * (1 + i % 64))
+
+
+def zipfile_write(source: Path, destination: Path) -> None:
+    with zipfile.ZipFile(destination, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for path in source.rglob('*'):
+            if path.is_file():
+                archive.write(path, path.relative_to(source))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure zip throughput against zipfile.ZipFile.write")
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--small-files", type=int, default=5000, help="Also time a tree of this many tiny files (0 to skip)")
+    parser.add_argument("--dir", default=None, help="Directory on the filesystem to test (default: system temp)")
+    args = parser.parse_args()
+
+    logger = logging.getLogger(__name__)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        source = Path(tmp) / "src"
+        build_tree(source, args.files, args.size_mb)
+        destination = Path(tmp) / "out.zip"
+
+        variants = {"zipfile.write": zipfile_write}
+        for workers in args.workers:
+            variants[f"zip --workers {workers}"] = ParallelZipWriter(logger, workers=workers).write
+
+        print(f"{args.size_mb} MiB in {args.files} files, {os.cpu_count()} CPUs")
+        for label, write in variants.items():
+            start = time.perf_counter()
+            write(source, destination)
+            seconds = time.perf_counter() - start
+            ratio = destination.stat().st_size / (args.size_mb * 1024 * 1024)
+            print(f"{label:<20} {seconds * 1000:9.1f} ms {args.size_mb / seconds:8.1f} MiB/s  ratio {ratio:.3f}")
+
+        if args.small_files:
+            small = Path(tmp) / "small"
+            build_small_tree(small, args.small_files)
+            print(f"\n{args.small_files} small files")
+            for label, write in variants.items():
+                start = time.perf_counter()
+                write(small, destination)
+                seconds = time.perf_counter() - start
+                print(f"{label:<20} {seconds * 1000:9.1f} ms {args.small_files / seconds:8.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class EntryType(StrEnum):
+    file = "f"
+    directory = "d"
+    symlink = "l"
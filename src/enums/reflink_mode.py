@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class ReflinkMode(StrEnum):
+    auto = "auto"
+    always = "always"
+    never = "never"
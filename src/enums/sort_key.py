@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class SortKey(StrEnum):
+    name = "name"
+    size = "size"
+    mtime = "mtime"
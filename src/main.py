@@ -1,7 +1,9 @@
 from src.common.config import LOGGING_CONFIG
 
 import logging
+import os
 import sys
+import time
 from pathlib import Path
 
 import typer
@@ -13,8 +15,19 @@ from src.services import create_console_service
 from src.services.workspace_manager import WorkspaceManager
 from src.services.history_manager import HistoryManager
 from src.services.undo_manager import UndoManager
+from src.services.backup_purger import (
+    BackupPurger, DEFAULT_MAX_AGE_DAYS, MAX_AGE_ENV, MAX_SIZE_ENV, spawn_background_purge
+)
 from src.enums.list_mode import ListMode
+from src.enums.sort_key import SortKey
+from src.enums.reflink_mode import ReflinkMode
+from src.enums.entry_type import EntryType
+from src.services.file_mover import FileMover, MoveInterrupted
+from src.services.file_finder import FindQuery, SIZE_UNITS, parse_numeric_filter
+from src.services.line_index import parse_line_range
+from src.services.word_count import WordCount
 app = Typer()
+PROGRESS_INTERVAL_SECONDS = 0.5
 
 
 def get_container(ctx: Context) -> Container:
@@ -37,6 +50,8 @@ def main(ctx: Context):
         history_manager=history_manager,
         undo_manager=undo_manager,
     )
+    if ctx.invoked_subcommand != "gc":
+        spawn_background_purge(logger)
 
 
 @app.command()
@@ -46,15 +61,67 @@ def ls(
         ..., exists=False, readable=False, help="File to print"
     ),
     mode: bool = typer.Option(False, "--long", "-l", help="List in long format"),
+    numeric_ids: bool = typer.Option(False, "--numeric-ids", "-n", help="Show numeric user and group IDs"),
+    chunk_size: int = typer.Option(
+        0, "--chunk-size", help="Stream long listing unsorted, aligning columns per N entries"
+    ),
+    recursive: bool = typer.Option(False, "--recursive", "-R", help="List subdirectories recursively"),
+    depth: int = typer.Option(None, "--depth", help="Maximum recursion depth"),
+    workers: int = typer.Option(8, "--workers", help="Number of directories scanned in parallel"),
+    unordered: bool = typer.Option(False, "--unordered", help="Print directories as soon as they are scanned"),
+    sort: SortKey = typer.Option(None, "--sort", help="Sort by name, size (largest first) or mtime (newest first)"),
+    reverse: bool = typer.Option(False, "--reverse", "-r", help="Reverse the sort order"),
+    limit: int = typer.Option(None, "--limit", help="Show only the first N entries"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan the directory instead of using the listing cache"),
 ) -> None:
     try:
         container: Container = get_container(ctx)
         args = [str(path)]
         if mode:
             args.append("-l")
+        if numeric_ids:
+            args.append("-n")
+        if chunk_size:
+            args.extend(["--chunk-size", str(chunk_size)])
+        if recursive:
+            args.append("-R")
+        if depth is not None:
+            args.extend(["--depth", str(depth)])
+        if unordered:
+            args.append("--unordered")
+        if sort is not None:
+            args.extend(["--sort", sort.value])
+        if reverse:
+            args.append("-r")
+        if limit is not None:
+            args.extend(["--limit", str(limit)])
+        if no_cache:
+            args.append("--no-cache")
         container.history_manager.add_command("ls", args)
         
-        content = container.console_service.ls(path, list_mode=ListMode.long if mode else ListMode.short)
+        list_mode = ListMode.long if mode else ListMode.short
+        if recursive:
+            content = container.console_service.iter_ls_recursive(
+                path,
+                list_mode=list_mode,
+                numeric_ids=numeric_ids,
+                max_depth=depth,
+                workers=workers,
+                ordered=not unordered,
+            )
+            sys.stdout.writelines(content)
+            return
+        
+        content = container.console_service.iter_ls(
+            path,
+            list_mode=list_mode,
+            numeric_ids=numeric_ids,
+            chunk_size=chunk_size,
+            sort_key=sort,
+            reverse=reverse,
+            limit=limit,
+            use_cache=not no_cache,
+        )
         if mode:
             for item in content:
                 typer.echo(item)
@@ -64,6 +131,106 @@ def ls(
         typer.echo(e)
 
 
+def _format_size(size: int) -> str:
+    for unit in ("B", "K", "M", "G", "T"):
+        if size < 1024 or unit == "T":
+            return f"{size}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+
+
+class _ProgressPrinter:
+
+    def __init__(self, label: str):
+        self.label = label
+        self.reported = False
+        self._last_report = 0.0
+
+    def __call__(self, done: int) -> None:
+        now = time.monotonic()
+        if now - self._last_report >= PROGRESS_INTERVAL_SECONDS:
+            self._last_report = now
+            self.reported = True
+            typer.echo(f"\r{self.label} {_format_size(done)}", nl=False, err=True)
+
+    def finish(self) -> None:
+        if self.reported:
+            typer.echo("", err=True)
+
+
+@app.command()
+def du(
+    ctx: Context,
+    path: Path = typer.Argument(..., exists=False, help="File or directory to measure"),
+    apparent_size: bool = typer.Option(False, "--apparent-size", help="Print apparent sizes instead of disk usage"),
+    human_readable: bool = typer.Option(False, "--human-readable", "-h", help="Print sizes like 1.5K, 23.0M"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Rescan every directory instead of using the du cache"),
+    workers: int = typer.Option(8, "--workers", help="Number of directories scanned in parallel"),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        args = [str(path)]
+        if apparent_size:
+            args.append("--apparent-size")
+        if human_readable:
+            args.append("-h")
+        if no_cache:
+            args.append("--no-cache")
+        container.history_manager.add_command("du", args)
+        
+        usage = container.console_service.du(path, use_cache=not no_cache, workers=workers)
+        size = usage.apparent_size if apparent_size else usage.allocated_size
+        typer.echo(f"{_format_size(size) if human_readable else size}\t{path}")
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def find(
+    ctx: Context,
+    path: Path = typer.Argument(..., exists=False, help="Directory to search"),
+    name: str = typer.Option(None, "--name", help="Glob pattern matched against the entry name"),
+    regex: str = typer.Option(None, "--regex", help="Regular expression matched against the whole path"),
+    entry_type: EntryType = typer.Option(None, "--type", help="Entry type: f (file), d (directory), l (symlink)"),
+    size: str = typer.Option(None, "--size", help="Size in bytes, +N larger, -N smaller; with a k, M, G, T suffix sizes are rounded up to that unit, as in find -size"),
+    mtime: str = typer.Option(None, "--mtime", help="Modified N days ago, +N more than, -N less than"),
+    max_depth: int = typer.Option(None, "--maxdepth", help="Descend at most N levels below the start path"),
+    prune: list[str] = typer.Option(None, "--prune", help="Do not descend into directories matching this glob"),
+    workers: int = typer.Option(8, "--workers", help="Number of directories scanned in parallel"),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        args = [str(path)]
+        for flag, value in (
+            ("--name", name),
+            ("--regex", regex),
+            ("--type", entry_type.value if entry_type else None),
+            ("--size", size),
+            ("--mtime", mtime),
+            ("--maxdepth", max_depth),
+        ):
+            if value is not None:
+                args.extend([flag, str(value)])
+        for pattern in prune or []:
+            args.extend(["--prune", pattern])
+        container.history_manager.add_command("find", args)
+        
+        query = FindQuery(
+            name=name,
+            regex=regex,
+            entry_type=entry_type,
+            size=size,
+            mtime=mtime,
+            max_depth=max_depth,
+            prune=prune or [],
+        )
+        for match in container.console_service.find(path, query, workers=workers):
+            typer.echo(match)
+    except OSError as e:
+        typer.echo(e)
+    except ValueError as e:
+        typer.echo(e)
+
+
 @app.command()
 def cat(
     ctx: Context,
@@ -71,26 +238,157 @@ def cat(
         ..., exists=False, readable=False, help="File to print"
     ),
     mode: bool = typer.Option(False, "--bytes", "-b", help="Read as bytes"),
+    lines: str = typer.Option(None, "--lines", help="Print only lines A:B (1-based, inclusive; A: or :B allowed)"),
+    decompress: bool = typer.Option(False, "--decompress", "-z", help="Decompress gzip, bzip2 or xz input on the fly"),
 ):
     try:
         container: Container = get_container(ctx)
         args = [str(filename)]
         if mode:
             args.append("-b")
+        if lines is not None:
+            args.extend(["--lines", lines])
+        if decompress:
+            args.append("-z")
         container.history_manager.add_command("cat", args)
         
-        mode = FileReadMode.bytes if mode else FileReadMode.string
-        data = container.console_service.cat(
-            filename,
-            mode=mode,
-        )
-        if isinstance(data, bytes):
-            sys.stdout.buffer.write(data)
+        read_mode = FileReadMode.bytes if mode else FileReadMode.string
+        if lines is not None:
+            if decompress:
+                raise ValueError("--lines cannot be combined with --decompress")
+            first, last = parse_line_range(lines)
+            chunks = container.console_service.iter_cat_lines(filename, first, last, mode=read_mode)
+        elif mode and not decompress:
+            sys.stdout.flush()
+            container.console_service.cat_into(filename, sys.stdout.buffer)
+            return
         else:
-            sys.stdout.write(data)
+            chunks = container.console_service.iter_cat(filename, mode=read_mode, decompress=decompress)
+        
+        for data in chunks:
+            if isinstance(data, bytes):
+                sys.stdout.buffer.write(data)
+            else:
+                sys.stdout.write(data)
+        sys.stdout.flush()
+    except (OSError, ValueError) as e:
+        typer.echo(e)
+
+@app.command()
+def head(
+    ctx: Context,
+    filename: Path = typer.Argument(..., exists=False, readable=False, help="File to print"),
+    lines: int = typer.Option(10, "--lines", "-n", min=0, help="Number of lines to print"),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        container.history_manager.add_command("head", [str(filename), "-n", str(lines)])
+        
+        out = sys.stdout.buffer
+        for data in container.console_service.head(filename, lines):
+            out.write(data)
+        out.flush()
     except OSError as e:
         typer.echo(e)
 
+@app.command()
+def tail(
+    ctx: Context,
+    filename: Path = typer.Argument(..., exists=False, readable=False, help="File to print"),
+    lines: int = typer.Option(10, "--lines", "-n", min=0, help="Number of lines to print"),
+    follow: bool = typer.Option(False, "--follow", "-f", help="Keep printing data appended to the file"),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        args = [str(filename), "-n", str(lines)]
+        if follow:
+            args.append("-f")
+        container.history_manager.add_command("tail", args)
+        
+        out = sys.stdout.buffer
+        for data in container.console_service.tail(filename, lines, follow=follow):
+            out.write(data)
+            if follow:
+                out.flush()
+        out.flush()
+    except KeyboardInterrupt:
+        sys.stdout.flush()
+    except OSError as e:
+        typer.echo(e)
+
+def _format_word_count(count: WordCount, lines: bool, words: bool, size: bool) -> str:
+    columns = [value for value, enabled in ((count.lines, lines), (count.words, words), (count.size, size)) if enabled]
+    return " ".join(f"{value:>8}" for value in columns) + f" {count.path}"
+
+
+@app.command()
+def wc(
+    ctx: Context,
+    paths: list[Path] = typer.Argument(..., exists=False, help="Files to count"),
+    lines: bool = typer.Option(False, "--lines", "-l", help="Print the newline count"),
+    words: bool = typer.Option(False, "--words", "-w", help="Print the word count"),
+    size: bool = typer.Option(False, "--bytes", "-c", help="Print the byte count"),
+    workers: int = typer.Option(None, "--workers", help="Number of counting processes (default: CPU count)"),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        args = [str(path) for path in paths]
+        for flag, enabled in (("-l", lines), ("-w", words), ("-c", size)):
+            if enabled:
+                args.append(flag)
+        container.history_manager.add_command("wc", args)
+        
+        if not (lines or words or size):
+            lines = words = size = True
+        total = WordCount(path="total")
+        counts = container.console_service.wc(paths, workers=workers, count_words=words)
+        for count in counts:
+            if count.error is not None:
+                typer.echo(f"{count.path}: {count.error}")
+                continue
+            typer.echo(_format_word_count(count, lines, words, size))
+            total.lines += count.lines
+            total.words += count.words
+            total.size += count.size
+        if len(paths) > 1:
+            typer.echo(_format_word_count(total, lines, words, size))
+    except OSError as e:
+        typer.echo(e)
+
+@app.command()
+def grep(
+    ctx: Context,
+    pattern: str = typer.Argument(..., help="Regular expression to search for"),
+    path: Path = typer.Argument(..., exists=False, help="File or directory to search"),
+    recursive: bool = typer.Option(False, "--recursive", "-r", help="Search directories recursively"),
+    ignore_case: bool = typer.Option(False, "--ignore-case", "-i", help="Ignore case distinctions"),
+    workers: int = typer.Option(None, "--workers", help="Number of search processes (default: CPU count)"),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        args = [pattern, str(path)]
+        if recursive:
+            args.append("-r")
+        if ignore_case:
+            args.append("-i")
+        container.history_manager.add_command("grep", args)
+        
+        matches = container.console_service.grep(
+            path,
+            pattern,
+            recursive=recursive,
+            ignore_case=ignore_case,
+            workers=workers,
+        )
+        out = sys.stdout.buffer
+        for match in matches:
+            out.write(os.fsencode(f"{match.path}:{match.line_number}:") + match.line + b"\n")
+        out.flush()
+    except OSError as e:
+        typer.echo(e)
+    except ValueError as e:
+        typer.echo(e)
+
 @app.command()
 def rm(
     ctx: Context,
@@ -99,6 +397,8 @@ def rm(
     ),
     recursive: bool = typer.Option(False, "--recursive", "-r", help="Remove directory recursively"),
     force: bool = typer.Option(False, "--force", "-f", help="Force removal without confirmation"),
+    workers: int = typer.Option(8, "--workers", help="Number of directories removed in parallel"),
+    permanent: bool = typer.Option(False, "--permanent", help="Delete immediately instead of moving to the trash (cannot be undone)"),
 ) -> None:
     try:
         container: Container = get_container(ctx)
@@ -107,6 +407,8 @@ def rm(
             args.append("-r")
         if force:
             args.append("-f")
+        if permanent:
+            args.append("--permanent")
         container.history_manager.add_command("rm", args)
         
         path_str = str(path)
@@ -114,9 +416,7 @@ def rm(
             typer.echo("❌ Error: Cannot remove root directory '/' or parent directory '..'")
             return
         
-        resolved_path = container.workspace_manager.resolve_path(path)
-        if resolved_path.exists():
-            container.undo_manager.register_rm(resolved_path, recursive=recursive)
+        resolved_path = container.console_service.validate_rm(path, recursive=recursive)
         
         if recursive and not force:
             confirmation = typer.confirm(f"Remove '{path}' and all its contents?")
@@ -124,8 +424,18 @@ def rm(
                 typer.echo("Removal cancelled")
                 return
         
-        container.console_service.rm(path, recursive=recursive)
+        if not permanent:
+            if container.undo_manager.move_to_trash(resolved_path, recursive=recursive):
+                typer.echo(f"Removed: {path}")
+                return
+            container.undo_manager.register_rm(resolved_path, recursive=recursive)
+        
+        stats = container.console_service.rm(path, recursive=recursive, workers=workers)
         typer.echo(f"Removed: {path}")
+        if stats.directories:
+            typer.echo(
+                f"{stats.files} files, {stats.directories} directories, {_format_size(stats.size)}"
+            )
     except PermissionError as e:
         typer.echo(f"❌ Error: {e}")
     except OSError as e:
@@ -194,6 +504,7 @@ def mv(
     destination: Path = typer.Argument(
         ..., exists=False, readable=False, help="File to print"
     ),
+    workers: int = typer.Option(8, "--workers", help="Number of files copied in parallel when moving a directory across filesystems"),
 ) -> None:
     try:
         container: Container = get_container(ctx)
@@ -203,8 +514,21 @@ def mv(
         resolved_dest = container.workspace_manager.resolve_path(destination)
         container.undo_manager.register_mv(resolved_source, resolved_dest)
         
-        container.console_service.mv(source, destination)
+        progress = _ProgressPrinter("Copied")
+        try:
+            result = container.console_service.mv(source, destination, workers=workers, progress=progress)
+        finally:
+            progress.finish()
         typer.echo(f"Moved file: {source} to {destination}")
+        if result.method == "copy":
+            typer.echo(f"Copied across filesystems: {result.files} files, {_format_size(result.size)}")
+    except MoveInterrupted as e:
+        if e.phase == FileMover.REMOVE_PHASE:
+            typer.echo(f"Move interrupted: copy complete at {e.destination}, source {e.source} partially removed")
+        else:
+            typer.echo("Move interrupted: source intact, partial copy removed")
+    except KeyboardInterrupt:
+        typer.echo("Move interrupted: source intact")
     except OSError as e:
         typer.echo(e)
 
@@ -218,25 +542,69 @@ def cp(
         ..., exists=False, readable=False, help="File to print"
     ),
     recursive: bool = typer.Option(False, "--recursive", "-r", help="Copy directory recursively"),
+    reflink: ReflinkMode = typer.Option(
+        ReflinkMode.auto, "--reflink", help="Clone file data: auto (when supported), always (or fail), never"
+    ),
+    workers: int = typer.Option(8, "--workers", help="Number of files copied in parallel with -r"),
+    update: bool = typer.Option(False, "--update", "-u", help="Copy only files whose size or mtime differ"),
+    checksum: bool = typer.Option(False, "--checksum", help="With --update, compare file contents instead of mtime"),
+    delete: bool = typer.Option(False, "--delete", help="With --update -r, delete destination files missing from the source"),
+    resume: bool = typer.Option(False, "--resume", help="Checkpoint a single-file copy and continue an interrupted one"),
 ) -> None:
     try:
         container: Container = get_container(ctx)
         args = [str(source), str(destination)]
         if recursive:
             args.append("-r")
+        if reflink != ReflinkMode.auto:
+            args.append(f"--reflink={reflink.value}")
+        if update:
+            args.append("--update")
+        if checksum:
+            args.append("--checksum")
+        if delete:
+            args.append("--delete")
+        if resume:
+            args.append("--resume")
         container.history_manager.add_command("cp", args)
         
+        if (checksum or delete) and not update:
+            raise ValueError("--checksum and --delete require --update")
+        
         resolved_source = container.workspace_manager.resolve_path(source)
         resolved_dest = container.workspace_manager.resolve_path(destination)
         if resolved_dest.exists() and resolved_dest.is_dir():
             resolved_dest = resolved_dest / resolved_source.name
-        container.undo_manager.register_cp(resolved_source, resolved_dest)
+        register_undo = not update or not resolved_dest.exists()
+        if register_undo and not resume:
+            container.undo_manager.register_cp(resolved_source, resolved_dest)
         
-        container.console_service.cp(source, destination, recursive=recursive)
+        stats = container.console_service.cp(
+            source,
+            destination,
+            recursive=recursive,
+            reflink=reflink,
+            workers=workers,
+            update=update,
+            checksum=checksum,
+            delete=delete,
+            resume=resume,
+        )
+        if register_undo and resume:
+            container.undo_manager.register_cp(resolved_source, resolved_dest)
         typer.echo(f"Copied file: {source} to {destination}")
+        if stats.directories:
+            typer.echo(
+                f"{stats.files} files, {stats.directories} directories, {_format_size(stats.size)} "
+                f"in {stats.seconds:.2f}s ({_format_size(int(stats.throughput))}/s)"
+            )
+        if update:
+            typer.echo(f"{stats.skipped} unchanged, {stats.deleted} deleted")
+    except KeyboardInterrupt:
+        typer.echo("Copy interrupted; run it again with --resume to continue" if resume else "Copy interrupted")
     except FileExistsError as e:
         typer.echo(e)
-    except OSError as e:
+    except (OSError, ValueError) as e:
         typer.echo(e)
 
 @app.command()
@@ -244,6 +612,7 @@ def zip(
     ctx: Context,
     source: Path = typer.Argument(..., exists=False, help="File or directory to zip"),
     destination: Path = typer.Argument(..., exists=False, help="Archive file path"),
+    workers: int = typer.Option(None, "--workers", help="Number of compression processes (default: CPU count)"),
 ) -> None:
     try:
         container: Container = get_container(ctx)
@@ -254,9 +623,13 @@ def zip(
         from src.services.undo_manager import OperationType
         container.undo_manager.register_archive(OperationType.ZIP, resolved_source, resolved_dest)
         
-        container.console_service.zip(source, destination)
+        stats = container.console_service.zip(source, destination, workers=workers)
         typer.echo(f"Created archive: {destination}")
-    except OSError as e:
+        typer.echo(
+            f"{stats.files} files, {_format_size(stats.size)} -> {_format_size(stats.compressed_size)} "
+            f"in {stats.seconds:.2f}s"
+        )
+    except (OSError, ValueError) as e:
         typer.echo(e)
 
 @app.command()
@@ -360,6 +733,44 @@ def history(
     except Exception as e:
         typer.echo(f"Error: {e}")
 
+@app.command()
+def gc(
+    ctx: Context,
+    max_size: str = typer.Option(
+        "10G", "--max-size", envvar=MAX_SIZE_ENV, help="Byte quota for undo backups; suffixes k, M, G, T"
+    ),
+    max_age: int = typer.Option(
+        DEFAULT_MAX_AGE_DAYS, "--max-age", envvar=MAX_AGE_ENV, min=0, help="Purge backups older than N days"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only report what would be purged"),
+    background: bool = typer.Option(False, "--background", hidden=True),
+) -> None:
+    try:
+        container: Container = get_container(ctx)
+        if not background:
+            args = ["--max-size", max_size, "--max-age", str(max_age)]
+            if dry_run:
+                args.append("--dry-run")
+            container.history_manager.add_command("gc", args)
+        
+        sign, quota = parse_numeric_filter(max_size, SIZE_UNITS)
+        if sign:
+            raise ValueError(f"Invalid size quota: {max_size}")
+        purger = BackupPurger(
+            logging.getLogger(__name__),
+            container.undo_manager,
+            max_size=quota,
+            max_age_days=max_age,
+        )
+        stats = purger.purge(dry_run=dry_run)
+        if background:
+            return
+        action = "Would purge" if dry_run else "Purged"
+        typer.echo(f"{action} {stats.removed} backups ({_format_size(stats.freed)})")
+        typer.echo(f"Kept {stats.kept} backups ({_format_size(stats.kept_size)})")
+    except (OSError, ValueError) as e:
+        typer.echo(e)
+
 @app.command()
 def undo(ctx: Context) -> None:
     try:
@@ -0,0 +1,163 @@
+import os
+import stat
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+
+from src.services.disk_usage import DiskUsageScanner
+from src.services.tree_remover import ParallelRemover
+from src.services.undo_manager import UndoManager
+
+DEFAULT_MAX_SIZE = 10 * 1024 ** 3
+DEFAULT_MAX_AGE_DAYS = 30
+GC_INTERVAL_SECONDS = 60 * 60
+SECONDS_PER_DAY = 24 * 60 * 60
+MAX_SIZE_ENV = "CONSOLE_APP_GC_MAX_SIZE"
+MAX_AGE_ENV = "CONSOLE_APP_GC_MAX_AGE_DAYS"
+AUTO_GC_ENV = "CONSOLE_APP_AUTO_GC"
+
+
+@dataclass
+class PurgeStats:
+    removed: int = 0
+    freed: int = 0
+    kept: int = 0
+    kept_size: int = 0
+
+
+@dataclass
+class _Backup:
+    path: Path
+    size: int
+    created: float
+    referenced: bool
+
+
+class BackupPurger:
+
+    ORPHAN_GRACE_SECONDS = 10 * 60
+
+    def __init__(
+        self,
+        logger: Logger,
+        undo_manager: UndoManager,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+        workers: int = 8,
+    ):
+        self._logger = logger
+        self._undo_manager = undo_manager
+        self.max_size = max_size
+        self.max_age_days = max_age_days
+        self.workers = max(1, workers)
+
+    def purge(self, dry_run: bool = False) -> PurgeStats:
+        now = time.time()
+        doomed = []
+        kept = []
+        for backup in self._collect():
+            if not backup.referenced:
+                if now - backup.created >= self.ORPHAN_GRACE_SECONDS:
+                    doomed.append(backup)
+                continue
+            if now - backup.created > self.max_age_days * SECONDS_PER_DAY:
+                doomed.append(backup)
+                continue
+            kept.append(backup)
+
+        kept.sort(key=lambda backup: backup.created)
+        kept_size = sum(backup.size for backup in kept)
+        while kept and kept_size > self.max_size:
+            backup = kept.pop(0)
+            kept_size -= backup.size
+            doomed.append(backup)
+
+        stats = PurgeStats(kept=len(kept), kept_size=kept_size)
+        for backup in doomed:
+            if not dry_run and not self._remove(backup.path):
+                continue
+            stats.removed += 1
+            stats.freed += backup.size
+        self._logger.info(
+            f"Purged {stats.removed} backups ({stats.freed} bytes), kept {stats.kept} ({stats.kept_size} bytes)"
+        )
+        return stats
+
+    def _collect(self) -> list[_Backup]:
+        referenced = self._undo_manager.referenced_backups()
+        scanner = DiskUsageScanner(self._logger, workers=self.workers)
+        backups = []
+        for location in self._undo_manager.backup_locations():
+            try:
+                entries = list(os.scandir(location))
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                self._logger.warning(f"Cannot scan backup location {location}: {e}")
+                continue
+            for entry in entries:
+                path = Path(entry.path)
+                try:
+                    usage = scanner.scan(path, use_cache=False)
+                    created = entry.stat(follow_symlinks=False).st_ctime
+                except OSError as e:
+                    self._logger.warning(f"Cannot measure backup {path}: {e}")
+                    continue
+                if path in referenced:
+                    created = referenced[path].timestamp()
+                backups.append(_Backup(path, usage.allocated_size, created, path in referenced))
+        return backups
+
+    def _remove(self, path: Path) -> bool:
+        try:
+            if stat.S_ISDIR(path.lstat().st_mode):
+                ParallelRemover(self._logger, workers=self.workers).remove(path)
+            else:
+                path.unlink()
+        except OSError as e:
+            self._logger.warning(f"Cannot purge backup {path}: {e}")
+            return False
+        self._logger.info(f"Purged backup {path}")
+        return True
+
+
+def auto_gc_enabled() -> bool:
+    return os.environ.get(AUTO_GC_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def spawn_background_purge(
+    logger: Logger,
+    stamp_file: Path | None = None,
+    interval: float = GC_INTERVAL_SECONDS,
+) -> bool:
+    if not auto_gc_enabled():
+        return False
+    stamp_file = stamp_file or Path.home() / ".console_app_gc_stamp"
+    try:
+        if time.time() - stamp_file.stat().st_mtime < interval:
+            return False
+    except FileNotFoundError:
+        pass
+    try:
+        stamp_file.touch()
+        options = {"start_new_session": True} if os.name == "posix" else {
+            "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        }
+        project_root = str(Path(__file__).resolve().parents[2])
+        python_path = os.pathsep.join(filter(None, [project_root, os.environ.get("PYTHONPATH")]))
+        subprocess.Popen(
+            [sys.executable, "-m", "src.main", "gc", "--background"],
+            env={**os.environ, "PYTHONPATH": python_path},
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **options,
+        )
+    except OSError as e:
+        logger.warning(f"Failed to start background backup purge: {e}")
+        return False
+    logger.info("Started background backup purge")
+    return True
@@ -1,15 +1,62 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
 from os import PathLike
 from pathlib import Path
-from typing import Literal
+from typing import BinaryIO, Literal
 
 from src.enums.file_mode import FileReadMode
 from src.enums.list_mode import ListMode
+from src.enums.reflink_mode import ReflinkMode
+from src.enums.sort_key import SortKey
+from src.services.content_search import GrepMatch
+from src.services.disk_usage import DiskUsage
+from src.services.file_finder import FindQuery
+from src.services.file_mover import MoveResult
+from src.services.file_reader import DEFAULT_CHUNK_SIZE
+from src.services.tree_copier import TreeCopyStats
+from src.services.tree_remover import RemovalStats
+from src.services.word_count import WordCount
+from src.services.zip_writer import ZipStats
 
 
 class OSConsoleServiceBase(ABC):
     @abstractmethod
-    def ls(self, path: PathLike[str] | str, list_mode: ListMode = ListMode.short) -> list[str]: ...
+    def ls(
+        self,
+        path: PathLike[str] | str,
+        list_mode: ListMode = ListMode.short,
+        numeric_ids: bool = False,
+    ) -> list[str]: ...
+
+    @abstractmethod
+    def iter_ls(
+        self,
+        path: PathLike[str] | str,
+        list_mode: ListMode = ListMode.short,
+        numeric_ids: bool = False,
+        chunk_size: int = 0,
+        sort_key: SortKey | None = None,
+        reverse: bool = False,
+        limit: int | None = None,
+        use_cache: bool = True,
+    ) -> Iterator[str]: ...
+
+    @abstractmethod
+    def iter_ls_recursive(
+        self,
+        path: PathLike[str] | str,
+        list_mode: ListMode = ListMode.short,
+        numeric_ids: bool = False,
+        max_depth: int | None = None,
+        workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[str]: ...
+
+    @abstractmethod
+    def du(self, path: PathLike[str] | str, use_cache: bool = True, workers: int = 8) -> DiskUsage: ...
+
+    @abstractmethod
+    def find(self, path: PathLike[str] | str, query: FindQuery, workers: int = 8) -> Iterator[str]: ...
 
     @abstractmethod
     def cat(
@@ -19,7 +66,56 @@ class OSConsoleServiceBase(ABC):
     ) -> str | bytes: ...
 
     @abstractmethod
-    def rm(self, path: PathLike[str] | str, recursive: bool = False) -> None: ...
+    def iter_cat(
+        self,
+        filename: PathLike | str,
+        mode: Literal[FileReadMode.string, FileReadMode.bytes] = FileReadMode.string,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> Iterator[str | bytes]: ...
+
+    @abstractmethod
+    def iter_cat_lines(
+        self,
+        filename: PathLike | str,
+        first: int,
+        last: int | None = None,
+        mode: Literal[FileReadMode.string, FileReadMode.bytes] = FileReadMode.string,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str | bytes]: ...
+
+    @abstractmethod
+    def cat_into(self, filename: PathLike | str, output: BinaryIO) -> int: ...
+
+    @abstractmethod
+    def head(self, filename: PathLike | str, lines: int = 10) -> Iterator[bytes]: ...
+
+    @abstractmethod
+    def tail(self, filename: PathLike | str, lines: int = 10, follow: bool = False) -> Iterator[bytes]: ...
+
+    @abstractmethod
+    def wc(
+        self,
+        paths: list[PathLike | str],
+        workers: int | None = None,
+        count_words: bool = True,
+    ) -> Iterator[WordCount]: ...
+
+    @abstractmethod
+    def grep(
+        self,
+        path: PathLike[str] | str,
+        pattern: str,
+        recursive: bool = False,
+        ignore_case: bool = False,
+        workers: int | None = None,
+    ) -> Iterator[GrepMatch]: ...
+
+    @abstractmethod
+    def validate_rm(self, path: PathLike[str] | str, recursive: bool = False) -> Path: ...
+
+    @abstractmethod
+    def rm(self, path: PathLike[str] | str, recursive: bool = False, workers: int = 8) -> RemovalStats: ...
 
     @abstractmethod
     def cd(self, path: PathLike[str] | str) -> Path: ...
@@ -31,13 +127,35 @@ class OSConsoleServiceBase(ABC):
     def touch(self, path: PathLike[str] | str) -> None: ...
     
     @abstractmethod
-    def mv(self, source: PathLike[str] | str, destination: PathLike[str] | str) -> None: ...
+    def mv(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        workers: int = 8,
+        progress: Callable[[int], None] | None = None,
+    ) -> MoveResult: ...
     
     @abstractmethod
-    def cp(self, source: PathLike[str] | str, destination: PathLike[str] | str, recursive: bool = False) -> None: ...
+    def cp(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        recursive: bool = False,
+        reflink: ReflinkMode = ReflinkMode.auto,
+        workers: int = 8,
+        update: bool = False,
+        checksum: bool = False,
+        delete: bool = False,
+        resume: bool = False,
+    ) -> TreeCopyStats: ...
 
     @abstractmethod
-    def zip(self, source: PathLike[str] | str, destination: PathLike[str] | str) -> None: ...
+    def zip(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        workers: int | None = None,
+    ) -> ZipStats: ...
 
     @abstractmethod
     def unzip(self, archive: PathLike[str] | str, destination: PathLike[str] | str | None = None) -> None: ...
@@ -0,0 +1,195 @@
+import logging
+import multiprocessing
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from logging import Logger
+from os import PathLike
+
+from src.services.file_reader import DEFAULT_CHUNK_SIZE, FileReader
+from src.services.tree_walker import ParallelTreeWalker
+
+BINARY_SAMPLE_SIZE = 8192
+MATCH_BATCH_SIZE = 10_000
+SEARCH_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GrepMatch:
+    path: str
+    line_number: int
+    line: bytes
+
+
+@dataclass
+class SearchBatch:
+    matches: list[tuple[int, bytes]]
+    resume_offset: int | None = None
+    resume_line: int = 1
+
+
+@lru_cache(maxsize=16)
+def compile_pattern(pattern: bytes, ignore_case: bool) -> re.Pattern[bytes]:
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    return re.compile(pattern, flags)
+
+
+def looks_binary(sample: bytes) -> bool:
+    return b"\0" in sample
+
+
+def _search_lines(
+    regex: re.Pattern[bytes],
+    region: bytes,
+    offset: int,
+    line_number: int,
+    batch: SearchBatch,
+    max_matches: int,
+) -> int | None:
+    counted_to = 0
+    next_line_start = 0
+    end = len(region) - 1 if region.endswith(b"\n") else len(region)
+    for match in regex.finditer(region):
+        if match.start() > end:
+            break
+        if match.start() < next_line_start:
+            continue
+        line_start = region.rfind(b"\n", 0, match.start()) + 1
+        line_end = region.find(b"\n", match.start())
+        if line_end == -1:
+            line_end = len(region)
+        line_number += region.count(b"\n", counted_to, line_start)
+        counted_to = line_start
+        if len(batch.matches) >= max_matches:
+            batch.resume_offset = offset + line_start
+            batch.resume_line = line_number
+            return None
+        batch.matches.append((line_number, region[line_start:line_end]))
+        next_line_start = line_end + 1
+    return line_number + region.count(b"\n", counted_to)
+
+
+def search_file(
+    path: str,
+    pattern: bytes,
+    ignore_case: bool = False,
+    start: int = 0,
+    line_number: int = 1,
+    max_matches: int = MATCH_BATCH_SIZE,
+) -> SearchBatch:
+    regex = compile_pattern(pattern, ignore_case)
+    batch = SearchBatch(matches=[])
+    offset = start
+    carry = b""
+    for chunk in FileReader(_logger, chunk_size=SEARCH_CHUNK_SIZE).iter_bytes(path, start):
+        if offset == 0 and not carry and looks_binary(chunk[:BINARY_SAMPLE_SIZE]):
+            return batch
+        buffer = carry + chunk
+        cut = buffer.rfind(b"\n") + 1
+        carry = buffer[cut:]
+        if not cut:
+            continue
+        line_number = _search_lines(regex, buffer[:cut], offset, line_number, batch, max_matches)
+        if line_number is None:
+            return batch
+        offset += cut
+    if carry:
+        _search_lines(regex, carry, offset, line_number, batch, max_matches)
+    return batch
+
+
+def _search_file_safely(
+    path: str,
+    pattern: bytes,
+    ignore_case: bool,
+    start: int = 0,
+    line_number: int = 1,
+) -> tuple[str, SearchBatch, str | None]:
+    try:
+        return path, search_file(path, pattern, ignore_case, start, line_number, MATCH_BATCH_SIZE), None
+    except (OSError, ValueError) as e:
+        return path, SearchBatch(matches=[]), str(e)
+
+
+class ContentSearcher:
+
+    def __init__(self, logger: Logger, workers: int | None = None):
+        self._logger = logger
+        self.workers = max(1, workers or os.cpu_count() or 1)
+
+    def search(
+        self,
+        path: PathLike[str] | str,
+        pattern: str,
+        recursive: bool = False,
+        ignore_case: bool = False,
+    ) -> Iterator[GrepMatch]:
+        pattern_bytes = os.fsencode(pattern)
+        try:
+            compile_pattern(pattern_bytes, ignore_case)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern {pattern!r}: {e}") from e
+        path = os.fspath(path)
+        if not recursive:
+            return self._search_serial([path], pattern_bytes, ignore_case)
+        files = self._iter_files(path)
+        if self.workers == 1:
+            return self._search_serial(files, pattern_bytes, ignore_case)
+        return self._search_parallel(files, pattern_bytes, ignore_case)
+
+    def _iter_files(self, root: str) -> Iterator[str]:
+        walker = ParallelTreeWalker(self._logger)
+        for scan in walker.walk(root, ordered=True):
+            for entry in scan.entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry.path
+                except OSError:
+                    continue
+
+    def _emit(
+        self,
+        result: tuple[str, SearchBatch, str | None],
+        resume: Callable[[str, int, int], tuple[str, SearchBatch, str | None]],
+    ) -> Iterator[GrepMatch]:
+        while True:
+            path, batch, error = result
+            if error is not None:
+                self._logger.warning(f"Cannot search {path}: {error}")
+                return
+            for line_number, line in batch.matches:
+                yield GrepMatch(path=path, line_number=line_number, line=line)
+            if batch.resume_offset is None:
+                return
+            result = resume(path, batch.resume_offset, batch.resume_line)
+
+    def _search_serial(self, files: Iterable[str], pattern: bytes, ignore_case: bool) -> Iterator[GrepMatch]:
+        def resume(path: str, start: int, line_number: int) -> tuple[str, SearchBatch, str | None]:
+            return _search_file_safely(path, pattern, ignore_case, start, line_number)
+
+        for path in files:
+            yield from self._emit(_search_file_safely(path, pattern, ignore_case), resume)
+
+    def _search_parallel(self, files: Iterable[str], pattern: bytes, ignore_case: bool) -> Iterator[GrepMatch]:
+        in_flight_limit = self.workers * 4
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            def resume(path: str, start: int, line_number: int) -> tuple[str, SearchBatch, str | None]:
+                return pool.submit(_search_file_safely, path, pattern, ignore_case, start, line_number).result()
+
+            pending: set[Future] = set()
+            for path in files:
+                pending.add(pool.submit(_search_file_safely, path, pattern, ignore_case))
+                if len(pending) < in_flight_limit:
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from self._emit(future.result(), resume)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from self._emit(future.result(), resume)
@@ -0,0 +1,194 @@
+import heapq
+import os
+import stat
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from itertools import batched
+from logging import Logger
+from os import PathLike
+
+from src.enums.sort_key import SortKey
+from src.services.tree_walker import DirectoryScan
+
+try:
+    import grp
+    import pwd
+except ImportError:
+    grp = None
+    pwd = None
+
+
+@cache
+def lookup_owner_name(uid: int) -> str:
+    if pwd is None:
+        return str(uid)
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@cache
+def lookup_group_name(gid: int) -> str:
+    if grp is None:
+        return str(gid)
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+@dataclass
+class ListingEntry:
+    name: str
+    path: str
+    stat: os.stat_result | None = None
+    link_target: str | None = None
+
+
+class DirectoryLister:
+
+    def __init__(self, logger: Logger):
+        self._logger = logger
+
+    def scan(self, path: PathLike[str] | str, with_stat: bool = False) -> Iterator[ListingEntry]:
+        with os.scandir(path) as it:
+            for entry in it:
+                yield self.make_entry(entry, with_stat=with_stat)
+
+    def make_entry(self, entry: os.DirEntry, with_stat: bool = False) -> ListingEntry:
+        if not with_stat:
+            return ListingEntry(name=entry.name, path=entry.path)
+        try:
+            entry_stat = entry.stat(follow_symlinks=False)
+        except OSError as e:
+            self._logger.warning(f"Failed to stat {entry.path}: {e}")
+            return ListingEntry(name=entry.name, path=entry.path)
+        link_target = None
+        if stat.S_ISLNK(entry_stat.st_mode):
+            try:
+                link_target = os.readlink(entry.path)
+            except OSError:
+                pass
+        return ListingEntry(name=entry.name, path=entry.path, stat=entry_stat, link_target=link_target)
+
+    def select(
+        self,
+        entries: Iterable[ListingEntry],
+        sort_key: SortKey = SortKey.name,
+        reverse: bool = False,
+        limit: int | None = None,
+    ) -> list[ListingEntry]:
+        match sort_key:
+            case SortKey.size:
+                key = lambda e: (-e.stat.st_size if e.stat else 0, e.name)
+            case SortKey.mtime:
+                key = lambda e: (-e.stat.st_mtime if e.stat else 0, e.name)
+            case _:
+                key = lambda e: e.name
+        if limit is None:
+            return sorted(entries, key=key, reverse=reverse)
+        if reverse:
+            return heapq.nlargest(limit, entries, key=key)
+        return heapq.nsmallest(limit, entries, key=key)
+
+    def format_permissions(self, file_stat: os.stat_result) -> str:
+        mode = file_stat.st_mode
+        perms = []
+        perms.append('d' if stat.S_ISDIR(mode) else '-')
+        perms.append('r' if mode & stat.S_IRUSR else '-')
+        perms.append('w' if mode & stat.S_IWUSR else '-')
+        perms.append('x' if mode & stat.S_IXUSR else '-')
+        perms.append('r' if mode & stat.S_IRGRP else '-')
+        perms.append('w' if mode & stat.S_IWGRP else '-')
+        perms.append('x' if mode & stat.S_IXGRP else '-')
+        perms.append('r' if mode & stat.S_IROTH else '-')
+        perms.append('w' if mode & stat.S_IWOTH else '-')
+        perms.append('x' if mode & stat.S_IXOTH else '-')
+        return ''.join(perms)
+
+    def _format_date(self, timestamp: float, now: datetime) -> str:
+        mtime = datetime.fromtimestamp(timestamp)
+        if (now - mtime).days > 365:
+            return mtime.strftime('%b %d  %Y')
+        return mtime.strftime('%b %d %H:%M')
+
+    def format_long(self, entries: list[ListingEntry], numeric_ids: bool = False) -> list[str]:
+        if not entries:
+            return []
+
+        owner_name = str if numeric_ids else lookup_owner_name
+        group_name = str if numeric_ids else lookup_group_name
+        now = datetime.now()
+        file_info = []
+        for entry in entries:
+            entry_stat = entry.stat
+            if entry_stat is None:
+                file_info.append({
+                    'permissions': '-',
+                    'nlinks': 1,
+                    'owner': '-',
+                    'group': '-',
+                    'size': 0,
+                    'date': '-',
+                    'name': entry.name
+                })
+                continue
+            name = entry.name
+            if entry.link_target is not None:
+                name = f"{name} -> {entry.link_target}"
+            file_info.append({
+                'permissions': self.format_permissions(entry_stat),
+                'nlinks': entry_stat.st_nlink,
+                'owner': owner_name(entry_stat.st_uid),
+                'group': group_name(entry_stat.st_gid),
+                'size': entry_stat.st_size,
+                'date': self._format_date(entry_stat.st_mtime, now),
+                'name': name
+            })
+
+        max_owner_width = max(len(info['owner']) for info in file_info)
+        max_links_width = max(len(str(info['nlinks'])) for info in file_info)
+        max_size_width = max(len(str(info['size'])) for info in file_info)
+
+        result = []
+        for info in file_info:
+            line = f"{info['permissions']} {info['nlinks']:{max_links_width}d} {info['owner']:<{max_owner_width}} {info['group']}  {info['size']:>{max_size_width}} {info['date']} {info['name']}"
+            result.append(line)
+
+        return result
+
+    def iter_long_lines(
+        self,
+        entries: Iterable[ListingEntry],
+        numeric_ids: bool = False,
+        chunk_size: int = 0,
+    ) -> Iterator[str]:
+        if chunk_size <= 0:
+            yield from self.format_long(list(entries), numeric_ids=numeric_ids)
+            return
+        for chunk in batched(entries, chunk_size, strict=False):
+            yield from self.format_long(list(chunk), numeric_ids=numeric_ids)
+
+    def iter_tree_lines(
+        self,
+        scans: Iterable[DirectoryScan],
+        long: bool = False,
+        numeric_ids: bool = False,
+    ) -> Iterator[str]:
+        for index, scan in enumerate(scans):
+            if index:
+                yield "\n"
+            yield f"{scan.path}:\n"
+            if scan.error is not None:
+                yield f"cannot open directory '{scan.path}': {scan.error.strerror}\n"
+                continue
+            if long:
+                entries = [self.make_entry(entry, with_stat=True) for entry in scan.entries]
+                for line in self.format_long(entries, numeric_ids=numeric_ids):
+                    yield line + "\n"
+            else:
+                for entry in scan.entries:
+                    yield entry.name + "\n"
@@ -0,0 +1,186 @@
+import json
+import os
+import stat
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+from pathlib import Path
+
+
+@dataclass
+class DiskUsage:
+    path: str
+    apparent_size: int = 0
+    allocated_size: int = 0
+    files: int = 0
+    directories: int = 0
+    rescanned_directories: int = 0
+
+
+def allocated_size(file_stat: os.stat_result) -> int:
+    blocks = getattr(file_stat, "st_blocks", None)
+    if blocks is None:
+        return file_stat.st_size
+    return blocks * 512
+
+
+class DiskUsageScanner:
+
+    RACY_WINDOW_SECONDS = 2
+
+    def __init__(
+        self,
+        logger: Logger,
+        cache_file: Path | None = None,
+        workers: int = 8,
+        max_entries: int = 100_000,
+    ):
+        self._logger = logger
+        self.cache_file = cache_file or Path.home() / ".console_app_du_cache.json"
+        self.workers = max(1, workers)
+        self.max_entries = max_entries
+
+    def scan(self, path: PathLike[str] | str, use_cache: bool = True) -> DiskUsage:
+        root = os.path.abspath(path)
+        root_stat = os.lstat(root)
+        if not stat.S_ISDIR(root_stat.st_mode):
+            return DiskUsage(
+                path=root,
+                apparent_size=root_stat.st_size,
+                allocated_size=allocated_size(root_stat),
+                files=1,
+            )
+
+        cache = self._load_cache() if use_cache else {}
+        records = self._walk(root, cache)
+
+        usage = DiskUsage(path=root)
+        seen_inodes = set()
+        for record, rescanned in records.values():
+            usage.apparent_size += record["apparent"]
+            usage.allocated_size += record["allocated"]
+            usage.files += record["files"]
+            usage.directories += 1
+            usage.rescanned_directories += rescanned
+            for dev, ino, apparent, allocated in record["hardlinks"]:
+                if (dev, ino) in seen_inodes:
+                    continue
+                seen_inodes.add((dev, ino))
+                usage.apparent_size += apparent
+                usage.allocated_size += allocated
+                usage.files += 1
+
+        if use_cache:
+            self._save_cache(root, cache, records)
+        self._logger.info(
+            f"Scanned {root}: {usage.directories} directories, {usage.rescanned_directories} rescanned"
+        )
+        return usage
+
+    def _walk(self, root: str, cache: dict) -> dict[str, tuple[dict, bool]]:
+        records = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self._scan_directory, root, cache.get(root))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, record, rescanned = future.result()
+                    if record is None:
+                        continue
+                    records[path] = (record, rescanned)
+                    for name in record["subdirs"]:
+                        child = os.path.join(path, name)
+                        pending.add(pool.submit(self._scan_directory, child, cache.get(child)))
+        return records
+
+    def _scan_directory(self, path: str, cached: dict | None) -> tuple[str, dict | None, bool]:
+        try:
+            dir_stat = os.lstat(path)
+        except OSError as e:
+            self._logger.warning(f"Cannot stat directory {path}: {e}")
+            return path, None, False
+        if (
+            cached is not None
+            and cached["mtime_ns"] == dir_stat.st_mtime_ns
+            and cached["ino"] == dir_stat.st_ino
+            and cached["dev"] == dir_stat.st_dev
+        ):
+            return path, cached, False
+
+        record = {
+            "mtime_ns": dir_stat.st_mtime_ns,
+            "ino": dir_stat.st_ino,
+            "dev": dir_stat.st_dev,
+            "cacheable": time.time() - dir_stat.st_mtime >= self.RACY_WINDOW_SECONDS,
+            "apparent": dir_stat.st_size,
+            "allocated": allocated_size(dir_stat),
+            "files": 0,
+            "subdirs": [],
+            "hardlinks": [],
+        }
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            record["subdirs"].append(entry.name)
+                            continue
+                        entry_stat = entry.stat(follow_symlinks=False)
+                    except OSError as e:
+                        self._logger.warning(f"Cannot stat {entry.path}: {e}")
+                        continue
+                    if entry_stat.st_nlink > 1:
+                        record["hardlinks"].append([
+                            entry_stat.st_dev,
+                            entry_stat.st_ino,
+                            entry_stat.st_size,
+                            allocated_size(entry_stat),
+                        ])
+                        continue
+                    record["apparent"] += entry_stat.st_size
+                    record["allocated"] += allocated_size(entry_stat)
+                    record["files"] += 1
+        except OSError as e:
+            self._logger.warning(f"Cannot open directory {path}: {e}")
+            record["cacheable"] = False
+        return path, record, True
+
+    def _load_cache(self) -> dict:
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f).get('directories', {})
+        except Exception as e:
+            self._logger.error(f"Failed to load du cache: {e}")
+            return {}
+
+    def _save_cache(self, root: str, cache: dict, records: dict[str, tuple[dict, bool]]) -> None:
+        prefix = os.path.join(root, "")
+        directories = {
+            path: record for path, record in cache.items()
+            if path != root and not path.startswith(prefix)
+        }
+        used = time.time()
+        for path, (record, _) in records.items():
+            if record.get("cacheable", True):
+                record["used"] = used
+                directories[path] = record
+        self._evict(directories)
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({"directories": directories}, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            self._logger.error(f"Failed to save du cache: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def _evict(self, directories: dict[str, dict]) -> None:
+        if len(directories) <= self.max_entries:
+            return
+        by_use = sorted(directories, key=lambda path: directories[path].get("used", 0))
+        for path in by_use[:len(directories) - self.max_entries]:
+            del directories[path]
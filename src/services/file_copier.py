@@ -0,0 +1,168 @@
+import errno
+import os
+import shutil
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+
+from src.enums.reflink_mode import ReflinkMode
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+FICLONE = 0x40049409
+KERNEL_COPY_BLOCK_SIZE = 1024 * 1024 * 1024
+USERSPACE_CHUNK_SIZE = 1024 * 1024
+REFLINK_SUPPORTED = sys.platform.startswith("linux") and fcntl is not None
+SENDFILE_COPY_SUPPORTED = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+SPARSE_COPY_SUPPORTED = hasattr(os, "SEEK_DATA") and hasattr(os, "SEEK_HOLE")
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP}
+
+
+@dataclass
+class CopyResult:
+    source: str
+    destination: str
+    size: int
+    method: str
+
+
+class FileCopier:
+
+    def __init__(self, logger: Logger, reflink: ReflinkMode = ReflinkMode.auto):
+        self._logger = logger
+        self.reflink = reflink
+
+    def copy_file(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        progress: Callable[[int], None] | None = None,
+    ) -> CopyResult:
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source} and {destination} are the same file")
+        with open(source, 'rb') as src:
+            size = os.fstat(src.fileno()).st_size
+            with open(destination, 'wb') as dst:
+                method = self._copy_data(src.fileno(), dst.fileno(), size, progress)
+        shutil.copystat(source, destination)
+        return CopyResult(source=os.fspath(source), destination=os.fspath(destination), size=size, method=method)
+
+    def _copy_data(self, src_fd: int, dst_fd: int, size: int, progress: Callable[[int], None] | None = None) -> str:
+        if self.reflink != ReflinkMode.never:
+            if self._reflink(src_fd, dst_fd):
+                if progress is not None:
+                    progress(size)
+                return "reflink"
+        if size == 0:
+            self._copy_userspace(src_fd, dst_fd, progress)
+            return "userspace"
+        if SPARSE_COPY_SUPPORTED and self._is_sparse(src_fd) and self._copy_sparse(src_fd, dst_fd, size, progress):
+            return "sparse"
+        if hasattr(os, "copy_file_range") and self._copy_kernel(os.copy_file_range, src_fd, dst_fd, progress):
+            return "copy_file_range"
+        if SENDFILE_COPY_SUPPORTED and self._copy_kernel(self._sendfile, src_fd, dst_fd, progress):
+            return "sendfile"
+        self._copy_userspace(src_fd, dst_fd, progress)
+        return "userspace"
+
+    def _reflink(self, src_fd: int, dst_fd: int) -> bool:
+        if not REFLINK_SUPPORTED:
+            if self.reflink == ReflinkMode.always:
+                raise OSError(errno.EOPNOTSUPP, "Reflink copies are not supported on this platform")
+            return False
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        except OSError as e:
+            if self.reflink == ReflinkMode.always:
+                raise OSError(e.errno, f"Reflink copy failed: {e.strerror}") from e
+            return False
+        return True
+
+    def _is_sparse(self, fd: int) -> bool:
+        fd_stat = os.fstat(fd)
+        return getattr(fd_stat, "st_blocks", fd_stat.st_size) * 512 < fd_stat.st_size
+
+    def _copy_sparse(
+        self,
+        src_fd: int,
+        dst_fd: int,
+        size: int,
+        progress: Callable[[int], None] | None = None,
+    ) -> bool:
+        offset = 0
+        while offset < size:
+            try:
+                data = os.lseek(src_fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    break
+                if offset == 0 and e.errno in _FALLBACK_ERRNOS:
+                    return False
+                raise
+            hole = os.lseek(src_fd, data, os.SEEK_HOLE)
+            self._copy_range(src_fd, dst_fd, data, hole)
+            offset = hole
+            if progress is not None:
+                progress(min(offset, size))
+        os.ftruncate(dst_fd, size)
+        if progress is not None:
+            progress(size)
+        return True
+
+    def _copy_range(self, src_fd: int, dst_fd: int, offset: int, end: int) -> None:
+        kernel_copy = hasattr(os, "copy_file_range")
+        while offset < end:
+            count = min(end - offset, KERNEL_COPY_BLOCK_SIZE)
+            if kernel_copy:
+                try:
+                    copied = os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+                except OSError as e:
+                    if e.errno not in _FALLBACK_ERRNOS:
+                        raise
+                    kernel_copy = False
+                    continue
+            else:
+                chunk = os.pread(src_fd, min(count, USERSPACE_CHUNK_SIZE), offset)
+                view = memoryview(chunk)
+                position = offset
+                while view:
+                    written = os.pwrite(dst_fd, view, position)
+                    view = view[written:]
+                    position += written
+                copied = len(chunk)
+            if copied == 0:
+                return
+            offset += copied
+
+    def _sendfile(self, src_fd: int, dst_fd: int, count: int) -> int:
+        return os.sendfile(dst_fd, src_fd, None, count)
+
+    def _copy_kernel(self, copy, src_fd: int, dst_fd: int, progress: Callable[[int], None] | None = None) -> bool:
+        offset = 0
+        while True:
+            try:
+                copied = copy(src_fd, dst_fd, KERNEL_COPY_BLOCK_SIZE)
+            except OSError as e:
+                if offset == 0 and e.errno in _FALLBACK_ERRNOS:
+                    return False
+                raise
+            if copied == 0:
+                return True
+            offset += copied
+            if progress is not None:
+                progress(offset)
+
+    def _copy_userspace(self, src_fd: int, dst_fd: int, progress: Callable[[int], None] | None = None) -> None:
+        offset = 0
+        while chunk := os.read(src_fd, USERSPACE_CHUNK_SIZE):
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(dst_fd, view):]
+            offset += len(chunk)
+            if progress is not None:
+                progress(offset)
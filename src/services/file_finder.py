@@ -0,0 +1,160 @@
+import fnmatch
+import os
+import re
+import stat
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from logging import Logger
+from os import PathLike
+
+from src.enums.entry_type import EntryType
+from src.services.tree_walker import ParallelTreeWalker
+
+SIZE_UNITS = {"": 1, "c": 1, "k": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@dataclass
+class FindQuery:
+    name: str | None = None
+    regex: str | None = None
+    entry_type: EntryType | None = None
+    size: str | None = None
+    mtime: str | None = None
+    max_depth: int | None = None
+    prune: list[str] = field(default_factory=list)
+
+
+class _RootEntry:
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = os.path.basename(path.rstrip(os.sep)) or path
+        self._stat = os.lstat(path)
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        return self._stat
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return os.path.isdir(self.path) if follow_symlinks else stat.S_ISDIR(self._stat.st_mode)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return os.path.isfile(self.path) if follow_symlinks else stat.S_ISREG(self._stat.st_mode)
+
+    def is_symlink(self) -> bool:
+        return stat.S_ISLNK(self._stat.st_mode)
+
+
+def split_numeric_filter(spec: str, units: dict[str, int]) -> tuple[str, int, int]:
+    match = re.fullmatch(r"([+-]?)(\d+)([a-zA-Z]?)", spec)
+    if match is None or match.group(3) not in units:
+        raise ValueError(f"Invalid filter value: {spec}")
+    sign, number, unit = match.groups()
+    return sign, int(number), units[unit]
+
+
+def parse_numeric_filter(spec: str, units: dict[str, int]) -> tuple[str, int]:
+    sign, number, unit = split_numeric_filter(spec, units)
+    return sign, number * unit
+
+
+def size_in_units(size: int, unit: int) -> int:
+    return -(-size // unit)
+
+
+def _compare(sign: str, value: int, limit: int) -> bool:
+    if sign == "+":
+        return value > limit
+    if sign == "-":
+        return value < limit
+    return value == limit
+
+
+class FileFinder:
+
+    def __init__(self, logger: Logger, workers: int = 8):
+        self._logger = logger
+        self._walker = ParallelTreeWalker(logger, workers=workers)
+
+    def find(self, root: PathLike[str] | str, query: FindQuery) -> Iterator[str]:
+        matches = self._compile(query)
+        root_entry = _RootEntry(os.fspath(root))
+        return self._iter_matches(root_entry, query, matches)
+
+    def _iter_matches(
+        self,
+        root_entry: _RootEntry,
+        query: FindQuery,
+        matches: list[Callable[[os.DirEntry], bool]],
+    ) -> Iterator[str]:
+        root = root_entry.path
+        if self._matches(root_entry, matches):
+            yield root
+        if query.max_depth == 0 or not root_entry.is_dir(follow_symlinks=False):
+            return
+
+        should_descend = None
+        if query.prune:
+            should_descend = lambda entry: not self._is_pruned(entry, query.prune)
+        max_depth = None if query.max_depth is None else query.max_depth - 1
+        with_stat = query.size is not None or query.mtime is not None
+        scans = self._walker.walk(
+            root, max_depth=max_depth, ordered=False, with_stat=with_stat, should_descend=should_descend
+        )
+        for scan in scans:
+            for entry in scan.entries:
+                if query.prune and self._is_pruned(entry, query.prune):
+                    continue
+                if self._matches(entry, matches):
+                    yield entry.path
+
+    def _is_pruned(self, entry: os.DirEntry, patterns: list[str]) -> bool:
+        try:
+            if not entry.is_dir(follow_symlinks=False):
+                return False
+        except OSError:
+            return False
+        return any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in patterns)
+
+    def _matches(self, entry: os.DirEntry, matches: list[Callable[[os.DirEntry], bool]]) -> bool:
+        try:
+            return all(match(entry) for match in matches)
+        except OSError as e:
+            self._logger.warning(f"Cannot stat {entry.path}: {e}")
+            return False
+
+    def _compile(self, query: FindQuery) -> list[Callable[[os.DirEntry], bool]]:
+        matches = []
+        if query.name is not None:
+            pattern = query.name
+            matches.append(lambda entry: fnmatch.fnmatchcase(entry.name, pattern))
+        if query.regex is not None:
+            try:
+                regex = re.compile(query.regex)
+            except re.error as e:
+                raise ValueError(f"Invalid regex {query.regex!r}: {e}") from e
+            matches.append(lambda entry: regex.fullmatch(entry.path) is not None)
+        if query.entry_type is not None:
+            matches.append(self._type_matcher(query.entry_type))
+        if query.size is not None:
+            sign, limit, unit = split_numeric_filter(query.size, SIZE_UNITS)
+            matches.append(lambda entry: _compare(
+                sign, size_in_units(entry.stat(follow_symlinks=False).st_size, unit), limit
+            ))
+        if query.mtime is not None:
+            sign, days = parse_numeric_filter(query.mtime, {"": 1})
+            now = time.time()
+            matches.append(lambda entry: _compare(
+                sign, int((now - entry.stat(follow_symlinks=False).st_mtime) // SECONDS_PER_DAY), days
+            ))
+        return matches
+
+    def _type_matcher(self, entry_type: EntryType) -> Callable[[os.DirEntry], bool]:
+        match entry_type:
+            case EntryType.directory:
+                return lambda entry: entry.is_dir(follow_symlinks=False)
+            case EntryType.symlink:
+                return lambda entry: entry.is_symlink()
+            case _:
+                return lambda entry: entry.is_file(follow_symlinks=False)
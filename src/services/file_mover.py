@@ -0,0 +1,130 @@
+import errno
+import os
+import stat
+from collections.abc import Callable
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+
+from src.enums.reflink_mode import ReflinkMode
+from src.services.file_copier import FileCopier
+from src.services.tree_copier import ParallelTreeCopier
+from src.services.tree_remover import ParallelRemover
+
+
+@dataclass
+class MoveResult:
+    source: str
+    destination: str
+    method: str
+    files: int = 0
+    size: int = 0
+
+
+class MoveInterrupted(KeyboardInterrupt):
+
+    def __init__(self, phase: str, source: str, destination: str):
+        super().__init__(phase, source, destination)
+        self.phase = phase
+        self.source = source
+        self.destination = destination
+
+
+class FileMover:
+
+    COPY_PHASE = "copy"
+    REMOVE_PHASE = "remove"
+
+    def __init__(self, logger: Logger, workers: int = 8, reflink: ReflinkMode = ReflinkMode.auto):
+        self._logger = logger
+        self.workers = max(1, workers)
+        self.reflink = reflink
+
+    def move(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        progress: Callable[[int], None] | None = None,
+    ) -> MoveResult:
+        source = os.fspath(source)
+        destination = os.fspath(destination)
+        try:
+            os.rename(source, destination)
+            return MoveResult(source=source, destination=destination, method="rename")
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        self._logger.info(f"{source} and {destination} are on different filesystems, copying")
+        staging = os.path.join(
+            os.path.dirname(os.path.abspath(destination)),
+            f".{os.path.basename(destination)}.{os.getpid()}.mvtmp",
+        )
+        source_stat = os.lstat(source)
+        try:
+            result = self._copy(source, staging, source_stat, progress)
+            self._verify(staging, source_stat, result)
+            os.replace(staging, destination)
+        except BaseException as e:
+            self._logger.warning(f"Move of {source} did not complete, removing partial copy {staging}")
+            try:
+                self._remove(staging)
+            except OSError as cleanup_error:
+                self._logger.error(f"Cannot remove partial copy {staging}: {cleanup_error}")
+            if isinstance(e, KeyboardInterrupt):
+                raise MoveInterrupted(self.COPY_PHASE, source, destination) from e
+            raise
+        try:
+            self._remove(source)
+        except OSError as e:
+            raise OSError(e.errno, f"Copied to {destination} but could not remove source: {e.strerror}", source) from e
+        except KeyboardInterrupt as e:
+            self._logger.warning(f"Move of {source} interrupted after copying to {destination}, source partially removed")
+            raise MoveInterrupted(self.REMOVE_PHASE, source, destination) from e
+        self._logger.info(f"Moved {source} -> {destination} across filesystems ({result.size} bytes)")
+        return MoveResult(
+            source=source,
+            destination=destination,
+            method="copy",
+            files=result.files,
+            size=result.size,
+        )
+
+    def _copy(
+        self,
+        source: str,
+        staging: str,
+        source_stat: os.stat_result,
+        progress: Callable[[int], None] | None,
+    ) -> MoveResult:
+        copier = FileCopier(self._logger, reflink=self.reflink)
+        if stat.S_ISLNK(source_stat.st_mode):
+            os.symlink(os.readlink(source), staging)
+            return MoveResult(source=source, destination=staging, method="copy", files=1)
+        if stat.S_ISDIR(source_stat.st_mode):
+            stats = ParallelTreeCopier(self._logger, copier, workers=self.workers).copy(
+                source, staging, progress=progress
+            )
+            return MoveResult(source=source, destination=staging, method="copy", files=stats.files, size=stats.size)
+        copied = copier.copy_file(source, staging, progress=progress)
+        return MoveResult(source=source, destination=staging, method="copy", files=1, size=copied.size)
+
+    def _verify(self, staging: str, source_stat: os.stat_result, result: MoveResult) -> None:
+        if not stat.S_ISREG(source_stat.st_mode):
+            return
+        staged_size = os.stat(staging).st_size
+        if staged_size != source_stat.st_size or result.size != source_stat.st_size:
+            raise OSError(
+                errno.EIO,
+                f"Copy is incomplete: {staged_size} of {source_stat.st_size} bytes",
+                staging,
+            )
+
+    def _remove(self, path: str) -> None:
+        try:
+            path_stat = os.lstat(path)
+        except FileNotFoundError:
+            return
+        if stat.S_ISDIR(path_stat.st_mode):
+            ParallelRemover(self._logger, workers=self.workers).remove(path)
+        else:
+            os.unlink(path)
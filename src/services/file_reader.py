@@ -0,0 +1,132 @@
+import bz2
+import codecs
+import errno
+import gzip
+import io
+import lzma
+import os
+import sys
+from collections.abc import Iterator
+from logging import Logger
+from os import PathLike
+from typing import BinaryIO
+
+from src.enums.file_mode import FileReadMode
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+SENDFILE_BLOCK_SIZE = 64 * 1024 * 1024
+ZERO_COPY_SUPPORTED = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+
+
+def open_decompressed(path: PathLike[str] | str) -> BinaryIO:
+    with open(path, 'rb') as f:
+        header = f.read(6)
+    for magic, opener in COMPRESSION_MAGIC:
+        if header.startswith(magic):
+            return opener(path, 'rb')
+    return open(path, 'rb')
+
+
+class FileReader:
+
+    def __init__(self, logger: Logger, chunk_size: int = DEFAULT_CHUNK_SIZE, decompress: bool = False):
+        self._logger = logger
+        self.chunk_size = chunk_size
+        self.decompress = decompress
+
+    def iter_bytes(self, path: PathLike[str] | str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        with self._open(path) as f:
+            if start:
+                f.seek(start)
+            remaining = end - start if end is not None else None
+            while remaining is None or remaining > 0:
+                size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                try:
+                    chunk = f.read(size)
+                except (EOFError, lzma.LZMAError) as e:
+                    raise ValueError(f"Cannot decompress {path}: {e}") from e
+                if not chunk:
+                    return
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def iter_text(
+        self,
+        path: PathLike[str] | str,
+        encoding: str = "utf-8",
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        for chunk in self.iter_bytes(path, start, end):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def iter_chunks(
+        self,
+        path: PathLike[str] | str,
+        mode: FileReadMode = FileReadMode.string,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[str | bytes]:
+        if mode == FileReadMode.bytes:
+            return self.iter_bytes(path, start, end)
+        return self.iter_text(path, start=start, end=end)
+
+    def _open(self, path: PathLike[str] | str) -> BinaryIO:
+        if self.decompress:
+            return open_decompressed(path)
+        return open(path, 'rb')
+
+    def copy_into(self, path: PathLike[str] | str, output: BinaryIO) -> int:
+        out_fd = self._zero_copy_fd(output)
+        with open(path, 'rb') as f:
+            if out_fd is not None:
+                output.flush()
+                copied = self._sendfile(f.fileno(), out_fd)
+                if copied is not None:
+                    return copied
+                self._logger.info(f"sendfile is not supported for this output, copying {path} through userspace")
+            return self._copy_buffered(f, output)
+
+    def _zero_copy_fd(self, output: BinaryIO) -> int | None:
+        if not ZERO_COPY_SUPPORTED:
+            return None
+        try:
+            out_fd = output.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+        if os.isatty(out_fd):
+            return None
+        return out_fd
+
+    def _sendfile(self, in_fd: int, out_fd: int) -> int | None:
+        offset = 0
+        while True:
+            try:
+                sent = os.sendfile(out_fd, in_fd, offset, SENDFILE_BLOCK_SIZE)
+            except OSError as e:
+                if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EBADF):
+                    return None
+                raise
+            if sent == 0:
+                return offset
+            offset += sent
+
+    def _copy_buffered(self, source: BinaryIO, output: BinaryIO) -> int:
+        copied = 0
+        while chunk := source.read(self.chunk_size):
+            output.write(chunk)
+            copied += len(chunk)
+        output.flush()
+        return copied
@@ -0,0 +1,83 @@
+import os
+from collections.abc import Iterator
+from logging import Logger
+from os import PathLike
+from typing import BinaryIO
+
+from src.services.file_watcher import create_watcher
+
+TAIL_BLOCK_SIZE = 64 * 1024
+FOLLOW_TIMEOUT_SECONDS = 1.0
+
+
+class FileTail:
+
+    def __init__(self, logger: Logger, block_size: int = TAIL_BLOCK_SIZE):
+        self._logger = logger
+        self.block_size = block_size
+
+    def head(self, path: PathLike[str] | str, lines: int = 10) -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            remaining = lines
+            while remaining > 0:
+                block = f.read(self.block_size)
+                if not block:
+                    return
+                count = block.count(b"\n")
+                if count < remaining:
+                    remaining -= count
+                    yield block
+                    continue
+                index = -1
+                for _ in range(remaining):
+                    index = block.index(b"\n", index + 1)
+                yield block[:index + 1]
+                return
+
+    def tail(self, path: PathLike[str] | str, lines: int = 10) -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            f.seek(self.tail_offset(f, lines))
+            yield from self._drain(f)
+
+    def follow(self, path: PathLike[str] | str, lines: int = 10) -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            watcher = create_watcher(path, self._logger)
+            try:
+                f.seek(self.tail_offset(f, lines))
+                yield from self._drain(f)
+                while True:
+                    watcher.wait(FOLLOW_TIMEOUT_SECONDS)
+                    if os.fstat(f.fileno()).st_size < f.tell():
+                        self._logger.info(f"{path} was truncated, following from the start")
+                        f.seek(0)
+                    yield from self._drain(f)
+            finally:
+                watcher.close()
+
+    def tail_offset(self, f: BinaryIO, lines: int) -> int:
+        position = os.fstat(f.fileno()).st_size
+        if lines <= 0:
+            return position
+        needed = lines
+        last_block = True
+        while position > 0:
+            read_size = min(self.block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size)
+            if last_block and block.endswith(b"\n"):
+                block = block[:-1]
+            last_block = False
+            count = block.count(b"\n")
+            if count < needed:
+                needed -= count
+                continue
+            index = len(block)
+            for _ in range(needed):
+                index = block.rindex(b"\n", 0, index)
+            return position + index + 1
+        return 0
+
+    def _drain(self, f: BinaryIO) -> Iterator[bytes]:
+        while chunk := f.read(self.block_size):
+            yield chunk
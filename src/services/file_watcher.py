@@ -0,0 +1,106 @@
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from logging import Logger
+from os import PathLike
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+FOLLOW_MASK = IN_MODIFY | IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyWatcher:
+
+    def __init__(self):
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self._poller = select.poll()
+        self._poller.register(fd, select.POLLIN)
+
+    def add_watch(self, path: PathLike[str] | str, mask: int = FOLLOW_MASK) -> int:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), os.fspath(path))
+        return wd
+
+    def wait(self, timeout: float | None = None) -> list[tuple[int, int]]:
+        if not self._poller.poll(None if timeout is None else int(timeout * 1000)):
+            return []
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += _EVENT_HEADER.size + name_length
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+
+    def add_watch(self, path: PathLike[str] | str, mask: int = FOLLOW_MASK) -> int:
+        return 0
+
+    def wait(self, timeout: float | None = None) -> list[tuple[int, int]]:
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher(path: PathLike[str] | str, logger: Logger) -> InotifyWatcher | PollingWatcher:
+    try:
+        watcher = InotifyWatcher()
+    except OSError as e:
+        logger.info(f"Falling back to polling for {path}: {e}")
+        return PollingWatcher()
+    try:
+        watcher.add_watch(path)
+    except OSError as e:
+        watcher.close()
+        logger.info(f"Falling back to polling for {path}: {e}")
+        return PollingWatcher()
+    return watcher
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+import time
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+from pathlib import Path
+
+CHECKPOINT_INTERVAL = 65536
+COUNT_WINDOW = 64 * 1024
+
+
+@dataclass
+class LineOffsets:
+    size: int
+    mtime_ns: int
+    interval: int
+    lines: int
+    checkpoints: list[int]
+
+
+def parse_line_range(spec: str) -> tuple[int, int | None]:
+    match = re.fullmatch(r"(\d*):(\d*)", spec)
+    if match is None or spec == ":":
+        raise ValueError(f"Invalid line range: {spec}")
+    first = int(match.group(1)) if match.group(1) else 1
+    last = int(match.group(2)) if match.group(2) else None
+    if first < 1 or (last is not None and last < first):
+        raise ValueError(f"Invalid line range: {spec}")
+    return first, last
+
+
+def _skip_lines(mm: mmap.mmap, offset: int, count: int) -> int:
+    end = len(mm)
+    while count > 0 and offset < end:
+        window_end = min(end, offset + COUNT_WINDOW)
+        newlines = mm[offset:window_end].count(b"\n")
+        if newlines < count:
+            count -= newlines
+            offset = window_end
+            continue
+        while count > 0:
+            offset = mm.find(b"\n", offset, window_end) + 1
+            count -= 1
+    return min(offset, end)
+
+
+class LineIndex:
+
+    RACY_WINDOW_SECONDS = 2
+
+    def __init__(
+        self,
+        logger: Logger,
+        cache_dir: Path | None = None,
+        interval: int = CHECKPOINT_INTERVAL,
+        max_entries: int = 512,
+    ):
+        self._logger = logger
+        self.cache_dir = cache_dir or Path.home() / ".console_app_line_index"
+        self.interval = interval
+        self.max_entries = max_entries
+
+    def byte_range(self, path: PathLike[str] | str, first: int, last: int | None = None) -> tuple[int, int]:
+        with open(path, 'rb') as f:
+            file_stat = os.fstat(f.fileno())
+            if file_stat.st_size == 0:
+                return 0, 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                offsets = self._offsets(path, file_stat, mm)
+                checkpoint = min((first - 1) // offsets.interval, len(offsets.checkpoints) - 1)
+                start = _skip_lines(mm, offsets.checkpoints[checkpoint], first - 1 - checkpoint * offsets.interval)
+                if last is None:
+                    return start, len(mm)
+                return start, _skip_lines(mm, start, last - first + 1)
+
+    def _offsets(self, path: PathLike[str] | str, file_stat: os.stat_result, mm: mmap.mmap) -> LineOffsets:
+        cache_file = self._cache_file(path)
+        offsets = self._load(cache_file, file_stat)
+        if offsets is not None:
+            return offsets
+        self._logger.info(f"Building line index for {path}")
+        offsets = self._build(file_stat, mm)
+        self._store(cache_file, path, offsets)
+        return offsets
+
+    def _build(self, file_stat: os.stat_result, mm: mmap.mmap) -> LineOffsets:
+        checkpoints = [0]
+        lines = 0
+        next_checkpoint = self.interval
+        offset = 0
+        end = len(mm)
+        while offset < end:
+            window_end = min(end, offset + COUNT_WINDOW)
+            newlines = mm[offset:window_end].count(b"\n")
+            if lines + newlines < next_checkpoint:
+                lines += newlines
+                offset = window_end
+                continue
+            while offset < window_end:
+                newline = mm.find(b"\n", offset, window_end)
+                if newline == -1:
+                    break
+                offset = newline + 1
+                lines += 1
+                if lines == next_checkpoint:
+                    checkpoints.append(offset)
+                    next_checkpoint += self.interval
+            offset = window_end
+        if end and mm[end - 1:end] != b"\n":
+            lines += 1
+        return LineOffsets(
+            size=file_stat.st_size,
+            mtime_ns=file_stat.st_mtime_ns,
+            interval=self.interval,
+            lines=lines,
+            checkpoints=checkpoints,
+        )
+
+    def _cache_file(self, path: PathLike[str] | str) -> Path:
+        key = hashlib.sha1(os.fsencode(os.path.abspath(path))).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, cache_file: Path, file_stat: os.stat_result) -> LineOffsets | None:
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file) as f:
+                data = json.load(f)
+            if data.get('size') != file_stat.st_size or data.get('mtime_ns') != file_stat.st_mtime_ns:
+                return None
+            offsets = LineOffsets(
+                size=data['size'],
+                mtime_ns=data['mtime_ns'],
+                interval=data['interval'],
+                lines=data['lines'],
+                checkpoints=data['checkpoints'],
+            )
+            os.utime(cache_file)
+            return offsets
+        except Exception as e:
+            self._logger.error(f"Failed to load line index {cache_file}: {e}")
+            return None
+
+    def _store(self, cache_file: Path, path: PathLike[str] | str, offsets: LineOffsets) -> None:
+        if time.time() - offsets.mtime_ns / 1e9 < self.RACY_WINDOW_SECONDS:
+            return
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    "path": os.path.abspath(path),
+                    "size": offsets.size,
+                    "mtime_ns": offsets.mtime_ns,
+                    "interval": offsets.interval,
+                    "lines": offsets.lines,
+                    "checkpoints": offsets.checkpoints,
+                }, f)
+            os.replace(tmp_file, cache_file)
+            self._evict()
+        except Exception as e:
+            self._logger.error(f"Failed to save line index {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        cache_files = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_files.append((cache_file.stat().st_mtime, cache_file))
+            except OSError:
+                continue
+        if len(cache_files) <= self.max_entries:
+            return
+        cache_files.sort()
+        for _, cache_file in cache_files[:len(cache_files) - self.max_entries]:
+            cache_file.unlink(missing_ok=True)
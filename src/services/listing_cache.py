@@ -0,0 +1,100 @@
+import json
+import os
+import time
+from logging import Logger
+from os import PathLike
+from pathlib import Path
+
+from src.services.directory_lister import DirectoryLister, ListingEntry
+
+
+class ListingCache:
+
+    RACY_WINDOW_SECONDS = 2
+
+    def __init__(self, logger: Logger, cache_dir: Path | None = None, max_entries: int = 512):
+        self._logger = logger
+        self.cache_dir = cache_dir or Path.home() / ".console_app_ls_cache"
+        self.max_entries = max_entries
+
+    def scan(self, path: PathLike[str] | str, lister: DirectoryLister) -> list[ListingEntry]:
+        dir_stat = os.stat(path)
+        entries = self._load(path, dir_stat)
+        if entries is not None:
+            self._logger.info(f"Serving listing of {path} from cache")
+            return entries
+        entries = list(lister.scan(path, with_stat=True))
+        self._store(path, dir_stat, entries)
+        return entries
+
+    def _cache_file(self, dir_stat: os.stat_result) -> Path:
+        return self.cache_dir / f"{dir_stat.st_dev}_{dir_stat.st_ino}.json"
+
+    def _load(self, path: PathLike[str] | str, dir_stat: os.stat_result) -> list[ListingEntry] | None:
+        cache_file = self._cache_file(dir_stat)
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file) as f:
+                data = json.load(f)
+            if data.get('mtime_ns') != dir_stat.st_mtime_ns:
+                return None
+            entries = [self._decode_entry(path, item) for item in data.get('entries', [])]
+            os.utime(cache_file)
+            return entries
+        except Exception as e:
+            self._logger.error(f"Failed to load listing cache {cache_file}: {e}")
+            return None
+
+    def _store(self, path: PathLike[str] | str, dir_stat: os.stat_result, entries: list[ListingEntry]) -> None:
+        if time.time() - dir_stat.st_mtime < self.RACY_WINDOW_SECONDS:
+            return
+        cache_file = self._cache_file(dir_stat)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    "path": os.fspath(path),
+                    "mtime_ns": dir_stat.st_mtime_ns,
+                    "entries": [self._encode_entry(entry) for entry in entries]
+                }, f)
+            os.replace(tmp_file, cache_file)
+            self._evict()
+        except Exception as e:
+            self._logger.error(f"Failed to save listing cache {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        cache_files = []
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_files.append((cache_file.stat().st_mtime, cache_file))
+            except OSError:
+                continue
+        if len(cache_files) <= self.max_entries:
+            return
+        cache_files.sort()
+        for _, cache_file in cache_files[:len(cache_files) - self.max_entries]:
+            cache_file.unlink(missing_ok=True)
+
+    def _encode_entry(self, entry: ListingEntry) -> list:
+        if entry.stat is None:
+            return [entry.name, None, None]
+        s = entry.stat
+        return [
+            entry.name,
+            [s.st_mode, s.st_ino, s.st_dev, s.st_nlink, s.st_uid, s.st_gid, s.st_size, s.st_mtime],
+            entry.link_target,
+        ]
+
+    def _decode_entry(self, path: PathLike[str] | str, item: list) -> ListingEntry:
+        name, fields, link_target = item
+        entry_stat = None
+        if fields is not None:
+            mode, ino, dev, nlink, uid, gid, size, mtime = fields
+            entry_stat = os.stat_result(
+                (mode, ino, dev, nlink, uid, gid, size, int(mtime), int(mtime), int(mtime)),
+                {"st_mtime": mtime},
+            )
+        return ListingEntry(name=name, path=os.path.join(path, name), stat=entry_stat, link_target=link_target)
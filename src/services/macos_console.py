@@ -1,17 +1,34 @@
 from logging import Logger
-import shutil
 import os
-import stat
 import zipfile
 import tarfile
-from datetime import datetime
+import time
 from os import PathLike, remove
 from pathlib import Path
-from typing import Literal
+from collections.abc import Callable, Iterator
+from typing import BinaryIO, Literal
 
 from src.enums.file_mode import FileReadMode
 from src.enums.list_mode import ListMode
+from src.enums.reflink_mode import ReflinkMode
+from src.enums.sort_key import SortKey
 from src.services.workspace_manager import WorkspaceManager
+from src.services.directory_lister import DirectoryLister
+from src.services.content_search import ContentSearcher, GrepMatch
+from src.services.disk_usage import DiskUsage, DiskUsageScanner
+from src.services.file_copier import FileCopier
+from src.services.file_finder import FileFinder, FindQuery
+from src.services.file_mover import FileMover, MoveResult
+from src.services.file_reader import DEFAULT_CHUNK_SIZE, FileReader
+from src.services.file_tail import FileTail
+from src.services.line_index import LineIndex
+from src.services.listing_cache import ListingCache
+from src.services.resumable_copier import ResumableCopier
+from src.services.tree_copier import ParallelTreeCopier, TreeCopyStats, is_unchanged
+from src.services.tree_remover import ParallelRemover, RemovalStats
+from src.services.tree_walker import ParallelTreeWalker
+from src.services.word_count import WordCount, WordCounter
+from src.services.zip_writer import ParallelZipWriter, ZipStats
 from src.services.base import OSConsoleServiceBase
 
 
@@ -19,23 +36,68 @@ class MacOSConsoleService(OSConsoleServiceBase):
     def __init__(self, logger: Logger):
         self._logger = logger
         self._workspace_manager = WorkspaceManager(logger)
+        self._lister = DirectoryLister(logger)
+        self._listing_cache = ListingCache(logger)
+        self._line_index = LineIndex(logger)
     
     def _format_permissions(self, file_stat: os.stat_result) -> str:
-        mode = file_stat.st_mode
-        perms = []
-        perms.append('d' if stat.S_ISDIR(mode) else '-')
-        perms.append('r' if mode & stat.S_IRUSR else '-')
-        perms.append('w' if mode & stat.S_IWUSR else '-')
-        perms.append('x' if mode & stat.S_IXUSR else '-')
-        perms.append('r' if mode & stat.S_IRGRP else '-')
-        perms.append('w' if mode & stat.S_IWGRP else '-')
-        perms.append('x' if mode & stat.S_IXGRP else '-')
-        perms.append('r' if mode & stat.S_IROTH else '-')
-        perms.append('w' if mode & stat.S_IWOTH else '-')
-        perms.append('x' if mode & stat.S_IXOTH else '-')
-        return ''.join(perms)
+        return self._lister.format_permissions(file_stat)
     
-    def ls(self, path: PathLike[str] | str, list_mode: ListMode = ListMode.short) -> list[str]:
+    def ls(
+        self,
+        path: PathLike[str] | str,
+        list_mode: ListMode = ListMode.short,
+        numeric_ids: bool = False,
+    ) -> list[str]:
+        return list(self.iter_ls(path, list_mode=list_mode, numeric_ids=numeric_ids))
+    
+    def iter_ls(
+        self,
+        path: PathLike[str] | str,
+        list_mode: ListMode = ListMode.short,
+        numeric_ids: bool = False,
+        chunk_size: int = 0,
+        sort_key: SortKey | None = None,
+        reverse: bool = False,
+        limit: int | None = None,
+        use_cache: bool = True,
+    ) -> Iterator[str]:
+        path = self._resolve_directory(path)
+        self._logger.info(f"Listing {path} in {list_mode.value} mode")
+        
+        if list_mode == ListMode.long and chunk_size <= 0 and sort_key is None:
+            sort_key = SortKey.name
+        with_stat = list_mode == ListMode.long or sort_key in (SortKey.size, SortKey.mtime)
+        if with_stat and chunk_size <= 0 and use_cache:
+            entries = self._listing_cache.scan(path, self._lister)
+        else:
+            entries = self._lister.scan(path, with_stat=with_stat)
+        if sort_key is not None or reverse or limit is not None:
+            entries = self._lister.select(entries, sort_key or SortKey.name, reverse=reverse, limit=limit)
+        
+        if list_mode == ListMode.long:
+            return self._lister.iter_long_lines(entries, numeric_ids=numeric_ids, chunk_size=chunk_size)
+        else:
+            return (entry.name + "\n" for entry in entries)
+    
+    def iter_ls_recursive(
+        self,
+        path: PathLike[str] | str,
+        list_mode: ListMode = ListMode.short,
+        numeric_ids: bool = False,
+        max_depth: int | None = None,
+        workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[str]:
+        path = self._resolve_directory(path)
+        self._logger.info(f"Listing {path} recursively in {list_mode.value} mode")
+        
+        long = list_mode == ListMode.long
+        walker = ParallelTreeWalker(self._logger, workers=workers)
+        scans = walker.walk(path, max_depth=max_depth, ordered=ordered, with_stat=long)
+        return self._lister.iter_tree_lines(scans, long=long, numeric_ids=numeric_ids)
+    
+    def _resolve_directory(self, path: PathLike[str] | str) -> Path:
         path = self._workspace_manager.resolve_path(path)
         if not path.exists(follow_symlinks=True):
             self._logger.error(f"Folder not found: {path}")
@@ -43,88 +105,31 @@ class MacOSConsoleService(OSConsoleServiceBase):
         if not path.is_dir(follow_symlinks=True):
             self._logger.error(f"You entered {path} is not a directory")
             raise NotADirectoryError(path)
-        self._logger.info(f"Listing {path} in {list_mode.value} mode")
-        
-        if list_mode == ListMode.long:
-            entries = sorted(path.iterdir(), key=lambda p: p.name)
-            return self._format_long_lines(entries)
-        else:
-            return [entry.name + "\n" for entry in path.iterdir()]
+        return path
+    
+    def du(self, path: PathLike[str] | str, use_cache: bool = True, workers: int = 8) -> DiskUsage:
+        path = self._workspace_manager.resolve_path(path)
+        if not path.exists(follow_symlinks=False):
+            self._logger.error(f"Path not found: {path}")
+            raise FileNotFoundError(path)
+        self._logger.info(f"Measuring disk usage of {path}")
+        return DiskUsageScanner(self._logger, workers=workers).scan(path, use_cache=use_cache)
+    
+    def find(self, path: PathLike[str] | str, query: FindQuery, workers: int = 8) -> Iterator[str]:
+        path = self._workspace_manager.resolve_path(path)
+        if not path.exists(follow_symlinks=False):
+            self._logger.error(f"Path not found: {path}")
+            raise FileNotFoundError(path)
+        self._logger.info(f"Searching {path} for {query}")
+        return FileFinder(self._logger, workers=workers).find(path, query)
     
-    def _format_long_lines(self, entries: list[Path]) -> list[str]:
-        if not entries:
-            return []
-        
-        file_info = []
-        for entry in entries:
-            try:
-                file_stat = entry.stat(follow_symlinks=False)
-                permissions = self._format_permissions(file_stat)
-                nlinks = file_stat.st_nlink
-                try:
-                    owner = entry.owner()
-                except (KeyError, OSError):
-                    owner = str(file_stat.st_uid)
-                try:
-                    group = entry.group()
-                except (KeyError, OSError):
-                    group = str(file_stat.st_gid)
-                size = file_stat.st_size
-                mtime = datetime.fromtimestamp(file_stat.st_mtime)
-                date_str = mtime.strftime('%b %d %H:%M')
-                if (datetime.now() - mtime).days > 365:
-                    date_str = mtime.strftime('%b %d  %Y')
-                name = entry.name
-                if entry.is_symlink():
-                    try:
-                        target = entry.readlink()
-                        name = f"{name} -> {target}"
-                    except OSError:
-                        pass
-                file_info.append({
-                    'permissions': permissions,
-                    'nlinks': nlinks,
-                    'owner': owner,
-                    'group': group,
-                    'size': size,
-                    'date': date_str,
-                    'name': name
-                })
-            except OSError as e:
-                self._logger.warning(f"Failed to stat {entry}: {e}")
-                file_info.append({
-                    'permissions': '-',
-                    'nlinks': 1,
-                    'owner': '-',
-                    'group': '-',
-                    'size': 0,
-                    'date': '-',
-                    'name': entry.name
-                })
-        
-        max_owner_width = max(len(info['owner']) for info in file_info)
-        max_links_width = max(len(str(info['nlinks'])) for info in file_info)
-        max_size_width = max(len(str(info['size'])) for info in file_info)
-        
-        result = []
-        for info in file_info:
-            line = f"{info['permissions']} {info['nlinks']:{max_links_width}d} {info['owner']:<{max_owner_width}} {info['group']}  {info['size']:>{max_size_width}} {info['date']} {info['name']}"
-            result.append(line)
-        
-        return result
-
     def cat(
         self,
         filename: PathLike[str] | str,
         mode: Literal[FileReadMode.string, FileReadMode.bytes] = FileReadMode.string,
     ) -> str | bytes:
         path = Path(filename)
-        if not path.exists(follow_symlinks=True):
-            self._logger.error(f"File not found: {filename}")
-            raise FileNotFoundError(filename)
-        if path.is_dir(follow_symlinks=True):
-            self._logger.error(f"You entered {filename} is not a file")
-            raise IsADirectoryError(f"You entered {filename} is not a file")
+        self._validate_file(path)
         try:
             self._logger.info(f"Reading file {filename} in mode {mode}")
             match mode:
@@ -135,7 +140,87 @@ class MacOSConsoleService(OSConsoleServiceBase):
         except OSError as e:
             self._logger.exception(f"Error reading {filename}: {e}")
             raise
-    def rm(self, path: PathLike[str] | str, recursive: bool = False) -> None:
+    def iter_cat(
+        self,
+        filename: PathLike[str] | str,
+        mode: Literal[FileReadMode.string, FileReadMode.bytes] = FileReadMode.string,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        decompress: bool = False,
+    ) -> Iterator[str | bytes]:
+        path = Path(filename)
+        self._validate_file(path)
+        self._logger.info(f"Streaming file {filename} in mode {mode}{' with decompression' if decompress else ''}")
+        return FileReader(self._logger, chunk_size=chunk_size, decompress=decompress).iter_chunks(path, mode)
+    
+    def iter_cat_lines(
+        self,
+        filename: PathLike[str] | str,
+        first: int,
+        last: int | None = None,
+        mode: Literal[FileReadMode.string, FileReadMode.bytes] = FileReadMode.string,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str | bytes]:
+        path = Path(filename)
+        self._validate_file(path)
+        self._logger.info(f"Reading lines {first}:{last or ''} of {filename} in mode {mode}")
+        start, end = self._line_index.byte_range(path, first, last)
+        return FileReader(self._logger, chunk_size=chunk_size).iter_chunks(path, mode, start, end)
+    
+    def cat_into(self, filename: PathLike[str] | str, output: BinaryIO) -> int:
+        path = Path(filename)
+        self._validate_file(path)
+        self._logger.info(f"Copying file {filename} to output")
+        return FileReader(self._logger).copy_into(path, output)
+    
+    def head(self, filename: PathLike[str] | str, lines: int = 10) -> Iterator[bytes]:
+        path = Path(filename)
+        self._validate_file(path)
+        self._logger.info(f"Reading first {lines} lines of {filename}")
+        return FileTail(self._logger).head(path, lines)
+    
+    def tail(self, filename: PathLike[str] | str, lines: int = 10, follow: bool = False) -> Iterator[bytes]:
+        path = Path(filename)
+        self._validate_file(path)
+        self._logger.info(f"Reading last {lines} lines of {filename}{' and following' if follow else ''}")
+        if follow:
+            return FileTail(self._logger).follow(path, lines)
+        return FileTail(self._logger).tail(path, lines)
+    
+    def wc(
+        self,
+        paths: list[PathLike[str] | str],
+        workers: int | None = None,
+        count_words: bool = True,
+    ) -> Iterator[WordCount]:
+        files = [Path(path) for path in paths]
+        self._logger.info(f"Counting lines, words and bytes in {len(files)} file(s)")
+        return WordCounter(self._logger, workers=workers).count(files, count_words=count_words)
+    
+    def grep(
+        self,
+        path: PathLike[str] | str,
+        pattern: str,
+        recursive: bool = False,
+        ignore_case: bool = False,
+        workers: int | None = None,
+    ) -> Iterator[GrepMatch]:
+        path = self._workspace_manager.resolve_path(path)
+        search_tree = recursive and path.is_dir(follow_symlinks=True)
+        if not search_tree:
+            self._validate_file(path)
+        self._logger.info(f"Searching {path} for {pattern!r}")
+        searcher = ContentSearcher(self._logger, workers=workers)
+        return searcher.search(path, pattern, recursive=search_tree, ignore_case=ignore_case)
+    
+    def _validate_file(self, path: Path) -> None:
+        if not path.exists(follow_symlinks=True):
+            self._logger.error(f"File not found: {path}")
+            raise FileNotFoundError(path)
+        if path.is_dir(follow_symlinks=True):
+            self._logger.error(f"You entered {path} is not a file")
+            raise IsADirectoryError(f"You entered {path} is not a file")
+    
+    def validate_rm(self, path: PathLike[str] | str, recursive: bool = False) -> Path:
         path = self._workspace_manager.resolve_path(path)
         path_resolved = path.resolve()
         if path_resolved == Path('/'):
@@ -145,17 +230,22 @@ class MacOSConsoleService(OSConsoleServiceBase):
         if not path.exists(follow_symlinks=True):
             self._logger.error(f"Folder not found: {path}")
             raise FileNotFoundError(path)
+        if not path.is_file(follow_symlinks=True) and not (recursive and path.is_dir(follow_symlinks=True)):
+            self._logger.error(f"You entered {path} is not a directory")
+            raise IsADirectoryError(path)
+        return path
+    
+    def rm(self, path: PathLike[str] | str, recursive: bool = False, workers: int = 8) -> RemovalStats:
+        path = self.validate_rm(path, recursive)
         if path.is_file(follow_symlinks=True):
+            size = path.lstat().st_size
             remove(path)
             self._logger.info(f"Removed file: {path}")
-            return None
-        if recursive and path.is_dir(follow_symlinks=True):
-            shutil.rmtree(path)
-            self._logger.info(f"Removed directory recursively: {path}")
-            return None
-        else:
-            self._logger.error(f"You entered {path} is not a directory")
-            raise IsADirectoryError(path)
+            return RemovalStats(path=str(path), files=1, size=size)
+        stats = ParallelRemover(self._logger, workers=workers).remove(path)
+        self._logger.info(f"Removed directory recursively: {path}")
+        return stats
+    
     def cd(self, path: PathLike[str] | str) -> Path:
         resolved_path = self._workspace_manager.resolve_path(path)
         if not resolved_path.exists(follow_symlinks=True):
@@ -184,16 +274,33 @@ class MacOSConsoleService(OSConsoleServiceBase):
         path.touch()
         self._logger.info(f"Created file: {path}")
         return None
-    def mv(self, source: PathLike[str] | str, destination: PathLike[str] | str) -> None:
+    def mv(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        workers: int = 8,
+        progress: Callable[[int], None] | None = None,
+    ) -> MoveResult:
         source = self._workspace_manager.resolve_path(source)
         destination = self._workspace_manager.resolve_path(destination)
         if not source.exists(follow_symlinks=True):
             self._logger.error(f"File not found: {source}")
             raise FileNotFoundError(source)
-        source.rename(destination)
-        self._logger.info(f"Moved file: {source} to {destination}")
-        return None
-    def cp(self, source: PathLike[str] | str, destination: PathLike[str] | str, recursive: bool = False) -> None:
+        result = FileMover(self._logger, workers=workers).move(source, destination, progress=progress)
+        self._logger.info(f"Moved file: {source} to {destination} ({result.method})")
+        return result
+    def cp(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        recursive: bool = False,
+        reflink: ReflinkMode = ReflinkMode.auto,
+        workers: int = 8,
+        update: bool = False,
+        checksum: bool = False,
+        delete: bool = False,
+        resume: bool = False,
+    ) -> TreeCopyStats:
         source = self._workspace_manager.resolve_path(source)
         destination = Path(destination)
         
@@ -204,21 +311,45 @@ class MacOSConsoleService(OSConsoleServiceBase):
         if destination.exists() and destination.is_dir():
             destination = destination / source.name
         
+        copier = FileCopier(self._logger, reflink=reflink)
         if source.is_file():
-            shutil.copy2(source, destination)
-            self._logger.info(f"Copied file: {source} -> {destination}")
+            started = time.perf_counter()
+            if update and is_unchanged(source, destination, checksum):
+                self._logger.info(f"Skipped unchanged file: {source} -> {destination}")
+                return TreeCopyStats(source=str(source), destination=str(destination), skipped=1)
+            if resume:
+                result = ResumableCopier(self._logger).copy_file(source, destination)
+            else:
+                result = copier.copy_file(source, destination)
+            self._logger.info(f"Copied file: {source} -> {destination} ({result.method})")
+            return TreeCopyStats(
+                source=str(source),
+                destination=str(destination),
+                files=1,
+                size=result.size,
+                seconds=time.perf_counter() - started,
+            )
         elif source.is_dir():
+            if resume:
+                self._logger.error(f"Cannot resume a directory copy: {source}")
+                raise ValueError(f"--resume copies single files only: {source}")
             if recursive:
-                shutil.copytree(source, destination, dirs_exist_ok=True)
+                stats = ParallelTreeCopier(self._logger, copier, workers=workers).copy(
+                    source, destination, update=update, checksum=checksum, delete=delete
+                )
                 self._logger.info(f"Copied directory: {source} -> {destination}")
+                return stats
             else:
                 self._logger.error(f"Cannot copy directory without -r flag: {source}")
                 raise IsADirectoryError(f"Cannot copy directory without -r flag: {source}")
-        else:
-            raise ValueError(f"Unknown source type: {source}")
-        return None
+        raise ValueError(f"Unknown source type: {source}")
     
-    def zip(self, source: PathLike[str] | str, destination: PathLike[str] | str) -> None:
+    def zip(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        workers: int | None = None,
+    ) -> ZipStats:
         source = self._workspace_manager.resolve_path(source)
         destination = self._workspace_manager.resolve_path(destination)
         
@@ -226,20 +357,12 @@ class MacOSConsoleService(OSConsoleServiceBase):
             self._logger.error(f"Source not found: {source}")
             raise FileNotFoundError(f"Source not found: {source}")
         
-        source_path = Path(source)
-        
-        with zipfile.ZipFile(destination, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            if source_path.is_file():
-                zipf.write(source_path, source_path.name)
-                self._logger.info(f"Zipped file: {source} -> {destination}")
-            elif source_path.is_dir():
-                for file_path in source_path.rglob('*'):
-                    if file_path.is_file():
-                        arcname = file_path.relative_to(source_path)
-                        zipf.write(file_path, arcname)
-                self._logger.info(f"Zipped directory: {source} -> {destination}")
-            else:
-                raise ValueError(f"Unknown source type: {source}")
+        stats = ParallelZipWriter(self._logger, workers=workers).write(source, destination)
+        if source.is_dir():
+            self._logger.info(f"Zipped directory: {source} -> {destination}")
+        else:
+            self._logger.info(f"Zipped file: {source} -> {destination}")
+        return stats
     
     def unzip(self, archive: PathLike[str] | str, destination: PathLike[str] | str | None = None) -> None:
         archive = self._workspace_manager.resolve_path(archive)
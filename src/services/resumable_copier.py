@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from logging import Logger
+from os import PathLike
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from src.services.file_copier import CopyResult
+
+CHECKPOINT_BLOCK_SIZE = 16 * 1024 * 1024
+CHECKPOINT_ALGORITHM = "sha256"
+
+
+@dataclass
+class CopyCheckpoint:
+    source: str
+    size: int
+    mtime_ns: int
+    block_size: int
+    algorithm: str = CHECKPOINT_ALGORITHM
+
+
+def part_path(destination: PathLike[str] | str) -> Path:
+    destination = Path(destination)
+    return destination.with_name(f"{destination.name}.part")
+
+
+def checkpoint_path(destination: PathLike[str] | str) -> Path:
+    destination = Path(destination)
+    return destination.with_name(f"{destination.name}.part.ckpt")
+
+
+class ResumableCopier:
+
+    def __init__(self, logger: Logger, block_size: int = CHECKPOINT_BLOCK_SIZE):
+        self._logger = logger
+        self.block_size = block_size
+
+    def copy_file(self, source: PathLike[str] | str, destination: PathLike[str] | str) -> CopyResult:
+        source = Path(source)
+        destination = Path(destination)
+        if destination.exists() and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source} and {destination} are the same file")
+        part_file = part_path(destination)
+        checkpoint_file = checkpoint_path(destination)
+        with open(source, 'rb') as src:
+            src_stat = os.fstat(src.fileno())
+            checkpoint = CopyCheckpoint(
+                source=str(source.resolve()),
+                size=src_stat.st_size,
+                mtime_ns=src_stat.st_mtime_ns,
+                block_size=self.block_size,
+            )
+            digests = self._load(checkpoint_file, checkpoint)
+            part_file.touch()
+            with open(part_file, 'r+b') as dst:
+                digests = self._verify(dst, checkpoint, digests)
+                resumed = min(len(digests) * checkpoint.block_size, checkpoint.size)
+                dst.truncate(resumed)
+                if resumed:
+                    self._logger.info(f"Resuming copy of {source} at byte {resumed}")
+                self._save(checkpoint_file, checkpoint, digests)
+                with open(checkpoint_file, 'a') as log:
+                    self._copy_blocks(src, dst, checkpoint, len(digests), log)
+                dst.flush()
+                os.fsync(dst.fileno())
+        shutil.copystat(source, part_file)
+        os.replace(part_file, destination)
+        checkpoint_file.unlink(missing_ok=True)
+        method = "resumed" if resumed else "checkpointed"
+        return CopyResult(source=str(source), destination=str(destination), size=checkpoint.size, method=method)
+
+    def _load(self, checkpoint_file: Path, expected: CopyCheckpoint) -> list[str]:
+        if not checkpoint_file.exists():
+            return []
+        try:
+            with open(checkpoint_file) as f:
+                saved = CopyCheckpoint(**json.loads(f.readline()))
+                lines = f.read().split("\n")
+        except Exception as e:
+            self._logger.error(f"Failed to load copy checkpoint {checkpoint_file}: {e}")
+            return []
+        if saved != expected:
+            self._logger.info(f"Source changed since {checkpoint_file} was written, starting over")
+            return []
+        digest_length = hashlib.new(saved.algorithm).digest_size * 2
+        digests = []
+        for line in lines:
+            if len(line) != digest_length:
+                break
+            digests.append(line)
+        return digests
+
+    def _save(self, checkpoint_file: Path, checkpoint: CopyCheckpoint, digests: list[str]) -> None:
+        tmp_file = checkpoint_file.with_name(f"{checkpoint_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(asdict(checkpoint)) + "\n")
+                f.writelines(f"{digest}\n" for digest in digests)
+            os.replace(tmp_file, checkpoint_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _verify(self, dst: BinaryIO, checkpoint: CopyCheckpoint, digests: list[str]) -> list[str]:
+        for index, digest in enumerate(digests):
+            dst.seek(index * checkpoint.block_size)
+            block = dst.read(self._block_length(checkpoint, index))
+            if hashlib.new(checkpoint.algorithm, block).hexdigest() != digest:
+                self._logger.warning(f"Block {index} of the partial copy does not match its checkpoint")
+                return digests[:index]
+        return digests
+
+    def _copy_blocks(
+        self,
+        src: BinaryIO,
+        dst: BinaryIO,
+        checkpoint: CopyCheckpoint,
+        index: int,
+        log: TextIO,
+    ) -> None:
+        src.seek(index * checkpoint.block_size)
+        dst.seek(index * checkpoint.block_size)
+        while index * checkpoint.block_size < checkpoint.size:
+            length = self._block_length(checkpoint, index)
+            block = src.read(length)
+            if len(block) != length:
+                raise OSError(f"Source changed during copy: {checkpoint.source}")
+            dst.write(block)
+            dst.flush()
+            log.write(hashlib.new(checkpoint.algorithm, block).hexdigest() + "\n")
+            log.flush()
+            index += 1
+
+    def _block_length(self, checkpoint: CopyCheckpoint, index: int) -> int:
+        return min(checkpoint.block_size, checkpoint.size - index * checkpoint.block_size)
@@ -0,0 +1,197 @@
+import hashlib
+import os
+import shutil
+import stat
+import time
+from collections.abc import Callable
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+
+from src.services.file_copier import CopyResult, FileCopier
+from src.services.tree_remover import ParallelRemover
+from src.services.tree_walker import DirectoryScan, ParallelTreeWalker
+
+CHECKSUM_ALGORITHM = "blake2b"
+
+
+@dataclass
+class TreeCopyStats:
+    source: str
+    destination: str
+    files: int = 0
+    directories: int = 0
+    symlinks: int = 0
+    size: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.size / self.seconds if self.seconds > 0 else 0.0
+
+
+def _digest(path: PathLike[str] | str) -> bytes:
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, CHECKSUM_ALGORITHM).digest()
+
+
+def is_unchanged(
+    source: PathLike[str] | str,
+    destination: PathLike[str] | str,
+    checksum: bool = False,
+) -> bool:
+    try:
+        dst_stat = os.lstat(destination)
+    except FileNotFoundError:
+        return False
+    src_stat = os.stat(source)
+    if not stat.S_ISREG(dst_stat.st_mode) or src_stat.st_size != dst_stat.st_size:
+        return False
+    if checksum:
+        return _digest(source) == _digest(destination)
+    return src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+
+
+class ParallelTreeCopier:
+
+    def __init__(self, logger: Logger, copier: FileCopier, workers: int = 8):
+        self._logger = logger
+        self._copier = copier
+        self.workers = max(1, workers)
+
+    def copy(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        update: bool = False,
+        checksum: bool = False,
+        delete: bool = False,
+        progress: Callable[[int], None] | None = None,
+    ) -> TreeCopyStats:
+        source = os.fspath(source)
+        destination = os.fspath(destination)
+        if os.path.commonpath([os.path.abspath(source), os.path.abspath(destination)]) == os.path.abspath(source):
+            raise ValueError(f"Cannot copy a directory into itself: {source} -> {destination}")
+        started = time.perf_counter()
+        stats = TreeCopyStats(source=source, destination=destination)
+        errors: list[tuple[str, str, str]] = []
+        os.makedirs(destination, exist_ok=True)
+        stats.directories += 1
+        directories = [(source, destination)]
+        pending: dict[Future, tuple[str, str]] = {}
+        in_flight_limit = self.workers * 4
+        walker = ParallelTreeWalker(self._logger, workers=self.workers)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for scan in walker.walk(source, ordered=True):
+                target_dir = os.path.join(destination, os.path.relpath(scan.path, source))
+                if scan.error is not None:
+                    errors.append((scan.path, target_dir, str(scan.error)))
+                    continue
+                if delete:
+                    self._delete_extras(scan, target_dir, stats, errors)
+                for entry in scan.entries:
+                    target = os.path.join(target_dir, entry.name)
+                    try:
+                        if entry.is_symlink():
+                            self._copy_symlink(entry.path, target)
+                            stats.symlinks += 1
+                        elif entry.is_dir(follow_symlinks=False):
+                            if update and (os.path.islink(target) or os.path.isfile(target)):
+                                os.unlink(target)
+                            os.makedirs(target, exist_ok=True)
+                            directories.append((entry.path, target))
+                            stats.directories += 1
+                        elif entry.is_file(follow_symlinks=False):
+                            future = pool.submit(self._copy_file, entry.path, target, update, checksum)
+                            pending[future] = (entry.path, target)
+                        else:
+                            errors.append((entry.path, target, "Not a regular file"))
+                    except OSError as e:
+                        errors.append((entry.path, target, str(e)))
+                    if len(pending) >= in_flight_limit:
+                        self._collect(pending, stats, errors, progress, FIRST_COMPLETED)
+            self._collect(pending, stats, errors, progress)
+        for src, dst in reversed(directories):
+            try:
+                shutil.copystat(src, dst)
+            except OSError as e:
+                errors.append((src, dst, str(e)))
+        stats.seconds = time.perf_counter() - started
+        self._logger.info(
+            f"Copied {source} -> {destination}: {stats.files} files, {stats.directories} directories, "
+            f"{stats.symlinks} symlinks, {stats.size} bytes, {stats.skipped} unchanged, {stats.deleted} deleted "
+            f"in {stats.seconds:.3f}s"
+        )
+        if errors:
+            for src, dst, error in errors:
+                self._logger.warning(f"Cannot copy {src} -> {dst}: {error}")
+            raise shutil.Error(errors)
+        return stats
+
+    def _copy_file(self, source: str, target: str, update: bool, checksum: bool) -> CopyResult | None:
+        if update and is_unchanged(source, target, checksum):
+            return None
+        return self._copier.copy_file(source, target)
+
+    def _delete_extras(
+        self,
+        scan: DirectoryScan,
+        target_dir: str,
+        stats: TreeCopyStats,
+        errors: list[tuple[str, str, str]],
+    ) -> None:
+        names = {entry.name for entry in scan.entries}
+        try:
+            with os.scandir(target_dir) as it:
+                extras = [entry for entry in it if entry.name not in names]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            errors.append((scan.path, target_dir, str(e)))
+            return
+        for entry in extras:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    ParallelRemover(self._logger, workers=self.workers).remove(entry.path)
+                else:
+                    os.unlink(entry.path)
+            except OSError as e:
+                errors.append((scan.path, entry.path, str(e)))
+                continue
+            stats.deleted += 1
+
+    def _copy_symlink(self, source: str, target: str) -> None:
+        link = os.readlink(source)
+        if os.path.islink(target) and os.readlink(target) == link:
+            return
+        if os.path.islink(target) or os.path.isfile(target):
+            os.unlink(target)
+        os.symlink(link, target)
+        shutil.copystat(source, target, follow_symlinks=False)
+
+    def _collect(
+        self,
+        pending: dict[Future, tuple[str, str]],
+        stats: TreeCopyStats,
+        errors: list[tuple[str, str, str]],
+        progress: Callable[[int], None] | None = None,
+        return_when: str = ALL_COMPLETED,
+    ) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            src, dst = pending.pop(future)
+            try:
+                result = future.result()
+            except OSError as e:
+                errors.append((src, dst, str(e)))
+                continue
+            if result is None:
+                stats.skipped += 1
+                continue
+            stats.files += 1
+            stats.size += result.size
+            if progress is not None:
+                progress(stats.size)
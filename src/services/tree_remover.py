@@ -0,0 +1,182 @@
+import errno
+import os
+import queue
+import shutil
+import stat
+import threading
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+
+FD_REMOVAL_SUPPORTED = (
+    {os.open, os.stat, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+    and os.stat in os.supports_follow_symlinks
+)
+_DIRECTORY_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, "O_DIRECTORY", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+
+@dataclass
+class RemovalStats:
+    path: str
+    files: int = 0
+    directories: int = 0
+    size: int = 0
+
+
+class _Directory:
+
+    __slots__ = ("name", "path", "parent", "dev", "ino", "fd", "pending")
+
+    def __init__(self, name: str, path: str, parent: "_Directory | None", dir_stat: os.stat_result):
+        self.name = name
+        self.path = path
+        self.parent = parent
+        self.dev = dir_stat.st_dev
+        self.ino = dir_stat.st_ino
+        self.fd = -1
+        self.pending = 1
+
+
+class _RemovalJob:
+
+    def __init__(self, root: str, root_stat: os.stat_result, workers: int):
+        self.stats = RemovalStats(path=root)
+        self._workers = workers
+        self._root = _Directory(root, root, None, root_stat)
+        self._stack: queue.LifoQueue[_Directory | None] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open: set[_Directory] = set()
+        self._error: OSError | None = None
+
+    def run(self) -> RemovalStats:
+        self._stack.put(self._root)
+        threads = [threading.Thread(target=self._work, daemon=True) for _ in range(self._workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for directory in self._open:
+            os.close(directory.fd)
+        if self._error is not None:
+            raise self._error
+        return self.stats
+
+    def _work(self) -> None:
+        while True:
+            directory = self._stack.get()
+            if directory is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._process(directory)
+            except OSError as e:
+                self._stop(e)
+
+    def _stop(self, error: OSError | None = None) -> None:
+        with self._lock:
+            if error is not None and self._error is None:
+                self._error = error
+        for _ in range(self._workers):
+            self._stack.put(None)
+
+    def _open_directory(self, directory: _Directory) -> None:
+        parent_fd = directory.parent.fd if directory.parent is not None else None
+        fd = os.open(directory.name, _DIRECTORY_FLAGS, dir_fd=parent_fd)
+        fd_stat = os.fstat(fd)
+        if (fd_stat.st_dev, fd_stat.st_ino) != (directory.dev, directory.ino):
+            os.close(fd)
+            raise OSError(errno.ELOOP, "Directory was replaced during removal", directory.path)
+        with self._lock:
+            directory.fd = fd
+            self._open.add(directory)
+
+    def _process(self, directory: _Directory) -> None:
+        self._open_directory(directory)
+        children = []
+        files = size = 0
+        with os.scandir(directory.fd) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    child_path = os.path.join(directory.path, entry.name)
+                    children.append(_Directory(entry.name, child_path, directory, entry.stat(follow_symlinks=False)))
+                    continue
+                try:
+                    size += entry.stat(follow_symlinks=False).st_size
+                    os.unlink(entry.name, dir_fd=directory.fd)
+                except FileNotFoundError:
+                    continue
+                files += 1
+        with self._lock:
+            self.stats.files += files
+            self.stats.size += size
+            directory.pending += len(children)
+        for child in children:
+            self._stack.put(child)
+        self._finish(directory)
+
+    def _finish(self, directory: _Directory | None) -> None:
+        while directory is not None:
+            with self._lock:
+                directory.pending -= 1
+                if directory.pending:
+                    return
+                self._open.discard(directory)
+            os.close(directory.fd)
+            if directory.parent is None:
+                os.rmdir(directory.path)
+            else:
+                os.rmdir(directory.name, dir_fd=directory.parent.fd)
+            with self._lock:
+                self.stats.directories += 1
+            if directory.parent is None:
+                self._stop()
+            directory = directory.parent
+
+
+class ParallelRemover:
+
+    def __init__(self, logger: Logger, workers: int = 8):
+        self._logger = logger
+        self.workers = max(1, workers)
+
+    def remove(self, path: PathLike[str] | str) -> RemovalStats:
+        root = os.fspath(path)
+        root_stat = os.lstat(root)
+        if stat.S_ISLNK(root_stat.st_mode):
+            raise OSError("Cannot call rmtree on a symbolic link")
+        if not stat.S_ISDIR(root_stat.st_mode):
+            raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), root)
+        if not FD_REMOVAL_SUPPORTED:
+            self._logger.info(f"dir_fd functions are unavailable, removing {root} with shutil.rmtree")
+            return self._remove_by_path(root)
+        stats = _RemovalJob(root, root_stat, self.workers).run()
+        self._logger.info(
+            f"Removed {root}: {stats.files} files, {stats.directories} directories, {stats.size} bytes"
+        )
+        return stats
+
+    def _remove_by_path(self, root: str) -> RemovalStats:
+        stats = RemovalStats(path=root)
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    stats.files += 1
+                    stats.size += entry.stat(follow_symlinks=False).st_size
+            stats.directories += 1
+        shutil.rmtree(root)
+        return stats
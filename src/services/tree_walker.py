@@ -0,0 +1,130 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from logging import Logger
+from os import PathLike
+
+
+@dataclass
+class DirectoryScan:
+    path: str
+    depth: int
+    entries: list[os.DirEntry] = field(default_factory=list)
+    error: OSError | None = None
+
+
+class ParallelTreeWalker:
+
+    def __init__(self, logger: Logger, workers: int = 8):
+        self._logger = logger
+        self.workers = max(1, workers)
+
+    def walk(
+        self,
+        root: PathLike[str] | str,
+        max_depth: int | None = None,
+        ordered: bool = True,
+        with_stat: bool = False,
+        should_descend: Callable[[os.DirEntry], bool] | None = None,
+    ) -> Iterator[DirectoryScan]:
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            walker = self._walk_ordered if ordered else self._walk_unordered
+            yield from walker(pool, os.fspath(root), max_depth, ordered, with_stat, should_descend)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _scan(self, path: str, depth: int, ordered: bool, with_stat: bool) -> DirectoryScan:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            self._logger.warning(f"Cannot open directory {path}: {e}")
+            return DirectoryScan(path=path, depth=depth, error=e)
+        if with_stat:
+            for entry in entries:
+                try:
+                    entry.stat(follow_symlinks=False)
+                except OSError:
+                    pass
+        if ordered:
+            entries.sort(key=lambda e: e.name)
+        return DirectoryScan(path=path, depth=depth, entries=entries)
+
+    def _subdirectories(
+        self,
+        scan: DirectoryScan,
+        max_depth: int | None,
+        should_descend: Callable[[os.DirEntry], bool] | None,
+    ) -> list[str]:
+        if max_depth is not None and scan.depth >= max_depth:
+            return []
+        children = []
+        for entry in scan.entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir and (should_descend is None or should_descend(entry)):
+                children.append(entry.path)
+        return children
+
+    def _walk_ordered(
+        self,
+        pool: ThreadPoolExecutor,
+        root: str,
+        max_depth: int | None,
+        ordered: bool,
+        with_stat: bool,
+        should_descend: Callable[[os.DirEntry], bool] | None,
+    ) -> Iterator[DirectoryScan]:
+        prefetch_limit = self.workers * 4
+        stack: list[list] = [[root, 0, None]]
+        while stack:
+            self._prefetch(pool, stack, prefetch_limit, ordered, with_stat)
+            path, depth, future = stack.pop()
+            scan = future.result()
+            yield scan
+            children = self._subdirectories(scan, max_depth, should_descend)
+            stack.extend([child, depth + 1, None] for child in reversed(children))
+
+    def _prefetch(
+        self,
+        pool: ThreadPoolExecutor,
+        stack: list[list],
+        limit: int,
+        ordered: bool,
+        with_stat: bool,
+    ) -> None:
+        submitted = 0
+        for item in reversed(stack):
+            if submitted >= limit:
+                break
+            if item[2] is None:
+                item[2] = pool.submit(self._scan, item[0], item[1], ordered, with_stat)
+            submitted += 1
+
+    def _walk_unordered(
+        self,
+        pool: ThreadPoolExecutor,
+        root: str,
+        max_depth: int | None,
+        ordered: bool,
+        with_stat: bool,
+        should_descend: Callable[[os.DirEntry], bool] | None,
+    ) -> Iterator[DirectoryScan]:
+        in_flight_limit = self.workers * 4
+        backlog: deque[tuple[str, int]] = deque()
+        pending: set[Future] = {pool.submit(self._scan, root, 0, ordered, with_stat)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                scan = future.result()
+                yield scan
+                for child in self._subdirectories(scan, max_depth, should_descend):
+                    backlog.append((child, scan.depth + 1))
+            while backlog and len(pending) < in_flight_limit:
+                path, depth = backlog.pop()
+                pending.add(pool.submit(self._scan, path, depth, ordered, with_stat))
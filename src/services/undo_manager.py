@@ -1,4 +1,6 @@
+import os
 import shutil
+import stat
 import json
 from datetime import datetime
 from pathlib import Path
@@ -6,6 +8,8 @@ from logging import Logger
 from typing import Optional
 from enum import Enum
 
+from src.services.file_mover import FileMover
+
 
 class OperationType(str, Enum):
     RM = "rm"
@@ -43,6 +47,7 @@ class UndoManager:
         self.undo_file = undo_file or Path.home() / ".console_app_undo.json"
         self.max_undo = max_undo
         self._undo_stack: list[UndoOperation] = []
+        self._trash_dirs: set[Path] = set()
         self._backup_dir = Path.home() / ".console_app_backups"
         self._backup_dir.mkdir(exist_ok=True)
         self._load_undo_stack()
@@ -61,7 +66,10 @@ class UndoManager:
                             backup_path=Path(op_data['backup_path']) if op_data.get('backup_path') else None,
                             metadata=op_data.get('metadata', {})
                         )
+                        if op_data.get('timestamp'):
+                            op.timestamp = datetime.fromisoformat(op_data['timestamp'])
                         self._undo_stack.append(op)
+                    self._trash_dirs = {Path(trash_dir) for trash_dir in data.get('trash_dirs', [])}
                     if len(self._undo_stack) > self.max_undo:
                         self._undo_stack = self._undo_stack[-self.max_undo:]
             except Exception as e:
@@ -83,7 +91,10 @@ class UndoManager:
                     "timestamp": op.timestamp.isoformat()
                 })
             with open(self.undo_file, 'w') as f:
-                json.dump({"operations": operations}, f, indent=2)
+                json.dump({
+                    "operations": operations,
+                    "trash_dirs": sorted(str(trash_dir) for trash_dir in self._trash_dirs)
+                }, f, indent=2)
         except Exception as e:
             self._logger.error(f"Failed to save undo stack: {e}")
     
@@ -99,6 +110,59 @@ class UndoManager:
         
         return backup_path
     
+    def _trash_dir_for(self, path: Path) -> Path | None:
+        device = path.lstat().st_dev
+        if self._backup_dir.stat().st_dev == device:
+            return self._backup_dir
+        
+        mount_point = Path(os.path.realpath(path.parent))
+        if mount_point.stat().st_dev != device:
+            return None
+        while mount_point.parent != mount_point and mount_point.parent.stat().st_dev == device:
+            mount_point = mount_point.parent
+        
+        trash_dir = mount_point / f".console_app_trash-{os.getuid() if hasattr(os, 'getuid') else 0}"
+        try:
+            trash_dir.mkdir(mode=0o700)
+        except FileExistsError:
+            pass
+        except OSError as e:
+            self._logger.info(f"Cannot create trash directory {trash_dir}: {e}")
+            return None
+        trash_stat = trash_dir.lstat()
+        if not stat.S_ISDIR(trash_stat.st_mode) or (hasattr(os, "getuid") and trash_stat.st_uid != os.getuid()):
+            self._logger.warning(f"Refusing to use trash directory {trash_dir}: not a private directory")
+            return None
+        self._trash_dirs.add(trash_dir)
+        return trash_dir
+    
+    def move_to_trash(self, path: Path, recursive: bool = False) -> bool:
+        try:
+            trash_dir = self._trash_dir_for(path)
+        except OSError as e:
+            self._logger.info(f"Cannot find trash directory for {path}: {e}")
+            return False
+        if trash_dir is None:
+            return False
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        trashed_path = trash_dir / f"{path.name}_{timestamp}"
+        try:
+            os.rename(path, trashed_path)
+        except OSError as e:
+            self._logger.info(f"Cannot move {path} to trash: {e}")
+            return False
+        
+        op = UndoOperation(
+            operation_type=OperationType.RM,
+            source=path,
+            backup_path=trashed_path,
+            metadata={"recursive": recursive, "trashed": True}
+        )
+        self._undo_stack.append(op)
+        self._save_undo_stack()
+        return True
+    
     def register_rm(self, path: Path, recursive: bool = False) -> bool:
         if not path.exists():
             return False
@@ -122,20 +186,14 @@ class UndoManager:
         if not source.exists():
             return False
         
-        try:
-            backup_path = self._create_backup(source)
-            op = UndoOperation(
-                operation_type=OperationType.MV,
-                source=source,
-                destination=destination,
-                backup_path=backup_path
-            )
-            self._undo_stack.append(op)
-            self._save_undo_stack()
-            return True
-        except Exception as e:
-            self._logger.error(f"Failed to register mv operation: {e}")
-            return False
+        op = UndoOperation(
+            operation_type=OperationType.MV,
+            source=source,
+            destination=destination
+        )
+        self._undo_stack.append(op)
+        self._save_undo_stack()
+        return True
     
     def register_mkdir(self, path: Path) -> bool:
         op = UndoOperation(
@@ -169,20 +227,20 @@ class UndoManager:
         if not source.exists():
             return False
         
-        try:
-            backup_path = self._create_backup(source)
-            op = UndoOperation(
-                operation_type=operation_type,
-                source=source,
-                destination=destination,
-                backup_path=backup_path
-            )
-            self._undo_stack.append(op)
-            self._save_undo_stack()
-            return True
-        except Exception as e:
-            self._logger.error(f"Failed to register archive operation: {e}")
-            return False
+        op = UndoOperation(
+            operation_type=operation_type,
+            source=source,
+            destination=destination
+        )
+        self._undo_stack.append(op)
+        self._save_undo_stack()
+        return True
+    
+    def backup_locations(self) -> list[Path]:
+        return [self._backup_dir, *sorted(self._trash_dirs)]
+    
+    def referenced_backups(self) -> dict[Path, datetime]:
+        return {op.backup_path: op.timestamp for op in self._undo_stack if op.backup_path is not None}
     
     def can_undo(self) -> bool:
         return len(self._undo_stack) > 0
@@ -196,13 +254,16 @@ class UndoManager:
         
         try:
             if op.operation_type == OperationType.RM:
-                if op.backup_path and op.backup_path.exists():
+                if op.backup_path and op.backup_path.exists(follow_symlinks=False):
                     if op.source.exists():
                         if op.source.is_dir():
                             shutil.rmtree(op.source)
                         else:
                             op.source.unlink()
                     op.source.parent.mkdir(parents=True, exist_ok=True)
+                    if op.metadata.get("trashed"):
+                        os.rename(op.backup_path, op.source)
+                        return f"Restored {op.source} from trash"
                     if op.backup_path.is_file():
                         shutil.copy2(op.backup_path, op.source)
                     else:
@@ -215,7 +276,7 @@ class UndoManager:
                 if op.destination and op.destination.exists():
                     if op.source.exists():
                         op.source.unlink()
-                    op.destination.rename(op.source)
+                    FileMover(self._logger).move(op.destination, op.source)
                     return f"Moved {op.destination} back to {op.source}"
                 else:
                     return f"Cannot undo: destination not found {op.destination}"
@@ -0,0 +1,87 @@
+import errno
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+
+WC_CHUNK_SIZE = 4 * 1024 * 1024
+WHITESPACE = b" \t\n\r\x0b\x0c"
+_WORD_TABLE = bytes(0x20 if byte in WHITESPACE else 0x78 for byte in range(256))
+
+
+@dataclass
+class WordCount:
+    path: str
+    lines: int = 0
+    words: int = 0
+    size: int = 0
+    error: str | None = None
+
+
+def count_file(path: str, chunk_size: int = WC_CHUNK_SIZE, count_words: bool = True) -> tuple[int, int, int]:
+    lines = words = size = 0
+    in_word = False
+    if os.path.isdir(path):
+        raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(chunk_size):
+            size += len(chunk)
+            lines += chunk.count(b"\n")
+            if not count_words:
+                continue
+            shape = chunk.translate(_WORD_TABLE)
+            words += shape.count(b" x")
+            if shape[0] == 0x78 and not in_word:
+                words += 1
+            in_word = shape[-1] == 0x78
+    return lines, words, size
+
+
+def _count_file_safely(
+    path: str,
+    chunk_size: int,
+    count_words: bool,
+) -> tuple[str, tuple[int, int, int] | None, str | None]:
+    try:
+        return path, count_file(path, chunk_size, count_words), None
+    except OSError as e:
+        return path, None, e.strerror or str(e)
+
+
+class WordCounter:
+
+    def __init__(self, logger: Logger, workers: int | None = None, chunk_size: int = WC_CHUNK_SIZE):
+        self._logger = logger
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+
+    def count(self, paths: list[PathLike[str] | str], count_words: bool = True) -> Iterator[WordCount]:
+        paths = [os.fspath(path) for path in paths]
+        if len(paths) == 1 or self.workers == 1:
+            results = (_count_file_safely(path, self.chunk_size, count_words) for path in paths)
+            return self._emit(results)
+        return self._count_parallel(paths, count_words)
+
+    def _count_parallel(self, paths: list[str], count_words: bool) -> Iterator[WordCount]:
+        context = multiprocessing.get_context("spawn")
+        workers = min(self.workers, len(paths))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            results = pool.map(
+                _count_file_safely,
+                paths,
+                [self.chunk_size] * len(paths),
+                [count_words] * len(paths),
+            )
+            yield from self._emit(results)
+
+    def _emit(self, results: Iterable[tuple[str, tuple[int, int, int] | None, str | None]]) -> Iterator[WordCount]:
+        for path, counts, error in results:
+            if error is not None:
+                self._logger.warning(f"Cannot count {path}: {error}")
+                yield WordCount(path=path, error=error)
+                continue
+            lines, words, size = counts
+            yield WordCount(path=path, lines=lines, words=words, size=size)
@@ -42,6 +42,24 @@ def mock_logging():
     with patch('src.main.logging.config.dictConfig'):
         yield
 
+@pytest.fixture(autouse=True)
+def mock_background_purge():
+    with patch('src.main.spawn_background_purge') as spawn:
+        yield spawn
+
 @pytest.fixture
 def runner():
-    return CliRunner()
\ No newline at end of file
+    return CliRunner()
+
+@pytest.fixture
+def temp_ls_cache_dir(tmp_path):
+    return tmp_path / ".console_app_ls_cache"
+
+
+@pytest.fixture
+def temp_du_cache_file(tmp_path):
+    return tmp_path / ".console_app_du_cache.json"
+
+@pytest.fixture
+def temp_line_index_dir(tmp_path):
+    return tmp_path / ".console_app_line_index"
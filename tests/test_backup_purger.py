@@ -0,0 +1,136 @@
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.services.backup_purger import BackupPurger, spawn_background_purge
+from src.services.undo_manager import UndoManager
+
+
+class TestBackupPurger:
+
+    @pytest.fixture
+    def manager(self, mock_logger, temp_undo_file, temp_backup_dir):
+        manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        manager._backup_dir = temp_backup_dir
+        return manager
+
+    def _trash(self, manager, tmp_path, name, size, age_days=0):
+        path = tmp_path / name
+        path.write_bytes(os.urandom(size))
+        manager.move_to_trash(path)
+        op = manager._undo_stack[-1]
+        op.timestamp = datetime.now() - timedelta(days=age_days)
+        return op.backup_path
+
+    def test_purges_backups_older_than_max_age(self, mock_logger, manager, tmp_path):
+        old = self._trash(manager, tmp_path, "old.txt", 4096, age_days=40)
+        new = self._trash(manager, tmp_path, "new.txt", 4096, age_days=1)
+        purger = BackupPurger(mock_logger, manager, max_age_days=30)
+
+        stats = purger.purge()
+
+        assert not old.exists()
+        assert new.exists()
+        assert (stats.removed, stats.kept) == (1, 1)
+
+    def test_evicts_oldest_first_until_under_quota(self, mock_logger, manager, tmp_path):
+        oldest = self._trash(manager, tmp_path, "a.bin", 64 * 1024, age_days=3)
+        middle = self._trash(manager, tmp_path, "b.bin", 64 * 1024, age_days=2)
+        newest = self._trash(manager, tmp_path, "c.bin", 64 * 1024, age_days=1)
+        purger = BackupPurger(mock_logger, manager, max_size=150 * 1024)
+
+        stats = purger.purge()
+
+        assert not oldest.exists()
+        assert middle.exists() and newest.exists()
+        assert stats.removed == 1
+        assert stats.kept_size <= 150 * 1024
+
+    def test_removes_orphans_after_grace_period(self, mock_logger, manager, temp_backup_dir):
+        orphan_dir = temp_backup_dir / "orphan_dir"
+        (orphan_dir / "nested").mkdir(parents=True)
+        (orphan_dir / "nested" / "file.txt").write_text("data")
+        purger = BackupPurger(mock_logger, manager)
+
+        with patch("src.services.backup_purger.time.time", return_value=time.time() + 3600):
+            stats = purger.purge()
+
+        assert not orphan_dir.exists()
+        assert stats.removed == 1
+
+    def test_fresh_orphans_are_kept(self, mock_logger, manager, temp_backup_dir):
+        fresh = temp_backup_dir / "just_trashed"
+        fresh.touch()
+        purger = BackupPurger(mock_logger, manager)
+
+        stats = purger.purge()
+
+        assert fresh.exists()
+        assert stats.removed == 0
+
+    def test_dry_run_keeps_everything(self, mock_logger, manager, tmp_path):
+        old = self._trash(manager, tmp_path, "old.txt", 4096, age_days=40)
+        purger = BackupPurger(mock_logger, manager, max_age_days=30)
+
+        stats = purger.purge(dry_run=True)
+
+        assert old.exists()
+        assert stats.removed == 1
+        assert stats.freed > 0
+
+    def test_scans_recorded_trash_dirs(self, mock_logger, manager, tmp_path):
+        trash_dir = tmp_path / ".console_app_trash-0"
+        trash_dir.mkdir()
+        (trash_dir / "stale").touch()
+        manager._trash_dirs.add(trash_dir)
+        purger = BackupPurger(mock_logger, manager)
+
+        with patch.object(purger, "ORPHAN_GRACE_SECONDS", -1):
+            purger.purge()
+
+        assert not (trash_dir / "stale").exists()
+
+
+class TestSpawnBackgroundPurge:
+
+    def test_spawns_detached_process_and_touches_stamp(self, mock_logger, tmp_path):
+        stamp = tmp_path / ".console_app_gc_stamp"
+
+        with patch("src.services.backup_purger.subprocess.Popen") as popen:
+            assert spawn_background_purge(mock_logger, stamp_file=stamp) is True
+
+        assert stamp.exists()
+        command = popen.call_args.args[0]
+        assert command[-3:] == ["src.main", "gc", "--background"]
+
+    def test_runs_in_callers_directory(self, mock_logger, tmp_path):
+        with patch("src.services.backup_purger.subprocess.Popen") as popen:
+            spawn_background_purge(mock_logger, stamp_file=tmp_path / ".console_app_gc_stamp")
+
+        options = popen.call_args.kwargs
+        assert "cwd" not in options
+        assert str(Path(__file__).resolve().parents[1]) in options["env"]["PYTHONPATH"].split(os.pathsep)
+
+    @pytest.mark.parametrize("value", ["0", "false", "off"])
+    def test_disabled_by_environment(self, mock_logger, tmp_path, monkeypatch, value):
+        stamp = tmp_path / ".console_app_gc_stamp"
+        monkeypatch.setenv("CONSOLE_APP_AUTO_GC", value)
+
+        with patch("src.services.backup_purger.subprocess.Popen") as popen:
+            assert spawn_background_purge(mock_logger, stamp_file=stamp) is False
+
+        popen.assert_not_called()
+        assert not stamp.exists()
+
+    def test_skips_when_stamp_is_recent(self, mock_logger, tmp_path):
+        stamp = tmp_path / ".console_app_gc_stamp"
+        stamp.touch()
+
+        with patch("src.services.backup_purger.subprocess.Popen") as popen:
+            assert spawn_background_purge(mock_logger, stamp_file=stamp, interval=3600) is False
+
+        popen.assert_not_called()
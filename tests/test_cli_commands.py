@@ -1,10 +1,13 @@
 """Тесты для основных команд CLI."""
+import errno
+import gzip
 from pathlib import Path
 from unittest.mock import patch, Mock
 import pytest
 from typer.testing import CliRunner
 
 from src.main import app
+from src.services.file_mover import MoveInterrupted
 
 
 class TestMainCommandsSimplified:
@@ -22,6 +25,116 @@ class TestMainCommandsSimplified:
         assert "file1.txt" in result.stdout
         assert "file2.txt" in result.stdout
 
+    def test_ls_numeric_ids_integration(self, runner, tmp_path):
+        test_file = tmp_path / "file.txt"
+        test_file.touch()
+        
+        result = runner.invoke(app, ["ls", "-l", "-n", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert f" {test_file.stat().st_uid} " in result.stdout
+        assert "file.txt" in result.stdout
+
+    def test_ls_chunked_long_integration(self, runner, tmp_path):
+        for i in range(5):
+            (tmp_path / f"file{i}.txt").touch()
+        
+        result = runner.invoke(app, ["ls", "-l", "--chunk-size", "2", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert all(f"file{i}.txt" in result.stdout for i in range(5))
+
+    def test_ls_recursive_integration(self, runner, tmp_path):
+        (tmp_path / "sub" / "nested").mkdir(parents=True)
+        (tmp_path / "sub" / "nested" / "deep.txt").touch()
+        (tmp_path / "top.txt").touch()
+        
+        result = runner.invoke(app, ["ls", "-R", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert result.stdout.index(f"{tmp_path}:") < result.stdout.index(f"{tmp_path / 'sub'}:")
+        assert result.stdout.index(f"{tmp_path / 'sub'}:") < result.stdout.index(f"{tmp_path / 'sub' / 'nested'}:")
+        assert "deep.txt" in result.stdout
+
+    def test_ls_recursive_depth_integration(self, runner, tmp_path):
+        (tmp_path / "sub" / "nested").mkdir(parents=True)
+        
+        result = runner.invoke(app, ["ls", "-R", "--depth", "1", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert f"{tmp_path / 'sub'}:" in result.stdout
+        assert f"{tmp_path / 'sub' / 'nested'}:" not in result.stdout
+
+    def test_ls_sort_size_limit_integration(self, runner, tmp_path):
+        (tmp_path / "small.txt").write_bytes(b"x")
+        (tmp_path / "large.txt").write_bytes(b"x" * 100)
+        (tmp_path / "medium.txt").write_bytes(b"x" * 10)
+        
+        result = runner.invoke(app, ["ls", "--sort", "size", "--limit", "2", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == ["large.txt", "medium.txt"]
+
+    def test_ls_no_cache_integration(self, runner, tmp_path):
+        (tmp_path / "file.txt").touch()
+        
+        with patch("src.services.listing_cache.ListingCache.scan", side_effect=AssertionError):
+            result = runner.invoke(app, ["ls", "-l", "--no-cache", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert "file.txt" in result.stdout
+
+    def test_du_command_integration(self, runner, tmp_path):
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(b"x" * 2048)
+        
+        result = runner.invoke(app, ["du", "--apparent-size", "--no-cache", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout.strip() == f"2048\t{test_file}"
+
+    def test_du_human_readable_integration(self, runner, tmp_path):
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(b"x" * 2048)
+        
+        result = runner.invoke(app, ["du", "--apparent-size", "-h", "--no-cache", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout.startswith("2.0K")
+
+    def test_find_command_integration(self, runner, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "match.log").touch()
+        (tmp_path / "other.txt").touch()
+        
+        result = runner.invoke(app, ["find", str(tmp_path), "--name", "*.log", "--type", "f"])
+        
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [str(tmp_path / "sub" / "match.log")]
+
+    def test_find_negative_mtime_integration(self, runner, tmp_path):
+        (tmp_path / "fresh.txt").touch()
+        
+        result = runner.invoke(app, ["find", str(tmp_path), "--mtime", "-1", "--name", "*.txt"])
+        
+        assert result.exit_code == 0
+        assert str(tmp_path / "fresh.txt") in result.stdout
+
+    def test_grep_command_integration(self, runner, tmp_path):
+        test_file = tmp_path / "app.log"
+        test_file.write_text("first\nneedle here\nlast\n")
+        
+        result = runner.invoke(app, ["grep", "needle", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout == f"{test_file}:2:needle here\n"
+
+    def test_grep_directory_requires_recursive(self, runner, tmp_path):
+        result = runner.invoke(app, ["grep", "needle", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert "is not a file" in result.stdout
+
     def test_cat_command_integration(self, runner, tmp_path):
         test_file = tmp_path / "test.txt"
         content = "Hello, World!"
@@ -32,6 +145,95 @@ class TestMainCommandsSimplified:
         assert result.exit_code == 0
         assert content in result.stdout
 
+    def test_cat_bytes_command_integration(self, runner, tmp_path):
+        test_file = tmp_path / "test.bin"
+        test_file.write_bytes(b"\x00binary\xff")
+        
+        result = runner.invoke(app, ["cat", "-b", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout_bytes == b"\x00binary\xff"
+
+    def test_cat_lines_command_integration(self, runner, tmp_path):
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("one\ntwo\nthree\nfour\n")
+        
+        result = runner.invoke(app, ["cat", "--lines", "2:3", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout == "two\nthree\n"
+
+    def test_cat_invalid_lines_integration(self, runner, tmp_path):
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("one\n")
+        
+        result = runner.invoke(app, ["cat", "--lines", "3:1", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert "Invalid line range" in result.stdout
+
+    def test_cat_decompress_integration(self, runner, tmp_path):
+        test_file = tmp_path / "app.log.gz"
+        test_file.write_bytes(gzip.compress(b"compressed line\n"))
+        
+        result = runner.invoke(app, ["cat", "-z", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout == "compressed line\n"
+
+    def test_head_command_integration(self, runner, tmp_path):
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("one\ntwo\nthree\n")
+        
+        result = runner.invoke(app, ["head", "-n", "2", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout == "one\ntwo\n"
+
+    def test_tail_command_integration(self, runner, tmp_path):
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("one\ntwo\nthree\n")
+        
+        result = runner.invoke(app, ["tail", "-n", "2", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout == "two\nthree\n"
+
+    def test_wc_command_integration(self, runner, tmp_path):
+        first = tmp_path / "first.txt"
+        first.write_text("one two\nthree\n")
+        second = tmp_path / "second.txt"
+        second.write_text("four\n")
+        
+        result = runner.invoke(app, ["wc", "--workers", "1", str(first), str(second)])
+        
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0].split() == ["2", "3", "14", str(first)]
+        assert lines[2].split() == ["3", "4", "19", "total"]
+
+    def test_wc_reports_missing_file_and_counts_the_rest(self, runner, tmp_path):
+        missing = tmp_path / "missing.txt"
+        present = tmp_path / "present.txt"
+        present.write_text("four\n")
+        
+        result = runner.invoke(app, ["wc", "--workers", "1", str(missing), str(present)])
+        
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == f"{missing}: No such file or directory"
+        assert lines[1].split() == ["1", "1", "5", str(present)]
+        assert lines[2].split() == ["1", "1", "5", "total"]
+
+    def test_wc_lines_only_integration(self, runner, tmp_path):
+        test_file = tmp_path / "lines.txt"
+        test_file.write_text("a\nb\n")
+        
+        result = runner.invoke(app, ["wc", "-l", str(test_file)])
+        
+        assert result.exit_code == 0
+        assert result.stdout.split() == ["2", str(test_file)]
+
     def test_mkdir_command_integration(self, runner, tmp_path):
         new_dir = tmp_path / "newdir"
         
@@ -70,6 +272,28 @@ class TestMainCommandsSimplified:
         assert result.exit_code == 0
         assert not test_dir.exists()
 
+    def test_rm_permanent_reports_stats_integration(self, runner, tmp_path):
+        test_dir = tmp_path / "testdir"
+        test_dir.mkdir()
+        (test_dir / "file.txt").touch()
+        
+        result = runner.invoke(app, ["rm", "-r", "-f", "--permanent", str(test_dir)])
+        
+        assert result.exit_code == 0
+        assert not test_dir.exists()
+        assert "1 files, 1 directories" in result.stdout
+
+    def test_rm_cancelled_leaves_no_backup_integration(self, runner, tmp_path):
+        test_dir = tmp_path / "testdir"
+        test_dir.mkdir()
+        
+        with patch("src.services.undo_manager.UndoManager.move_to_trash") as move_to_trash:
+            result = runner.invoke(app, ["rm", "-r", str(test_dir)], input="n\n")
+        
+        assert "Removal cancelled" in result.stdout
+        assert test_dir.exists()
+        move_to_trash.assert_not_called()
+
     def test_mv_command_integration(self, runner, tmp_path):
         source = tmp_path / "source.txt"
         dest = tmp_path / "dest.txt"
@@ -82,6 +306,36 @@ class TestMainCommandsSimplified:
         assert dest.exists()
         assert "Moved file:" in result.stdout
 
+    def test_mv_across_filesystems_reports_copy(self, runner, tmp_path):
+        source = tmp_path / "tree"
+        source.mkdir()
+        (source / "a.txt").write_text("abc")
+        destination = tmp_path / "moved"
+        
+        with patch("src.services.file_mover.os.rename", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            result = runner.invoke(app, ["mv", str(source), str(destination)])
+        
+        assert result.exit_code == 0
+        assert "Copied across filesystems: 1 files, 3B" in result.stdout
+        assert (destination / "a.txt").read_text() == "abc"
+        assert not source.exists()
+
+    @pytest.mark.parametrize("phase, message", [
+        ("copy", "source intact, partial copy removed"),
+        ("remove", "partially removed"),
+    ])
+    def test_mv_interrupted_reports_phase(self, runner, tmp_path, phase, message):
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        destination = tmp_path / "dest.txt"
+        interrupted = MoveInterrupted(phase, str(source), str(destination))
+        
+        with patch("src.services.file_mover.FileMover.move", side_effect=interrupted):
+            result = runner.invoke(app, ["mv", str(source), str(destination)])
+        
+        assert result.exit_code == 0
+        assert message in result.stdout
+
     def test_cp_command_integration(self, runner, tmp_path):
         source = tmp_path / "source.txt"
         dest = tmp_path / "dest.txt"
@@ -95,6 +349,75 @@ class TestMainCommandsSimplified:
         assert dest.exists()
         assert dest.read_text() == content
 
+    def test_cp_reflink_never_integration(self, runner, tmp_path):
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        destination = tmp_path / "dest.txt"
+        
+        result = runner.invoke(app, ["cp", "--reflink", "never", str(source), str(destination)])
+        
+        assert result.exit_code == 0
+        assert destination.read_text() == "content"
+
+    def test_cp_recursive_reports_throughput(self, runner, tmp_path):
+        source = tmp_path / "tree"
+        (source / "nested").mkdir(parents=True)
+        (source / "a.txt").write_text("a")
+        (source / "nested" / "b.txt").write_text("bb")
+        destination = tmp_path / "copy"
+        
+        result = runner.invoke(app, ["cp", "-r", "--workers", "2", str(source), str(destination)])
+        
+        assert result.exit_code == 0
+        assert (destination / "nested" / "b.txt").read_text() == "bb"
+        assert "2 files, 2 directories, 3B in" in result.stdout
+
+    def test_cp_update_skips_unchanged_and_keeps_undo_history(self, runner, tmp_path):
+        source = tmp_path / "tree"
+        source.mkdir()
+        (source / "a.txt").write_text("a")
+        (source / "b.txt").write_text("b")
+        backups = tmp_path / "backups"
+        backups.mkdir()
+        destination = backups / "tree"
+        runner.invoke(app, ["cp", "-r", str(source), str(backups)])
+        (source / "b.txt").write_text("bb")
+        (destination / "extra.txt").write_text("x")
+        
+        with patch("src.main.UndoManager.register_cp") as register_cp:
+            result = runner.invoke(app, ["cp", "-r", "-u", "--delete", str(source), str(backups)])
+        
+        assert result.exit_code == 0
+        assert "1 files" in result.stdout
+        assert "1 unchanged, 1 deleted" in result.stdout
+        assert (destination / "b.txt").read_text() == "bb"
+        assert not (destination / "extra.txt").exists()
+        register_cp.assert_not_called()
+
+    def test_cp_delete_requires_update(self, runner, tmp_path):
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        
+        result = runner.invoke(app, ["cp", "--delete", str(source), str(tmp_path / "dest.txt")])
+        
+        assert "require --update" in result.stdout
+        assert not (tmp_path / "dest.txt").exists()
+
+    def test_cp_resume_copies_file_and_rejects_directories(self, runner, tmp_path):
+        source = tmp_path / "big.bin"
+        source.write_bytes(b"x" * 10000)
+        destination = tmp_path / "copy.bin"
+        
+        result = runner.invoke(app, ["cp", "--resume", str(source), str(destination)])
+        
+        assert result.exit_code == 0
+        assert destination.read_bytes() == source.read_bytes()
+        assert not (tmp_path / "copy.bin.part").exists()
+        
+        result = runner.invoke(app, ["cp", "-r", "--resume", str(tmp_path), str(tmp_path.parent / "elsewhere")])
+        
+        assert "single files only" in result.stdout
+
     def test_zip_command_integration(self, runner, tmp_path):
         source = tmp_path / "test.txt"
         archive = tmp_path / "archive.zip"
@@ -131,6 +454,19 @@ class TestMainCommandsSimplified:
         assert result.exit_code == 0
         assert archive.exists()
 
+    def test_gc_quotas_come_from_environment(self, runner):
+        with patch("src.main.BackupPurger") as purger:
+            purger.return_value.purge.return_value = Mock(removed=0, freed=0, kept=0, kept_size=0)
+            result = runner.invoke(
+                app,
+                ["gc", "--dry-run"],
+                env={"CONSOLE_APP_GC_MAX_SIZE": "2k", "CONSOLE_APP_GC_MAX_AGE_DAYS": "3"},
+            )
+        
+        assert result.exit_code == 0
+        assert purger.call_args.kwargs["max_size"] == 2048
+        assert purger.call_args.kwargs["max_age_days"] == 3
+
     def test_history_command_integration(self, runner, tmp_path):
         # Run a command first
         test_file = tmp_path / "test.txt"
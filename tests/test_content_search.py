@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.services import content_search
+from src.services.content_search import ContentSearcher, search_file
+
+
+class TestContentSearch:
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        log_file.write_bytes(b"start\nERROR one ERROR two\nok\nerror three\nERROR four")
+        return log_file
+
+    def test_search_file_reports_line_numbers(self, log_file):
+        result = search_file(str(log_file), b"ERROR").matches
+
+        assert result == [(2, b"ERROR one ERROR two"), (5, b"ERROR four")]
+
+    def test_search_file_ignore_case(self, log_file):
+        result = search_file(str(log_file), b"error", ignore_case=True).matches
+
+        assert [line_number for line_number, _ in result] == [2, 4, 5]
+
+    def test_search_file_anchors_match_lines(self, log_file):
+        result = search_file(str(log_file), b"^ok$").matches
+
+        assert result == [(3, b"ok")]
+
+    def test_search_file_skips_binary_and_empty_files(self, tmp_path):
+        binary = tmp_path / "data.bin"
+        binary.write_bytes(b"ERROR\0\x01\x02")
+        empty = tmp_path / "empty.log"
+        empty.touch()
+
+        assert search_file(str(binary), b"ERROR").matches == []
+        assert search_file(str(empty), b"ERROR").matches == []
+
+    def test_search_file_across_chunk_boundaries(self, log_file):
+        expected = search_file(str(log_file), b"ERROR|ok").matches
+
+        with patch.object(content_search, "SEARCH_CHUNK_SIZE", 4):
+            assert search_file(str(log_file), b"ERROR|ok").matches == expected
+
+    @pytest.mark.parametrize("chunk_size", [10, 1024])
+    def test_empty_matches_are_not_reported_past_the_last_newline(self, tmp_path, chunk_size):
+        path = tmp_path / "rows.log"
+        path.write_bytes(b"".join(b"row%d\n" % i for i in range(1, 7)))
+
+        with patch.object(content_search, "SEARCH_CHUNK_SIZE", chunk_size):
+            result = search_file(str(path), b"^").matches
+
+        assert result == [(i, b"row%d" % i) for i in range(1, 7)]
+
+    def test_empty_line_pattern_matches_like_grep(self, tmp_path):
+        path = tmp_path / "blank.log"
+        path.write_bytes(b"a\n\nb\n")
+
+        assert search_file(str(path), b"^$").matches == [(2, b"")]
+        assert search_file(str(path), rb"\d*$").matches == [(1, b"a"), (2, b""), (3, b"b")]
+
+    def test_search_file_returns_bounded_batches(self, tmp_path):
+        path = tmp_path / "many.log"
+        path.write_bytes(b"".join(b"hit %d\nmiss\n" % i for i in range(25)))
+
+        first = search_file(str(path), b"hit", max_matches=10)
+        second = search_file(str(path), b"hit", start=first.resume_offset, line_number=first.resume_line, max_matches=10)
+
+        assert [n for n, _ in first.matches] == list(range(1, 20, 2))
+        assert second.matches[0] == (21, b"hit 10")
+        assert second.resume_offset is not None
+
+    def test_search_resumes_batches_in_order(self, mock_logger, tmp_path):
+        path = tmp_path / "many.log"
+        path.write_bytes(b"".join(b"hit %d\n" % i for i in range(25)))
+        searcher = ContentSearcher(mock_logger)
+
+        with patch.object(content_search, "MATCH_BATCH_SIZE", 4):
+            result = list(searcher.search(path, "hit"))
+
+        assert [m.line_number for m in result] == list(range(1, 26))
+
+    def test_search_single_file(self, mock_logger, log_file):
+        searcher = ContentSearcher(mock_logger)
+
+        result = list(searcher.search(log_file, "four"))
+
+        assert [(m.path, m.line_number, m.line) for m in result] == [(str(log_file), 5, b"ERROR four")]
+
+    def test_search_tree_in_process_pool(self, mock_logger, tmp_path):
+        (tmp_path / "sub").mkdir()
+        for i in range(6):
+            (tmp_path / "sub" / f"file{i}.log").write_text(f"line\nneedle {i}\n")
+        (tmp_path / "skip.bin").write_bytes(b"needle\0")
+        searcher = ContentSearcher(mock_logger, workers=2)
+
+        result = list(searcher.search(tmp_path, "needle", recursive=True))
+
+        assert sorted(m.line for m in result) == [f"needle {i}".encode() for i in range(6)]
+        assert all(m.line_number == 2 for m in result)
+
+    def test_invalid_pattern_raises_value_error(self, mock_logger, log_file):
+        searcher = ContentSearcher(mock_logger)
+
+        with pytest.raises(ValueError):
+            searcher.search(log_file, "(")
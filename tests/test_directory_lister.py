@@ -0,0 +1,174 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+
+from src.enums.sort_key import SortKey
+from src.services import directory_lister
+from src.services.directory_lister import DirectoryLister, ListingEntry
+from src.services.tree_walker import DirectoryScan
+
+
+class TestDirectoryLister:
+
+    @pytest.fixture
+    def lister(self, mock_logger):
+        return DirectoryLister(mock_logger)
+
+    def test_scan_short_mode_skips_stat(self, lister, tmp_path):
+        (tmp_path / "file1.txt").touch()
+        (tmp_path / "file2.txt").touch()
+
+        entries = list(lister.scan(tmp_path))
+
+        assert sorted(e.name for e in entries) == ["file1.txt", "file2.txt"]
+        assert all(e.stat is None for e in entries)
+
+    def test_scan_with_stat_uses_lstat_data(self, lister, tmp_path):
+        (tmp_path / "file.txt").write_text("content")
+
+        entries = list(lister.scan(tmp_path, with_stat=True))
+
+        assert len(entries) == 1
+        assert entries[0].stat.st_size == len("content")
+        assert entries[0].link_target is None
+
+    def test_scan_with_stat_reads_symlink_target(self, lister, tmp_path):
+        (tmp_path / "target.txt").touch()
+        os.symlink("target.txt", tmp_path / "link")
+
+        entries = {e.name: e for e in lister.scan(tmp_path, with_stat=True)}
+
+        assert entries["link"].link_target == "target.txt"
+        assert entries["target.txt"].link_target is None
+
+    def test_format_long_does_not_use_path_lookups(self, lister, tmp_path):
+        (tmp_path / "file.txt").write_text("content")
+        entries = list(lister.scan(tmp_path, with_stat=True))
+
+        with patch.object(Path, "owner", side_effect=AssertionError), \
+                patch.object(Path, "group", side_effect=AssertionError), \
+                patch.object(Path, "stat", side_effect=AssertionError):
+            result = lister.format_long(entries)
+
+        assert len(result) == 1
+        assert result[0].startswith("-rw")
+        assert result[0].endswith("file.txt")
+
+    def test_format_long_shows_symlink_target(self, lister, tmp_path):
+        os.symlink("missing", tmp_path / "dangling")
+        entries = list(lister.scan(tmp_path, with_stat=True))
+
+        result = lister.format_long(entries)
+
+        assert result[0].endswith("dangling -> missing")
+
+    def test_format_long_handles_unstatable_entry(self, lister):
+        result = lister.format_long([ListingEntry(name="ghost", path="/nonexistent/ghost")])
+
+        assert result[0].startswith("-")
+        assert result[0].endswith("ghost")
+
+    def test_format_long_numeric_ids(self, lister, tmp_path):
+        (tmp_path / "file.txt").touch()
+        entries = list(lister.scan(tmp_path, with_stat=True))
+
+        with patch.object(directory_lister, "lookup_owner_name", side_effect=AssertionError):
+            result = lister.format_long(entries, numeric_ids=True)
+
+        file_stat = entries[0].stat
+        assert f" {file_stat.st_uid} " in result[0]
+        assert f" {file_stat.st_gid}  " in result[0]
+
+    @pytest.mark.skipif(directory_lister.pwd is None, reason="pwd module is not available")
+    def test_owner_lookup_is_cached(self, lister, tmp_path):
+        for i in range(5):
+            (tmp_path / f"file{i}.txt").touch()
+        entries = list(lister.scan(tmp_path, with_stat=True))
+        directory_lister.lookup_owner_name.cache_clear()
+
+        with patch.object(directory_lister.pwd, "getpwuid", wraps=directory_lister.pwd.getpwuid) as getpwuid:
+            lister.format_long(entries)
+            lister.format_long(entries)
+
+        assert getpwuid.call_count == 1
+
+    @pytest.fixture
+    def sized_entries(self, lister, tmp_path):
+        for name, size, mtime in [("a.txt", 30, 300), ("b.txt", 10, 100), ("c.txt", 20, 200)]:
+            path = tmp_path / name
+            path.write_bytes(b"x" * size)
+            os.utime(path, (mtime, mtime))
+        return list(lister.scan(tmp_path, with_stat=True))
+
+    def test_select_by_name(self, lister, sized_entries):
+        result = lister.select(sized_entries, SortKey.name)
+
+        assert [e.name for e in result] == ["a.txt", "b.txt", "c.txt"]
+
+    def test_select_by_size_largest_first(self, lister, sized_entries):
+        result = lister.select(sized_entries, SortKey.size)
+
+        assert [e.name for e in result] == ["a.txt", "c.txt", "b.txt"]
+
+    def test_select_by_mtime_newest_first_reversed(self, lister, sized_entries):
+        result = lister.select(sized_entries, SortKey.mtime, reverse=True)
+
+        assert [e.name for e in result] == ["b.txt", "c.txt", "a.txt"]
+
+    def test_select_limit_uses_heap(self, lister, sized_entries):
+        with patch("src.services.directory_lister.sorted", side_effect=AssertionError, create=True):
+            largest = lister.select(iter(sized_entries), SortKey.size, limit=2)
+            smallest = lister.select(iter(sized_entries), SortKey.size, reverse=True, limit=1)
+
+        assert [e.name for e in largest] == ["a.txt", "c.txt"]
+        assert [e.name for e in smallest] == ["b.txt"]
+
+    def test_iter_long_lines_chunks_are_lazy(self, lister, tmp_path):
+        (tmp_path / "file.txt").touch()
+        entry = next(lister.scan(tmp_path, with_stat=True))
+
+        def entries():
+            yield entry
+            yield entry
+            raise AssertionError("consumed past the first chunk")
+
+        lines = lister.iter_long_lines(entries(), chunk_size=2)
+
+        assert next(lines).endswith("file.txt")
+        assert next(lines).endswith("file.txt")
+
+    def test_iter_long_lines_aligns_columns_per_chunk(self, lister, tmp_path):
+        (tmp_path / "big").write_bytes(b"x" * 1000)
+        (tmp_path / "small").write_bytes(b"x")
+        entries = sorted(lister.scan(tmp_path, with_stat=True), key=lambda e: e.name)
+
+        result = list(lister.iter_long_lines(iter(entries), chunk_size=1))
+
+        assert " 1000 " in result[0]
+        assert "  1 " in result[1]
+        assert "    1 " not in result[1]
+
+    def test_iter_tree_lines_long_mode(self, lister, tmp_path):
+        (tmp_path / "file.txt").touch()
+        with os.scandir(tmp_path) as it:
+            scans = [DirectoryScan(path=str(tmp_path), depth=0, entries=list(it))]
+
+        result = list(lister.iter_tree_lines(scans, long=True))
+
+        assert result[0] == f"{tmp_path}:\n"
+        assert result[1].startswith("-rw")
+        assert result[1].endswith("file.txt\n")
+
+    def test_iter_tree_lines_reports_unreadable_directory(self, lister):
+        scans = [
+            DirectoryScan(path="/first", depth=0),
+            DirectoryScan(path="/denied", depth=1, error=PermissionError(13, "Permission denied")),
+        ]
+
+        result = list(lister.iter_tree_lines(scans))
+
+        assert result == ["/first:\n", "\n", "/denied:\n", "cannot open directory '/denied': Permission denied\n"]
+
+    def test_format_long_empty(self, lister):
+        assert lister.format_long([]) == []
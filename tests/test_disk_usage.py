@@ -0,0 +1,116 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.services.disk_usage import DiskUsageScanner
+
+
+class TestDiskUsageScanner:
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "tree"
+        (root / "a" / "nested").mkdir(parents=True)
+        (root / "b").mkdir()
+        (root / "top.bin").write_bytes(b"x" * 100)
+        (root / "a" / "one.bin").write_bytes(b"x" * 10)
+        (root / "a" / "nested" / "two.bin").write_bytes(b"x" * 20)
+        (root / "b" / "three.bin").write_bytes(b"x" * 30)
+        for directory in [root, root / "a", root / "a" / "nested", root / "b"]:
+            os.utime(directory, (1_000_000, 1_000_000))
+        return root
+
+    def _directory_sizes(self, root):
+        return sum(os.lstat(d).st_size for d, _, _ in os.walk(root))
+
+    def test_scan_totals(self, mock_logger, tree, temp_du_cache_file):
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file, workers=4)
+
+        usage = scanner.scan(tree)
+
+        assert usage.files == 4
+        assert usage.directories == 4
+        assert usage.apparent_size == 160 + self._directory_sizes(tree)
+        assert usage.allocated_size > 0
+
+    def test_hardlinks_are_counted_once(self, mock_logger, tree, temp_du_cache_file):
+        os.link(tree / "top.bin", tree / "b" / "top-link.bin")
+        os.utime(tree / "b", (1_000_000, 1_000_000))
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file)
+
+        usage = scanner.scan(tree)
+
+        assert usage.files == 4
+        assert usage.apparent_size == 160 + self._directory_sizes(tree)
+
+    def test_scan_single_file(self, mock_logger, tree, temp_du_cache_file):
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file)
+
+        usage = scanner.scan(tree / "top.bin")
+
+        assert usage.files == 1
+        assert usage.apparent_size == 100
+
+    def test_repeat_scan_only_rescans_changed_directories(self, mock_logger, tree, temp_du_cache_file):
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file)
+        first = scanner.scan(tree)
+
+        unchanged = scanner.scan(tree)
+        (tree / "a" / "nested" / "new.bin").write_bytes(b"x" * 5)
+        os.utime(tree / "a" / "nested", (2_000_000, 2_000_000))
+        changed = scanner.scan(tree)
+
+        assert first.rescanned_directories == 4
+        assert unchanged.rescanned_directories == 0
+        assert unchanged.apparent_size == first.apparent_size
+        assert changed.rescanned_directories == 1
+        assert changed.apparent_size == first.apparent_size + 5
+        assert changed.files == first.files + 1
+
+    def test_removed_directories_are_dropped_from_cache(self, mock_logger, tree, temp_du_cache_file):
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file)
+        scanner.scan(tree)
+        (tree / "b" / "three.bin").unlink()
+        (tree / "b").rmdir()
+        os.utime(tree, (2_000_000, 2_000_000))
+
+        usage = scanner.scan(tree)
+
+        assert usage.directories == 3
+        assert str(tree / "b") not in temp_du_cache_file.read_text()
+
+    def test_recently_modified_directory_is_not_cached(self, mock_logger, tree, temp_du_cache_file):
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file)
+        (tree / "b" / "fresh.bin").touch()
+        scanner.scan(tree)
+
+        usage = scanner.scan(tree)
+
+        assert usage.rescanned_directories == 1
+
+    def test_no_cache_does_not_write_cache_file(self, mock_logger, tree, temp_du_cache_file):
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file)
+
+        scanner.scan(tree, use_cache=False)
+
+        assert not temp_du_cache_file.exists()
+
+    def test_cache_evicts_least_recently_used_directories(self, mock_logger, tree, temp_du_cache_file, tmp_path):
+        other = tmp_path / "other"
+        (other / "sub").mkdir(parents=True)
+        for directory in [other, other / "sub"]:
+            os.utime(directory, (1_000_000, 1_000_000))
+        scanner = DiskUsageScanner(mock_logger, cache_file=temp_du_cache_file, max_entries=4)
+
+        with patch("src.services.disk_usage.time.time", return_value=5_000_000):
+            scanner.scan(tree)
+        with patch("src.services.disk_usage.time.time", return_value=6_000_000):
+            scanner.scan(other)
+        cached = json.loads(temp_du_cache_file.read_text())["directories"]
+
+        assert len(cached) == 4
+        assert str(other) in cached and str(other / "sub") in cached
+        assert scanner.scan(other).rescanned_directories == 0
+        assert scanner.scan(tree).rescanned_directories == 2
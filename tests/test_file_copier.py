@@ -0,0 +1,136 @@
+import errno
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from src.enums.reflink_mode import ReflinkMode
+from src.services import file_copier
+from src.services.file_copier import FileCopier
+
+
+class TestFileCopier:
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        path = tmp_path / "source.bin"
+        path.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+        path.chmod(0o640)
+        return path
+
+    def _assert_copied(self, source, destination):
+        assert destination.read_bytes() == source.read_bytes()
+        assert destination.stat().st_mtime == source.stat().st_mtime
+        assert destination.stat().st_mode == source.stat().st_mode
+
+    @pytest.mark.parametrize("reflink", [ReflinkMode.auto, ReflinkMode.never])
+    def test_copy_file_preserves_data_and_metadata(self, mock_logger, source, tmp_path, reflink):
+        destination = tmp_path / "copy.bin"
+
+        result = FileCopier(mock_logger, reflink=reflink).copy_file(source, destination)
+
+        self._assert_copied(source, destination)
+        assert result.size == source.stat().st_size
+        if reflink == ReflinkMode.never:
+            assert result.method != "reflink"
+
+    def test_reflink_is_used_when_clone_succeeds(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.bin"
+
+        def fake_clone(dst_fd, request, src_fd):
+            assert request == file_copier.FICLONE
+            os.write(dst_fd, os.pread(src_fd, source.stat().st_size, 0))
+
+        with patch.object(file_copier, "REFLINK_SUPPORTED", True), \
+                patch.object(file_copier, "fcntl") as fcntl:
+            fcntl.ioctl.side_effect = fake_clone
+            result = FileCopier(mock_logger).copy_file(source, destination)
+
+        assert result.method == "reflink"
+        self._assert_copied(source, destination)
+
+    def test_reflink_always_fails_when_clone_is_unsupported(self, mock_logger, source, tmp_path):
+        with patch.object(file_copier, "REFLINK_SUPPORTED", True), \
+                patch.object(file_copier, "fcntl") as fcntl:
+            fcntl.ioctl.side_effect = OSError(errno.EOPNOTSUPP, "Operation not supported")
+            with pytest.raises(OSError, match="Reflink copy failed"):
+                FileCopier(mock_logger, reflink=ReflinkMode.always).copy_file(source, tmp_path / "copy.bin")
+
+    def test_falls_back_to_userspace_copy(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.bin"
+        unsupported = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with patch.object(file_copier, "REFLINK_SUPPORTED", False), \
+                patch.object(file_copier, "SENDFILE_COPY_SUPPORTED", True), \
+                patch.object(file_copier.os, "copy_file_range", side_effect=unsupported, create=True), \
+                patch.object(file_copier.os, "sendfile", side_effect=unsupported):
+            result = FileCopier(mock_logger).copy_file(source, destination)
+
+        assert result.method == "userspace"
+        self._assert_copied(source, destination)
+
+    def test_kernel_error_after_partial_copy_is_raised(self, mock_logger, source, tmp_path):
+        calls = []
+
+        def partial(src_fd, dst_fd, count):
+            if calls:
+                raise OSError(errno.EINVAL, "Invalid argument")
+            calls.append(count)
+            return 1024
+
+        with patch.object(file_copier, "REFLINK_SUPPORTED", False), \
+                patch.object(file_copier.os, "copy_file_range", side_effect=partial, create=True):
+            with pytest.raises(OSError):
+                FileCopier(mock_logger).copy_file(source, tmp_path / "copy.bin")
+
+    def test_empty_source_is_copied_through_userspace(self, mock_logger, tmp_path):
+        source = tmp_path / "empty"
+        source.touch()
+
+        result = FileCopier(mock_logger, reflink=ReflinkMode.never).copy_file(source, tmp_path / "copy")
+
+        assert result.method == "userspace"
+        assert (tmp_path / "copy").read_bytes() == b""
+
+    def test_same_file_is_rejected(self, mock_logger, source):
+        with pytest.raises(shutil.SameFileError):
+            FileCopier(mock_logger).copy_file(source, source)
+        assert source.stat().st_size > 0
+
+    @pytest.mark.parametrize("kernel_copy", [True, False])
+    @pytest.mark.parametrize("trailing_hole", [True, False])
+    def test_sparse_source_stays_sparse(self, mock_logger, tmp_path, kernel_copy, trailing_hole):
+        source = tmp_path / "disk.img"
+        size = 64 * 1024 * 1024
+        with open(source, 'wb') as f:
+            f.truncate(size)
+            f.seek(1024 * 1024)
+            f.write(os.urandom(4096))
+            f.seek(32 * 1024 * 1024)
+            f.write(os.urandom(8192))
+            if not trailing_hole:
+                f.seek(size - 4096)
+                f.write(os.urandom(4096))
+        if source.stat().st_blocks * 512 >= size:
+            pytest.skip("Filesystem does not support sparse files")
+        destination = tmp_path / "copy.img"
+        unsupported = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch.object(file_copier, "REFLINK_SUPPORTED", False):
+            if kernel_copy:
+                result = FileCopier(mock_logger).copy_file(source, destination)
+            else:
+                with patch.object(file_copier.os, "copy_file_range", side_effect=unsupported, create=True):
+                    result = FileCopier(mock_logger).copy_file(source, destination)
+
+        assert result.method == "sparse"
+        assert destination.stat().st_size == size
+        assert destination.stat().st_blocks <= source.stat().st_blocks
+        assert destination.read_bytes() == source.read_bytes()
+
+    def test_dense_source_skips_sparse_copy(self, mock_logger, source, tmp_path):
+        with patch.object(file_copier, "REFLINK_SUPPORTED", False):
+            result = FileCopier(mock_logger).copy_file(source, tmp_path / "copy.bin")
+
+        assert result.method != "sparse"
@@ -0,0 +1,112 @@
+import os
+import time
+from unittest.mock import patch
+import pytest
+
+from src.enums.entry_type import EntryType
+from src.services.file_finder import FileFinder, FindQuery, parse_numeric_filter, SIZE_UNITS
+
+
+class TestFileFinder:
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "tree"
+        (root / "src" / "pkg").mkdir(parents=True)
+        (root / "node_modules" / "dep").mkdir(parents=True)
+        (root / "src" / "main.py").write_bytes(b"x" * 10)
+        (root / "src" / "pkg" / "util.py").write_bytes(b"x" * 2000)
+        (root / "src" / "notes.txt").touch()
+        (root / "node_modules" / "dep" / "index.py").touch()
+        os.symlink("src/main.py", root / "main-link")
+        return root
+
+    def _relative(self, root, paths):
+        return sorted(os.path.relpath(path, root) for path in paths)
+
+    def test_find_by_name(self, mock_logger, tree):
+        finder = FileFinder(mock_logger, workers=4)
+
+        result = finder.find(tree, FindQuery(name="*.py"))
+
+        assert self._relative(tree, result) == ["node_modules/dep/index.py", "src/main.py", "src/pkg/util.py"]
+
+    def test_name_only_filter_does_not_stat(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        with patch.object(os.DirEntry, "stat", side_effect=AssertionError, create=True):
+            result = list(finder.find(tree, FindQuery(name="*.txt", entry_type=EntryType.file)))
+
+        assert self._relative(tree, result) == ["src/notes.txt"]
+
+    def test_find_by_regex_matches_whole_path(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        result = finder.find(tree, FindQuery(regex=r".*/src/[^/]*\.py"))
+
+        assert self._relative(tree, result) == ["src/main.py"]
+
+    def test_find_by_type(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        directories = finder.find(tree, FindQuery(entry_type=EntryType.directory))
+        links = finder.find(tree, FindQuery(entry_type=EntryType.symlink))
+
+        assert self._relative(tree, directories) == [".", "node_modules", "node_modules/dep", "src", "src/pkg"]
+        assert self._relative(tree, links) == ["main-link"]
+
+    def test_find_by_size(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        result = finder.find(tree, FindQuery(size="+1k", entry_type=EntryType.file))
+
+        assert self._relative(tree, result) == ["src/pkg/util.py"]
+
+    def test_size_with_unit_rounds_up_like_find(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        def files(size):
+            return self._relative(tree, finder.find(tree, FindQuery(size=size, entry_type=EntryType.file)))
+
+        assert files("1k") == ["src/main.py"]
+        assert files("2k") == ["src/pkg/util.py"]
+        assert files("-1k") == ["node_modules/dep/index.py", "src/notes.txt"]
+        assert files("10") == ["src/main.py"]
+
+    def test_find_by_mtime(self, mock_logger, tree):
+        old = time.time() - 10 * 24 * 60 * 60
+        os.utime(tree / "src" / "notes.txt", (old, old))
+        finder = FileFinder(mock_logger)
+
+        older = finder.find(tree, FindQuery(mtime="+5", entry_type=EntryType.file))
+        newer = finder.find(tree, FindQuery(mtime="-5", name="*.txt"))
+
+        assert self._relative(tree, older) == ["src/notes.txt"]
+        assert list(newer) == []
+
+    def test_max_depth(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        result = finder.find(tree, FindQuery(max_depth=1))
+
+        assert self._relative(tree, result) == [".", "main-link", "node_modules", "src"]
+
+    def test_prune_skips_directory_subtree(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        result = finder.find(tree, FindQuery(name="*.py", prune=["node_modules"]))
+
+        assert self._relative(tree, result) == ["src/main.py", "src/pkg/util.py"]
+
+    def test_invalid_filters_raise_value_error(self, mock_logger, tree):
+        finder = FileFinder(mock_logger)
+
+        with pytest.raises(ValueError):
+            finder.find(tree, FindQuery(size="ten"))
+        with pytest.raises(ValueError):
+            finder.find(tree, FindQuery(regex="("))
+
+    def test_parse_numeric_filter(self):
+        assert parse_numeric_filter("+10M", SIZE_UNITS) == ("+", 10 * 1024 * 1024)
+        assert parse_numeric_filter("-3", SIZE_UNITS) == ("-", 3)
+        assert parse_numeric_filter("7k", SIZE_UNITS) == ("", 7 * 1024)
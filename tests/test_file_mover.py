@@ -0,0 +1,136 @@
+import errno
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.services import file_mover
+from src.services.file_copier import FileCopier
+from src.services.file_mover import FileMover, MoveInterrupted
+from src.services.tree_remover import ParallelRemover
+
+SHM = Path("/dev/shm")
+
+
+def _cross_device():
+    real_rename = os.rename
+
+    def rename(source, destination):
+        if not os.path.basename(destination).endswith(".mvtmp"):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return real_rename(source, destination)
+
+    return patch.object(file_mover.os, "rename", side_effect=rename)
+
+
+class TestFileMover:
+
+    @pytest.fixture
+    def source_file(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(os.urandom(300_000))
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+        return path
+
+    @pytest.fixture
+    def source_tree(self, tmp_path):
+        root = tmp_path / "tree"
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "top.txt").write_text("top")
+        (root / "a" / "b" / "deep.txt").write_text("deep")
+        (root / "link").symlink_to("top.txt")
+        return root
+
+    def test_same_filesystem_move_is_a_rename(self, mock_logger, source_file, tmp_path):
+        destination = tmp_path / "moved.bin"
+
+        result = FileMover(mock_logger).move(source_file, destination)
+
+        assert result.method == "rename"
+        assert destination.exists()
+        assert not source_file.exists()
+
+    def test_cross_device_file_is_copied_then_source_removed(self, mock_logger, source_file, tmp_path):
+        data = source_file.read_bytes()
+        destination = tmp_path / "out" / "moved.bin"
+        destination.parent.mkdir()
+        reports = []
+
+        with _cross_device():
+            result = FileMover(mock_logger).move(source_file, destination, progress=reports.append)
+
+        assert result.method == "copy"
+        assert result.size == len(data)
+        assert reports[-1] == len(data)
+        assert destination.read_bytes() == data
+        assert destination.stat().st_mtime == 1_000_000_000
+        assert not source_file.exists()
+        assert os.listdir(destination.parent) == ["moved.bin"]
+
+    def test_cross_device_tree_is_copied_then_source_removed(self, mock_logger, source_tree, tmp_path):
+        destination = tmp_path / "moved_tree"
+
+        with _cross_device():
+            result = FileMover(mock_logger, workers=2).move(source_tree, destination)
+
+        assert result.files == 2
+        assert (destination / "a" / "b" / "deep.txt").read_text() == "deep"
+        assert os.readlink(destination / "link") == "top.txt"
+        assert not source_tree.exists()
+
+    def test_interrupted_copy_keeps_source_and_removes_partial_copy(self, mock_logger, source_tree, tmp_path):
+        destination = tmp_path / "moved_tree"
+
+        with _cross_device(), patch.object(FileCopier, "copy_file", side_effect=KeyboardInterrupt):
+            with pytest.raises(MoveInterrupted) as excinfo:
+                FileMover(mock_logger, workers=1).move(source_tree, destination)
+
+        assert excinfo.value.phase == FileMover.COPY_PHASE
+        assert (source_tree / "a" / "b" / "deep.txt").read_text() == "deep"
+        assert not destination.exists()
+        assert sorted(os.listdir(tmp_path)) == ["tree"]
+
+    def test_interrupted_source_removal_keeps_complete_copy(self, mock_logger, source_tree, tmp_path):
+        destination = tmp_path / "moved_tree"
+
+        with _cross_device(), patch.object(ParallelRemover, "remove", side_effect=KeyboardInterrupt):
+            with pytest.raises(MoveInterrupted) as excinfo:
+                FileMover(mock_logger, workers=1).move(source_tree, destination)
+
+        assert excinfo.value.phase == FileMover.REMOVE_PHASE
+        assert excinfo.value.destination == str(destination)
+        assert (destination / "a" / "b" / "deep.txt").read_text() == "deep"
+        assert source_tree.exists()
+
+    def test_incomplete_copy_is_rejected(self, mock_logger, source_file, tmp_path):
+        destination = tmp_path / "moved.bin"
+        copy_file = FileCopier.copy_file
+
+        def short_copy(self, source, target, progress=None):
+            result = copy_file(self, source, target, progress)
+            os.truncate(target, 10)
+            return result
+
+        with _cross_device(), patch.object(FileCopier, "copy_file", short_copy):
+            with pytest.raises(OSError, match="incomplete"):
+                FileMover(mock_logger).move(source_file, destination)
+
+        assert source_file.exists()
+        assert not destination.exists()
+        assert sorted(os.listdir(tmp_path)) == ["data.bin"]
+
+    @pytest.mark.skipif(
+        not SHM.is_dir() or SHM.stat().st_dev == Path(tempfile.gettempdir()).stat().st_dev,
+        reason="Needs a second filesystem",
+    )
+    def test_real_cross_device_move(self, mock_logger, source_tree):
+        with tempfile.TemporaryDirectory(dir=SHM) as target:
+            destination = Path(target) / "tree"
+
+            result = FileMover(mock_logger).move(source_tree, destination)
+
+            assert result.method == "copy"
+            assert (destination / "top.txt").read_text() == "top"
+            assert not source_tree.exists()
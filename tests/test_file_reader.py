@@ -0,0 +1,125 @@
+import bz2
+import gzip
+import io
+import lzma
+
+import pytest
+
+from src.enums.file_mode import FileReadMode
+from src.services.file_reader import FileReader, open_decompressed
+
+
+class TestFileReader:
+
+    def test_iter_bytes_reads_in_chunks(self, mock_logger, tmp_path):
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(b"abcdefghij")
+        reader = FileReader(mock_logger, chunk_size=4)
+
+        result = list(reader.iter_chunks(test_file, FileReadMode.bytes))
+
+        assert result == [b"abcd", b"efgh", b"ij"]
+
+    def test_iter_text_decodes_characters_split_across_chunks(self, mock_logger, tmp_path):
+        test_file = tmp_path / "text.txt"
+        content = "привет, мир ✓\r\n"
+        test_file.write_bytes(content.encode("utf-8"))
+        reader = FileReader(mock_logger, chunk_size=1)
+
+        result = list(reader.iter_chunks(test_file, FileReadMode.string))
+
+        assert "".join(result) == content
+        assert all(isinstance(chunk, str) and chunk for chunk in result)
+
+    def test_iter_text_rejects_invalid_utf8(self, mock_logger, tmp_path):
+        test_file = tmp_path / "broken.txt"
+        test_file.write_bytes(b"ok\xff")
+        reader = FileReader(mock_logger)
+
+        with pytest.raises(UnicodeDecodeError):
+            list(reader.iter_chunks(test_file, FileReadMode.string))
+
+    def test_iter_text_reports_truncated_character(self, mock_logger, tmp_path):
+        test_file = tmp_path / "truncated.txt"
+        test_file.write_bytes("ж".encode()[:1])
+        reader = FileReader(mock_logger)
+
+        with pytest.raises(UnicodeDecodeError):
+            list(reader.iter_chunks(test_file, FileReadMode.string))
+
+    def test_empty_file_yields_nothing(self, mock_logger, tmp_path):
+        test_file = tmp_path / "empty.txt"
+        test_file.touch()
+        reader = FileReader(mock_logger)
+
+        assert list(reader.iter_chunks(test_file, FileReadMode.string)) == []
+        assert list(reader.iter_chunks(test_file, FileReadMode.bytes)) == []
+
+    def test_copy_into_writes_file_to_real_fd(self, mock_logger, tmp_path):
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"x" * 100_000 + b"tail")
+        target = tmp_path / "target.bin"
+        reader = FileReader(mock_logger)
+
+        with open(target, 'wb') as output:
+            copied = reader.copy_into(source, output)
+
+        assert copied == 100_004
+        assert target.read_bytes() == source.read_bytes()
+
+    def test_copy_into_falls_back_without_fileno(self, mock_logger, tmp_path):
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"abcdefghij")
+        output = io.BytesIO()
+        reader = FileReader(mock_logger, chunk_size=3)
+
+        copied = reader.copy_into(source, output)
+
+        assert copied == 10
+        assert output.getvalue() == b"abcdefghij"
+
+    def test_copy_into_keeps_previously_buffered_output_first(self, mock_logger, tmp_path):
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"body")
+        target = tmp_path / "target.bin"
+        reader = FileReader(mock_logger)
+
+        with open(target, 'wb') as output:
+            output.write(b"head:")
+            reader.copy_into(source, output)
+
+        assert target.read_bytes() == b"head:body"
+
+    @pytest.mark.parametrize("compress", [gzip.compress, bz2.compress, lzma.compress])
+    def test_decompress_streams_by_magic_bytes(self, mock_logger, tmp_path, compress):
+        content = b"rotated log line\n" * 10_000
+        test_file = tmp_path / "app.log.1"
+        test_file.write_bytes(compress(content))
+        reader = FileReader(mock_logger, chunk_size=4096, decompress=True)
+
+        chunks = list(reader.iter_bytes(test_file))
+
+        assert b"".join(chunks) == content
+        assert max(len(chunk) for chunk in chunks) <= 4096
+
+    def test_decompress_passes_plain_files_through(self, mock_logger, tmp_path):
+        test_file = tmp_path / "plain.txt"
+        test_file.write_text("not compressed\n")
+        reader = FileReader(mock_logger, decompress=True)
+
+        assert "".join(reader.iter_text(test_file)) == "not compressed\n"
+
+    def test_decompress_handles_concatenated_gzip_members(self, tmp_path):
+        test_file = tmp_path / "joined.gz"
+        test_file.write_bytes(gzip.compress(b"first\n") + gzip.compress(b"second\n"))
+
+        with open_decompressed(test_file) as f:
+            assert f.read() == b"first\nsecond\n"
+
+    def test_decompress_truncated_input_raises_value_error(self, mock_logger, tmp_path):
+        test_file = tmp_path / "truncated.xz"
+        test_file.write_bytes(lzma.compress(b"x" * 100_000)[:-20])
+        reader = FileReader(mock_logger, decompress=True)
+
+        with pytest.raises(ValueError, match="Cannot decompress"):
+            list(reader.iter_bytes(test_file))
@@ -0,0 +1,112 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.services.file_tail import FileTail
+from src.services.file_watcher import PollingWatcher
+
+
+class TestFileTail:
+
+    @pytest.fixture
+    def numbered_file(self, tmp_path):
+        path = tmp_path / "numbered.txt"
+        path.write_bytes(b"".join(f"line {i}\n".encode() for i in range(1, 101)))
+        return path
+
+    @pytest.mark.parametrize("block_size", [3, 16, 65536])
+    def test_tail_reads_last_lines(self, mock_logger, numbered_file, block_size):
+        tail = FileTail(mock_logger, block_size=block_size)
+
+        result = b"".join(tail.tail(numbered_file, 3))
+
+        assert result == b"line 98\nline 99\nline 100\n"
+
+    @pytest.mark.parametrize("block_size", [3, 16, 65536])
+    def test_head_reads_first_lines(self, mock_logger, numbered_file, block_size):
+        tail = FileTail(mock_logger, block_size=block_size)
+
+        result = b"".join(tail.head(numbered_file, 3))
+
+        assert result == b"line 1\nline 2\nline 3\n"
+
+    def test_tail_without_trailing_newline(self, mock_logger, tmp_path):
+        path = tmp_path / "partial.txt"
+        path.write_bytes(b"a\nb\nc")
+        tail = FileTail(mock_logger, block_size=2)
+
+        assert b"".join(tail.tail(path, 2)) == b"b\nc"
+
+    def test_more_lines_than_file_and_zero(self, mock_logger, numbered_file):
+        tail = FileTail(mock_logger)
+
+        assert b"".join(tail.tail(numbered_file, 500)) == numbered_file.read_bytes()
+        assert b"".join(tail.head(numbered_file, 500)) == numbered_file.read_bytes()
+        assert b"".join(tail.tail(numbered_file, 0)) == b""
+        assert b"".join(tail.head(numbered_file, 0)) == b""
+
+    def test_tail_reads_only_blocks_near_the_end(self, mock_logger, tmp_path):
+        path = tmp_path / "large.txt"
+        path.write_bytes(b"x" * 1_000_000 + b"\nlast\n")
+        tail = FileTail(mock_logger, block_size=1024)
+
+        with open(path, 'rb') as f:
+            with patch.object(f, "read", wraps=f.read) as read:
+                offset = tail.tail_offset(f, 1)
+
+        assert offset == 1_000_001
+        assert read.call_count == 1
+
+    def _follow_until(self, generator, expected):
+        received = b""
+        while not received.endswith(expected):
+            received += next(generator)
+        return received
+
+    def test_follow_yields_tail_then_appended_data(self, mock_logger, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"old 1\nold 2\nold 3\n")
+        tail = FileTail(mock_logger)
+        generator = tail.follow(path, 1)
+
+        def append():
+            time.sleep(0.1)
+            with open(path, 'ab') as f:
+                f.write(b"new 1\n")
+
+        writer = threading.Thread(target=append)
+        writer.start()
+        try:
+            assert self._follow_until(generator, b"old 3\n") == b"old 3\n"
+            assert self._follow_until(generator, b"new 1\n") == b"new 1\n"
+        finally:
+            writer.join()
+            generator.close()
+
+    def test_follow_restarts_after_truncation(self, mock_logger, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"a long line before rotation\n")
+        tail = FileTail(mock_logger)
+        generator = tail.follow(path, 1)
+        try:
+            self._follow_until(generator, b"rotation\n")
+            path.write_bytes(b"fresh\n")
+            assert self._follow_until(generator, b"fresh\n") == b"fresh\n"
+        finally:
+            generator.close()
+
+    def test_follow_with_polling_fallback(self, mock_logger, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_bytes(b"first\n")
+        tail = FileTail(mock_logger)
+        with patch("src.services.file_tail.create_watcher", return_value=PollingWatcher(interval=0.01)):
+            generator = tail.follow(path, 1)
+            try:
+                self._follow_until(generator, b"first\n")
+                with open(path, 'ab') as f:
+                    f.write(b"second\n")
+                assert self._follow_until(generator, b"second\n") == b"second\n"
+            finally:
+                generator.close()
@@ -0,0 +1,52 @@
+import sys
+
+import pytest
+
+from src.services.file_watcher import InotifyWatcher, PollingWatcher, create_watcher
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+class TestInotifyWatcher:
+
+    def test_wait_reports_modification(self, tmp_path):
+        path = tmp_path / "watched.log"
+        path.touch()
+        watcher = InotifyWatcher()
+        try:
+            wd = watcher.add_watch(path)
+            with open(path, 'ab') as f:
+                f.write(b"data\n")
+
+            events = watcher.wait(1.0)
+
+            assert events
+            assert all(event_wd == wd for event_wd, _ in events)
+        finally:
+            watcher.close()
+
+    def test_wait_times_out_without_events(self, tmp_path):
+        path = tmp_path / "quiet.log"
+        path.touch()
+        watcher = InotifyWatcher()
+        try:
+            watcher.add_watch(path)
+            assert watcher.wait(0.05) == []
+        finally:
+            watcher.close()
+
+    def test_add_watch_missing_file_raises(self, tmp_path):
+        watcher = InotifyWatcher()
+        try:
+            with pytest.raises(FileNotFoundError):
+                watcher.add_watch(tmp_path / "missing.log")
+        finally:
+            watcher.close()
+
+
+class TestCreateWatcher:
+
+    def test_falls_back_to_polling_when_watch_fails(self, mock_logger, tmp_path):
+        watcher = create_watcher(tmp_path / "missing.log", mock_logger)
+
+        assert isinstance(watcher, PollingWatcher)
+        watcher.close()
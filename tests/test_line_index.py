@@ -0,0 +1,116 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.services.line_index import LineIndex, parse_line_range
+
+
+class TestLineIndex:
+
+    @pytest.fixture
+    def numbered_file(self, tmp_path):
+        path = tmp_path / "numbered.txt"
+        path.write_bytes(b"".join(f"line {i}\n".encode() for i in range(1, 1001)))
+        old = time.time() - 60
+        os.utime(path, (old, old))
+        return path
+
+    def _read(self, path, byte_range):
+        start, end = byte_range
+        return path.read_bytes()[start:end]
+
+    def test_byte_range_spans_checkpoints(self, mock_logger, temp_line_index_dir, numbered_file):
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir, interval=16)
+
+        result = self._read(numbered_file, index.byte_range(numbered_file, 31, 34))
+
+        assert result == b"line 31\nline 32\nline 33\nline 34\n"
+
+    def test_byte_range_on_checkpoint_boundary(self, mock_logger, temp_line_index_dir, numbered_file):
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir, interval=16)
+
+        assert self._read(numbered_file, index.byte_range(numbered_file, 17, 17)) == b"line 17\n"
+        assert self._read(numbered_file, index.byte_range(numbered_file, 1, 1)) == b"line 1\n"
+
+    def test_open_ended_and_out_of_range(self, mock_logger, temp_line_index_dir, numbered_file):
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir, interval=16)
+
+        assert self._read(numbered_file, index.byte_range(numbered_file, 999)) == b"line 999\nline 1000\n"
+        assert self._read(numbered_file, index.byte_range(numbered_file, 998, 5000)) == b"line 998\nline 999\nline 1000\n"
+        assert index.byte_range(numbered_file, 2000, 2001) == (numbered_file.stat().st_size,) * 2
+
+    def test_last_line_without_newline(self, mock_logger, temp_line_index_dir, tmp_path):
+        path = tmp_path / "partial.txt"
+        path.write_bytes(b"a\nb\nc")
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir, interval=2)
+
+        assert self._read(path, index.byte_range(path, 2, 3)) == b"b\nc"
+
+    def test_index_is_cached_and_invalidated(self, mock_logger, temp_line_index_dir, numbered_file):
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir, interval=16)
+        index.byte_range(numbered_file, 5, 6)
+        cache_files = list(temp_line_index_dir.glob("*.json"))
+        assert len(cache_files) == 1
+
+        with open(numbered_file, 'ab') as f:
+            f.write(b"line 1001\n")
+        old = time.time() - 30
+        os.utime(numbered_file, (old, old))
+
+        with patch.object(index, "_build", wraps=index._build) as build:
+            assert self._read(numbered_file, index.byte_range(numbered_file, 1001)) == b"line 1001\n"
+            index.byte_range(numbered_file, 1001)
+
+        assert build.call_count == 1
+
+    def test_eviction_keeps_most_recently_used_indexes(self, mock_logger, temp_line_index_dir, numbered_file, tmp_path):
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir, max_entries=2)
+        others = []
+        for i in range(2):
+            path = tmp_path / f"other{i}.txt"
+            path.write_bytes(b"a\nb\n")
+            os.utime(path, (1_000_000, 1_000_000))
+            others.append(path)
+        index.byte_range(numbered_file, 1, 1)
+        index.byte_range(others[0], 1, 1)
+        for age, path in ((30, numbered_file), (20, others[0])):
+            cache_file = index._cache_file(path)
+            os.utime(cache_file, (cache_file.stat().st_mtime - age,) * 2)
+
+        index.byte_range(numbered_file, 1, 1)
+        index.byte_range(others[1], 1, 1)
+
+        kept = {cache_file.name for cache_file in temp_line_index_dir.glob("*.json")}
+        assert kept == {index._cache_file(numbered_file).name, index._cache_file(others[1]).name}
+
+    def test_recently_modified_file_is_not_cached(self, mock_logger, temp_line_index_dir, tmp_path):
+        path = tmp_path / "fresh.txt"
+        path.write_bytes(b"a\nb\n")
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir)
+
+        index.byte_range(path, 1, 1)
+
+        assert not temp_line_index_dir.exists()
+
+    def test_empty_file(self, mock_logger, temp_line_index_dir, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.touch()
+        index = LineIndex(mock_logger, cache_dir=temp_line_index_dir)
+
+        assert index.byte_range(path, 1, 10) == (0, 0)
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("5:10", (5, 10)),
+        ("5:", (5, None)),
+        (":10", (1, 10)),
+        ("7:7", (7, 7)),
+    ])
+    def test_parse_line_range(self, spec, expected):
+        assert parse_line_range(spec) == expected
+
+    @pytest.mark.parametrize("spec", [":", "0:5", "10:5", "abc", "5"])
+    def test_parse_line_range_rejects_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_line_range(spec)
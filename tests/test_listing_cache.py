@@ -0,0 +1,76 @@
+import os
+from unittest.mock import patch
+import pytest
+
+from src.services.directory_lister import DirectoryLister
+from src.services.listing_cache import ListingCache
+
+
+class TestListingCache:
+
+    @pytest.fixture
+    def lister(self, mock_logger):
+        return DirectoryLister(mock_logger)
+
+    @pytest.fixture
+    def listed_dir(self, tmp_path):
+        listed_dir = tmp_path / "listed"
+        listed_dir.mkdir()
+        (listed_dir / "file.txt").write_text("content")
+        os.symlink("file.txt", listed_dir / "link")
+        os.utime(listed_dir, (1_000_000, 1_000_000))
+        return listed_dir
+
+    def test_second_scan_is_served_from_cache(self, mock_logger, lister, listed_dir, temp_ls_cache_dir):
+        cache = ListingCache(mock_logger, cache_dir=temp_ls_cache_dir)
+        first = cache.scan(listed_dir, lister)
+
+        with patch.object(lister, "scan", side_effect=AssertionError):
+            second = cache.scan(listed_dir, lister)
+
+        assert lister.format_long(sorted(second, key=lambda e: e.name)) == \
+            lister.format_long(sorted(first, key=lambda e: e.name))
+        assert {e.name: e.link_target for e in second} == {"file.txt": None, "link": "file.txt"}
+        assert all(e.path == os.path.join(listed_dir, e.name) for e in second)
+
+    def test_changed_directory_mtime_invalidates_cache(self, mock_logger, lister, listed_dir, temp_ls_cache_dir):
+        cache = ListingCache(mock_logger, cache_dir=temp_ls_cache_dir)
+        cache.scan(listed_dir, lister)
+        (listed_dir / "new.txt").touch()
+        os.utime(listed_dir, (2_000_000, 2_000_000))
+
+        entries = cache.scan(listed_dir, lister)
+
+        assert "new.txt" in {e.name for e in entries}
+
+    def test_recently_modified_directory_is_not_cached(self, mock_logger, lister, tmp_path, temp_ls_cache_dir):
+        cache = ListingCache(mock_logger, cache_dir=temp_ls_cache_dir)
+        fresh_dir = tmp_path / "fresh"
+        fresh_dir.mkdir()
+
+        cache.scan(fresh_dir, lister)
+
+        assert not temp_ls_cache_dir.exists() or not any(temp_ls_cache_dir.iterdir())
+
+    def test_eviction_keeps_most_recent_entries(self, mock_logger, lister, tmp_path, temp_ls_cache_dir):
+        cache = ListingCache(mock_logger, cache_dir=temp_ls_cache_dir, max_entries=2)
+        for i in range(4):
+            directory = tmp_path / f"dir{i}"
+            directory.mkdir()
+            os.utime(directory, (1_000_000, 1_000_000))
+            cache.scan(directory, lister)
+            for cache_file in temp_ls_cache_dir.glob("*.json"):
+                os.utime(cache_file, (cache_file.stat().st_mtime - 10,) * 2)
+
+        assert len(list(temp_ls_cache_dir.glob("*.json"))) == 2
+
+    def test_corrupted_cache_file_triggers_rescan(self, mock_logger, lister, listed_dir, temp_ls_cache_dir):
+        cache = ListingCache(mock_logger, cache_dir=temp_ls_cache_dir)
+        cache.scan(listed_dir, lister)
+        for cache_file in temp_ls_cache_dir.glob("*.json"):
+            cache_file.write_text("invalid json{")
+
+        entries = cache.scan(listed_dir, lister)
+
+        assert {e.name for e in entries} == {"file.txt", "link"}
+        mock_logger.error.assert_called_once()
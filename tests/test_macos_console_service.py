@@ -56,6 +56,23 @@ class TestMacOSConsoleService:
         assert any("file.txt" in line for line in result)
         assert any(line.startswith('-') or line.startswith('d') for line in result)
 
+    def test_iter_ls_streams_lines(self, console_service, mock_workspace_manager, tmp_path):
+        console_service._workspace_manager = mock_workspace_manager
+        test_dir = tmp_path / "testdir"
+        test_dir.mkdir()
+        (test_dir / "file.txt").touch()
+        
+        result = console_service.iter_ls(test_dir, list_mode=ListMode.long, chunk_size=10)
+        
+        assert not isinstance(result, list)
+        assert any("file.txt" in line for line in result)
+
+    def test_iter_ls_validates_eagerly(self, console_service, mock_workspace_manager, tmp_path):
+        console_service._workspace_manager = mock_workspace_manager
+        
+        with pytest.raises(FileNotFoundError):
+            console_service.iter_ls(tmp_path / "nonexistent")
+
     def test_ls_nonexistent_directory(self, console_service, mock_workspace_manager, tmp_path):
         console_service._workspace_manager = mock_workspace_manager
         nonexistent = tmp_path / "nonexistent"
@@ -93,6 +110,22 @@ class TestMacOSConsoleService:
         assert result == content
         assert isinstance(result, bytes)
 
+    def test_iter_cat_streams_chunks(self, console_service, mock_workspace_manager, tmp_path):
+        console_service._workspace_manager = mock_workspace_manager
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Hello, World!")
+        
+        result = list(console_service.iter_cat(test_file, mode=FileReadMode.string, chunk_size=5))
+        
+        assert len(result) > 1
+        assert "".join(result) == "Hello, World!"
+
+    def test_iter_cat_validates_eagerly(self, console_service, mock_workspace_manager, tmp_path):
+        console_service._workspace_manager = mock_workspace_manager
+        
+        with pytest.raises(IsADirectoryError):
+            console_service.iter_cat(tmp_path)
+
     def test_cat_nonexistent_file(self, console_service, mock_workspace_manager, tmp_path):
         console_service._workspace_manager = mock_workspace_manager
         nonexistent = tmp_path / "nonexistent.txt"
@@ -0,0 +1,108 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.services.resumable_copier import ResumableCopier, checkpoint_path, part_path
+
+BLOCK_SIZE = 4096
+
+
+class _InterruptingReader:
+
+    def __init__(self, f, limit):
+        self._f = f
+        self._limit = limit
+
+    def seek(self, position):
+        return self._f.seek(position)
+
+    def read(self, size):
+        if self._f.tell() >= self._limit:
+            raise KeyboardInterrupt
+        return self._f.read(size)
+
+
+class TestResumableCopier:
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        path = tmp_path / "disk.img"
+        path.write_bytes(os.urandom(10 * BLOCK_SIZE + 123))
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+        return path
+
+    def _copy_interrupted(self, mock_logger, source, destination, blocks):
+        copier = ResumableCopier(mock_logger, block_size=BLOCK_SIZE)
+        copy_blocks = copier._copy_blocks
+
+        def interrupted(src, dst, checkpoint, index, log):
+            copy_blocks(_InterruptingReader(src, blocks * BLOCK_SIZE), dst, checkpoint, index, log)
+
+        with patch.object(copier, "_copy_blocks", side_effect=interrupted):
+            with pytest.raises(KeyboardInterrupt):
+                copier.copy_file(source, destination)
+
+    def test_copy_file_renames_into_place_and_removes_sidecar(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.img"
+
+        result = ResumableCopier(mock_logger, block_size=BLOCK_SIZE).copy_file(source, destination)
+
+        assert result.method == "checkpointed"
+        assert destination.read_bytes() == source.read_bytes()
+        assert destination.stat().st_mtime == source.stat().st_mtime
+        assert not part_path(destination).exists()
+        assert not checkpoint_path(destination).exists()
+
+    def test_interrupted_copy_resumes_from_last_checkpoint(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.img"
+        self._copy_interrupted(mock_logger, source, destination, blocks=4)
+        assert part_path(destination).stat().st_size == 4 * BLOCK_SIZE
+        assert len(checkpoint_path(destination).read_text().splitlines()) == 1 + 4
+        assert not destination.exists()
+
+        copier = ResumableCopier(mock_logger, block_size=BLOCK_SIZE)
+        with patch.object(copier, "_copy_blocks", wraps=copier._copy_blocks) as copy_blocks:
+            result = copier.copy_file(source, destination)
+
+        assert copy_blocks.call_args.args[3] == 4
+        assert result.method == "resumed"
+        assert destination.read_bytes() == source.read_bytes()
+        assert not checkpoint_path(destination).exists()
+
+    def test_corrupted_block_is_recopied(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.img"
+        self._copy_interrupted(mock_logger, source, destination, blocks=4)
+        with open(part_path(destination), 'r+b') as f:
+            f.seek(2 * BLOCK_SIZE + 10)
+            f.write(b"garbage")
+
+        copier = ResumableCopier(mock_logger, block_size=BLOCK_SIZE)
+        with patch.object(copier, "_copy_blocks", wraps=copier._copy_blocks) as copy_blocks:
+            copier.copy_file(source, destination)
+
+        assert copy_blocks.call_args.args[3] == 2
+        assert destination.read_bytes() == source.read_bytes()
+
+    def test_changed_source_starts_over(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.img"
+        self._copy_interrupted(mock_logger, source, destination, blocks=4)
+        source.write_bytes(os.urandom(6 * BLOCK_SIZE))
+
+        result = ResumableCopier(mock_logger, block_size=BLOCK_SIZE).copy_file(source, destination)
+
+        assert result.method == "checkpointed"
+        assert destination.read_bytes() == source.read_bytes()
+
+    def test_torn_checkpoint_line_is_ignored(self, mock_logger, source, tmp_path):
+        destination = tmp_path / "copy.img"
+        self._copy_interrupted(mock_logger, source, destination, blocks=4)
+        with open(checkpoint_path(destination), 'a') as f:
+            f.write("deadbeef")
+
+        copier = ResumableCopier(mock_logger, block_size=BLOCK_SIZE)
+        with patch.object(copier, "_copy_blocks", wraps=copier._copy_blocks) as copy_blocks:
+            copier.copy_file(source, destination)
+
+        assert copy_blocks.call_args.args[3] == 4
+        assert destination.read_bytes() == source.read_bytes()
@@ -0,0 +1,144 @@
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from src.services.file_copier import FileCopier
+from src.services.tree_copier import ParallelTreeCopier
+
+
+class TestParallelTreeCopier:
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "src"
+        for i in range(4):
+            for j in range(3):
+                leaf = root / f"dir_{i}" / f"sub_{j}"
+                leaf.mkdir(parents=True)
+                for k in range(5):
+                    (leaf / f"file_{k}.txt").write_bytes(f"{i}-{j}-{k}".encode() * 10)
+        (root / "top.txt").write_bytes(b"top")
+        (root / "empty").mkdir()
+        (root / "link").symlink_to("top.txt")
+        for directory, _, files in os.walk(root):
+            for name in files:
+                os.utime(os.path.join(directory, name), (1_000_000_000, 1_000_000_000), follow_symlinks=False)
+            os.utime(directory, (1_100_000_000, 1_100_000_000))
+        return root
+
+    def _copier(self, mock_logger, workers):
+        return ParallelTreeCopier(mock_logger, FileCopier(mock_logger), workers=workers)
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_copy_replicates_tree_and_reports_stats(self, mock_logger, tree, tmp_path, workers):
+        destination = tmp_path / "dst"
+
+        stats = self._copier(mock_logger, workers).copy(tree, destination)
+
+        assert stats.files == 4 * 3 * 5 + 1
+        assert stats.directories == 1 + 4 + 4 * 3 + 1
+        assert stats.symlinks == 1
+        assert stats.size == sum(
+            path.stat().st_size for path in tree.rglob("*") if path.is_file() and not path.is_symlink()
+        )
+        assert stats.seconds > 0
+        for path in tree.rglob("*"):
+            copied = destination / path.relative_to(tree)
+            if path.is_symlink():
+                assert os.readlink(copied) == "top.txt"
+            elif path.is_file():
+                assert copied.read_bytes() == path.read_bytes()
+            else:
+                assert copied.is_dir()
+
+    def test_copy_preserves_file_and_directory_mtimes(self, mock_logger, tree, tmp_path):
+        destination = tmp_path / "dst"
+
+        self._copier(mock_logger, 4).copy(tree, destination)
+
+        assert (destination / "top.txt").stat().st_mtime == 1_000_000_000
+        assert (destination / "dir_0" / "sub_0").stat().st_mtime == 1_100_000_000
+        assert destination.stat().st_mtime == 1_100_000_000
+
+    def test_copy_into_existing_destination_merges(self, mock_logger, tree, tmp_path):
+        destination = tmp_path / "dst"
+        destination.mkdir()
+        (destination / "extra.txt").write_text("keep")
+
+        self._copier(mock_logger, 2).copy(tree, destination)
+
+        assert (destination / "extra.txt").read_text() == "keep"
+        assert (destination / "top.txt").read_bytes() == b"top"
+
+    def test_copy_into_itself_is_rejected(self, mock_logger, tree):
+        with pytest.raises(ValueError, match="into itself"):
+            self._copier(mock_logger, 2).copy(tree, tree / "nested")
+
+    def test_failed_files_are_reported_after_the_rest_is_copied(self, mock_logger, tree, tmp_path):
+        destination = tmp_path / "dst"
+        copier = FileCopier(mock_logger)
+        copy_file = copier.copy_file
+
+        def failing_copy(source, target):
+            if os.path.basename(source) == "file_2.txt":
+                raise PermissionError(13, "Permission denied", source)
+            return copy_file(source, target)
+
+        with patch.object(copier, "copy_file", side_effect=failing_copy):
+            with pytest.raises(shutil.Error) as exc_info:
+                ParallelTreeCopier(mock_logger, copier, workers=4).copy(tree, destination)
+
+        assert len(exc_info.value.args[0]) == 4 * 3
+        assert (destination / "dir_3" / "sub_2" / "file_4.txt").exists()
+        assert not (destination / "dir_0" / "sub_0" / "file_2.txt").exists()
+
+    def test_update_copies_only_changed_files(self, mock_logger, tree, tmp_path):
+        destination = tmp_path / "dst"
+        copier = FileCopier(mock_logger)
+        tree_copier = ParallelTreeCopier(mock_logger, copier, workers=4)
+        tree_copier.copy(tree, destination)
+        (tree / "top.txt").write_bytes(b"changed")
+        (tree / "dir_1" / "new.txt").write_bytes(b"new")
+
+        with patch.object(copier, "copy_file", wraps=copier.copy_file) as copy_file:
+            stats = tree_copier.copy(tree, destination, update=True)
+
+        copied = sorted(os.path.basename(call.args[0]) for call in copy_file.call_args_list)
+        assert copied == ["new.txt", "top.txt"]
+        assert stats.files == 2
+        assert stats.skipped == 4 * 3 * 5
+        assert (destination / "top.txt").read_bytes() == b"changed"
+
+    def test_update_with_checksum_detects_same_size_and_mtime_edits(self, mock_logger, tree, tmp_path):
+        destination = tmp_path / "dst"
+        tree_copier = self._copier(mock_logger, 2)
+        tree_copier.copy(tree, destination)
+        edited = destination / "dir_0" / "sub_0" / "file_0.txt"
+        original = edited.stat()
+        edited.write_bytes(b"X" + edited.read_bytes()[1:])
+        os.utime(edited, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+        assert tree_copier.copy(tree, destination, update=True).files == 0
+
+        stats = tree_copier.copy(tree, destination, update=True, checksum=True)
+
+        assert stats.files == 1
+        assert edited.read_bytes() == (tree / "dir_0" / "sub_0" / "file_0.txt").read_bytes()
+
+    def test_update_with_delete_removes_extras(self, mock_logger, tree, tmp_path):
+        destination = tmp_path / "dst"
+        tree_copier = self._copier(mock_logger, 2)
+        tree_copier.copy(tree, destination)
+        (destination / "stale.txt").write_text("old")
+        (destination / "dir_2" / "stale_dir" / "deep").mkdir(parents=True)
+        (destination / "dir_2" / "stale_dir" / "deep" / "x.txt").write_text("old")
+
+        stats = tree_copier.copy(tree, destination, update=True, delete=True)
+
+        assert stats.deleted == 2
+        assert not (destination / "stale.txt").exists()
+        assert not (destination / "dir_2" / "stale_dir").exists()
+        assert sorted(p.relative_to(destination) for p in destination.rglob("*")) == \
+            sorted(p.relative_to(tree) for p in tree.rglob("*"))
@@ -0,0 +1,115 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.services import tree_remover
+from src.services.tree_remover import ParallelRemover
+
+
+class TestParallelRemover:
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "build"
+        for i in range(5):
+            for j in range(4):
+                leaf = root / f"dir_{i}" / f"sub_{j}"
+                leaf.mkdir(parents=True)
+                for k in range(3):
+                    (leaf / f"file_{k}.o").write_bytes(b"x" * 10)
+        (root / "top.txt").write_bytes(b"y" * 7)
+        (root / "empty").mkdir()
+        return root
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_remove_reports_stats(self, mock_logger, tree, workers):
+        remover = ParallelRemover(mock_logger, workers=workers)
+
+        stats = remover.remove(tree)
+
+        assert not tree.exists()
+        assert stats.files == 5 * 4 * 3 + 1
+        assert stats.directories == 1 + 5 + 5 * 4 + 1
+        assert stats.size == 5 * 4 * 3 * 10 + 7
+
+    def test_remove_does_not_follow_symlinks(self, mock_logger, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        root = tmp_path / "root"
+        root.mkdir()
+        os.symlink(outside, root / "link_to_dir")
+        os.symlink(outside / "keep.txt", root / "link_to_file")
+        remover = ParallelRemover(mock_logger, workers=2)
+
+        stats = remover.remove(root)
+
+        assert not root.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+        assert stats.files == 2
+
+    def test_remove_refuses_symlink_root(self, mock_logger, tmp_path):
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "keep.txt").touch()
+        link = tmp_path / "link"
+        os.symlink(target, link)
+        remover = ParallelRemover(mock_logger)
+
+        with pytest.raises(OSError, match="symbolic link"):
+            remover.remove(link)
+
+        assert (target / "keep.txt").exists()
+
+    def test_remove_refuses_file(self, mock_logger, tmp_path):
+        test_file = tmp_path / "file.txt"
+        test_file.touch()
+
+        with pytest.raises(NotADirectoryError):
+            ParallelRemover(mock_logger).remove(test_file)
+
+    def test_remove_raises_first_error_and_closes_descriptors(self, mock_logger, tree):
+        original_unlink = os.unlink
+
+        def failing_unlink(name, *, dir_fd=None):
+            if name == "file_1.o":
+                raise PermissionError(13, "Permission denied", name)
+            return original_unlink(name, dir_fd=dir_fd)
+
+        open_fds = len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+        with patch.object(tree_remover.os, "unlink", side_effect=failing_unlink):
+            with pytest.raises(PermissionError):
+                ParallelRemover(mock_logger, workers=4).remove(tree)
+
+        assert tree.exists()
+        if open_fds is not None:
+            assert len(os.listdir("/proc/self/fd")) == open_fds
+
+    def test_directory_swapped_for_symlink_is_not_followed(self, mock_logger, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").touch()
+        root = tmp_path / "root"
+        (root / "victim").mkdir(parents=True)
+        original_open = os.open
+
+        def swapping_open(name, flags, mode=0o777, *, dir_fd=None):
+            if name == "victim":
+                os.rmdir(root / "victim")
+                os.symlink(outside, root / "victim")
+            return original_open(name, flags, mode, dir_fd=dir_fd)
+
+        with patch.object(tree_remover.os, "open", side_effect=swapping_open):
+            with pytest.raises(OSError):
+                ParallelRemover(mock_logger, workers=1).remove(root)
+
+        assert (outside / "keep.txt").exists()
+
+    def test_fallback_without_dir_fd_support(self, mock_logger, tree):
+        with patch.object(tree_remover, "FD_REMOVAL_SUPPORTED", False):
+            stats = ParallelRemover(mock_logger).remove(tree)
+
+        assert not tree.exists()
+        assert stats.files == 61
+        assert stats.directories == 27
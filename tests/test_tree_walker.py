@@ -0,0 +1,72 @@
+import os
+import pytest
+
+from src.services.tree_walker import ParallelTreeWalker
+
+
+class TestParallelTreeWalker:
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        for directory in ["a/x", "a/y/deep", "b", "c"]:
+            (tmp_path / directory).mkdir(parents=True)
+        (tmp_path / "a" / "file.txt").touch()
+        (tmp_path / "a" / "y" / "deep" / "leaf.txt").touch()
+        (tmp_path / "root.txt").touch()
+        return tmp_path
+
+    def _relative(self, root, scans):
+        return [os.path.relpath(scan.path, root) for scan in scans]
+
+    def test_ordered_walk_is_depth_first_and_sorted(self, mock_logger, tree):
+        walker = ParallelTreeWalker(mock_logger, workers=4)
+
+        scans = list(walker.walk(tree))
+
+        assert self._relative(tree, scans) == [".", "a", "a/x", "a/y", "a/y/deep", "b", "c"]
+        assert [entry.name for entry in scans[0].entries] == ["a", "b", "c", "root.txt"]
+
+    def test_ordered_walk_is_deterministic_with_one_worker(self, mock_logger, tree):
+        parallel = list(ParallelTreeWalker(mock_logger, workers=8).walk(tree))
+        serial = list(ParallelTreeWalker(mock_logger, workers=1).walk(tree))
+
+        assert self._relative(tree, parallel) == self._relative(tree, serial)
+
+    def test_max_depth_limits_descent(self, mock_logger, tree):
+        walker = ParallelTreeWalker(mock_logger)
+
+        scans = list(walker.walk(tree, max_depth=1))
+
+        assert self._relative(tree, scans) == [".", "a", "b", "c"]
+        assert [scan.depth for scan in scans] == [0, 1, 1, 1]
+
+    def test_unordered_walk_visits_every_directory(self, mock_logger, tree):
+        walker = ParallelTreeWalker(mock_logger, workers=4)
+
+        scans = list(walker.walk(tree, ordered=False))
+
+        assert sorted(self._relative(tree, scans)) == [".", "a", "a/x", "a/y", "a/y/deep", "b", "c"]
+
+    def test_should_descend_prunes_directories(self, mock_logger, tree):
+        walker = ParallelTreeWalker(mock_logger)
+
+        scans = list(walker.walk(tree, should_descend=lambda entry: entry.name != "a"))
+
+        assert self._relative(tree, scans) == [".", "b", "c"]
+
+    def test_does_not_follow_directory_symlinks(self, mock_logger, tree):
+        os.symlink(tree, tree / "b" / "loop")
+        walker = ParallelTreeWalker(mock_logger)
+
+        scans = list(walker.walk(tree))
+
+        assert "b/loop" not in self._relative(tree, scans)
+
+    def test_unreadable_directory_reports_error(self, mock_logger, tmp_path):
+        walker = ParallelTreeWalker(mock_logger)
+
+        scans = list(walker.walk(tmp_path / "missing"))
+
+        assert len(scans) == 1
+        assert isinstance(scans[0].error, FileNotFoundError)
+        mock_logger.warning.assert_called_once()
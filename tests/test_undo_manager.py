@@ -1,3 +1,4 @@
+import errno
 import json
 import shutil
 from pathlib import Path
@@ -52,8 +53,9 @@ class TestUndoManager:
         assert result is False
         assert len(manager._undo_stack) == 0
 
-    def test_register_mv(self, mock_logger, temp_undo_file, tmp_path):
+    def test_register_mv(self, mock_logger, temp_undo_file, temp_backup_dir, tmp_path):
         manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        manager._backup_dir = temp_backup_dir
         source = tmp_path / "source.txt"
         source.write_text("content")
         dest = tmp_path / "dest.txt"
@@ -66,7 +68,8 @@ class TestUndoManager:
         assert op.operation_type == OperationType.MV
         assert op.source == source
         assert op.destination == dest
-        assert op.backup_path.exists()
+        assert op.backup_path is None
+        assert list(temp_backup_dir.iterdir()) == []
 
     def test_register_mkdir(self, mock_logger, temp_undo_file, tmp_path):
         manager = UndoManager(mock_logger, undo_file=temp_undo_file)
@@ -106,8 +109,9 @@ class TestUndoManager:
         assert op.source == source
         assert op.destination == dest
 
-    def test_register_archive_zip(self, mock_logger, temp_undo_file, tmp_path):
+    def test_register_archive_zip(self, mock_logger, temp_undo_file, temp_backup_dir, tmp_path):
         manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        manager._backup_dir = temp_backup_dir
         source = tmp_path / "source.txt"
         source.write_text("content")
         dest = tmp_path / "archive.zip"
@@ -118,7 +122,8 @@ class TestUndoManager:
         assert len(manager._undo_stack) == 1
         op = manager._undo_stack[0]
         assert op.operation_type == OperationType.ZIP
-        assert op.backup_path.exists()
+        assert op.backup_path is None
+        assert list(temp_backup_dir.iterdir()) == []
 
     def test_can_undo_empty_stack(self, mock_logger, temp_undo_file):
         manager = UndoManager(mock_logger, undo_file=temp_undo_file)
@@ -145,6 +150,63 @@ class TestUndoManager:
         assert test_file.exists()
         assert test_file.read_text() == "original content"
 
+    def test_move_to_trash_renames_into_backup_dir(self, mock_logger, temp_undo_file, temp_backup_dir, tmp_path):
+        manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        manager._backup_dir = temp_backup_dir
+        test_dir = tmp_path / "testdir"
+        test_dir.mkdir()
+        (test_dir / "file.txt").write_text("content")
+        inode = test_dir.stat().st_ino
+        
+        result = manager.move_to_trash(test_dir, recursive=True)
+        
+        assert result is True
+        assert not test_dir.exists()
+        op = manager._undo_stack[-1]
+        assert op.backup_path.parent == temp_backup_dir
+        assert op.backup_path.stat().st_ino == inode
+        assert op.metadata == {"recursive": True, "trashed": True}
+
+    def test_undo_trashed_rm_renames_back(self, mock_logger, temp_undo_file, temp_backup_dir, tmp_path):
+        manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        manager._backup_dir = temp_backup_dir
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("original content")
+        inode = test_file.stat().st_ino
+        manager.move_to_trash(test_file)
+        
+        result = manager.undo_last()
+        
+        assert "Restored" in result
+        assert test_file.read_text() == "original content"
+        assert test_file.stat().st_ino == inode
+        assert list(temp_backup_dir.iterdir()) == []
+
+    def test_move_to_trash_without_trash_dir_leaves_path(self, mock_logger, temp_undo_file, tmp_path):
+        manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        test_file = tmp_path / "test.txt"
+        test_file.touch()
+        
+        with patch.object(manager, "_trash_dir_for", return_value=None):
+            result = manager.move_to_trash(test_file)
+        
+        assert result is False
+        assert test_file.exists()
+        assert manager._undo_stack == []
+
+    def test_move_to_trash_cross_device_rename_fails_cleanly(self, mock_logger, temp_undo_file, temp_backup_dir, tmp_path):
+        manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        manager._backup_dir = temp_backup_dir
+        test_file = tmp_path / "test.txt"
+        test_file.touch()
+        
+        with patch("src.services.undo_manager.os.rename", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            result = manager.move_to_trash(test_file)
+        
+        assert result is False
+        assert test_file.exists()
+        assert manager._undo_stack == []
+
     def test_undo_mkdir_operation(self, mock_logger, temp_undo_file, tmp_path):
         manager = UndoManager(mock_logger, undo_file=temp_undo_file)
         new_dir = tmp_path / "newdir"
@@ -195,6 +257,21 @@ class TestUndoManager:
         assert source.exists()
         assert not dest.exists()
 
+    def test_undo_mv_across_filesystems(self, mock_logger, temp_undo_file, tmp_path):
+        manager = UndoManager(mock_logger, undo_file=temp_undo_file)
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_text("content")
+        manager.register_mv(source, dest)
+        source.rename(dest)
+        
+        with patch("src.services.file_mover.os.rename", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            result = manager.undo_last()
+        
+        assert "Moved" in result
+        assert source.read_text() == "content"
+        assert not dest.exists()
+
     def test_undo_empty_stack(self, mock_logger, temp_undo_file):
         manager = UndoManager(mock_logger, undo_file=temp_undo_file)
         
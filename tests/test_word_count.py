@@ -0,0 +1,70 @@
+import pytest
+
+from src.services.word_count import WordCounter, count_file
+
+
+class TestWordCount:
+
+    @pytest.fixture
+    def text_file(self, tmp_path):
+        path = tmp_path / "text.txt"
+        path.write_bytes(b"hello world\n  foo\tbar baz\n\nlast")
+        return path
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+    def test_count_file_is_independent_of_chunk_boundaries(self, text_file, chunk_size):
+        assert count_file(str(text_file), chunk_size) == (3, 6, 31)
+
+    def test_count_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.touch()
+
+        assert count_file(str(path)) == (0, 0, 0)
+
+    def test_count_whitespace_only_file(self, tmp_path):
+        path = tmp_path / "blank.txt"
+        path.write_bytes(b" \t\r\n\x0b\x0c \n")
+
+        assert count_file(str(path), 3) == (2, 0, 8)
+
+    def test_count_file_without_words(self, text_file):
+        assert count_file(str(text_file), 5, count_words=False) == (3, 0, 31)
+
+    def test_counter_serial(self, mock_logger, text_file):
+        counter = WordCounter(mock_logger)
+
+        result = list(counter.count([text_file]))
+
+        assert len(result) == 1
+        assert (result[0].lines, result[0].words, result[0].size) == (3, 6, 31)
+        assert result[0].path == str(text_file)
+
+    def test_counter_parallel_keeps_input_order(self, mock_logger, tmp_path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"file_{i}.txt"
+            path.write_bytes(b"word\n" * (i + 1))
+            paths.append(path)
+        counter = WordCounter(mock_logger, workers=2)
+
+        result = list(counter.count(paths))
+
+        assert [count.path for count in result] == [str(path) for path in paths]
+        assert [count.lines for count in result] == [1, 2, 3, 4]
+
+    def test_counter_reports_errors_per_file(self, mock_logger, tmp_path, text_file):
+        counter = WordCounter(mock_logger, workers=1)
+
+        result = list(counter.count([tmp_path / "missing.txt", text_file]))
+
+        assert result[0].error is not None
+        assert result[1].words == 6
+        mock_logger.warning.assert_called_once()
+
+    def test_counter_reports_directories_as_errors(self, mock_logger, tmp_path, text_file):
+        counter = WordCounter(mock_logger, workers=1)
+
+        result = list(counter.count([tmp_path, text_file]))
+
+        assert result[0].error == "Is a directory"
+        assert result[1].words == 6
@@ -0,0 +1,130 @@
+import os
+import shutil
+import subprocess
+import sys
+import zipfile
+import zlib
+from unittest.mock import patch
+
+import pytest
+
+from src.services import zip_writer
+from src.services.zip_writer import ParallelZipWriter, crc32_combine
+
+CHUNK_SIZE = 64 * 1024
+
+
+class TestCrc32Combine:
+
+    @pytest.mark.parametrize("first, second", [(0, 0), (0, 5), (5, 0), (1, 1), (1000, 65536), (3, 1_000_003)])
+    def test_matches_crc_of_concatenation(self, first, second):
+        a = os.urandom(first)
+        b = os.urandom(second)
+
+        assert crc32_combine(zlib.crc32(a), zlib.crc32(b), len(b)) == zlib.crc32(a + b)
+
+    def test_zero_crc_skips_operator(self):
+        with patch.object(zip_writer, "_crc32_zeros_operator") as operator:
+            assert crc32_combine(0, 1234, 777) == 1234
+
+        operator.assert_not_called()
+
+
+class TestParallelZipWriter:
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "project"
+        (root / "src" / "pkg").mkdir(parents=True)
+        (root / "empty.txt").write_bytes(b"")
+        (root / "src" / "small.py").write_text("print('hello')\n" * 10)
+        (root / "src" / "pkg" / "big.log").write_bytes(
+            b"".join(f"line {i} {os.urandom(8).hex()}\n".encode() for i in range(40000))
+        )
+        (root / "src" / "pkg" / "random.bin").write_bytes(os.urandom(5 * CHUNK_SIZE + 7))
+        return root
+
+    def _assert_archive_matches(self, archive_path, root):
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            names = archive.namelist()
+            expected = [str(p.relative_to(root)) for p in root.rglob('*') if p.is_file()]
+            assert names == expected
+            for name in names:
+                assert archive.read(name) == (root / name).read_bytes()
+                assert archive.getinfo(name).compress_type == zipfile.ZIP_DEFLATED
+
+    def test_serial_write_produces_standard_zip(self, mock_logger, tree, tmp_path):
+        archive_path = tmp_path / "out.zip"
+
+        stats = ParallelZipWriter(mock_logger, workers=1, chunk_size=CHUNK_SIZE).write(tree, archive_path)
+
+        self._assert_archive_matches(archive_path, tree)
+        assert stats.files == 4
+        assert stats.size == sum(p.stat().st_size for p in tree.rglob('*') if p.is_file())
+        assert stats.compressed_size < stats.size
+
+    def test_parallel_write_matches_serial_members(self, mock_logger, tree, tmp_path):
+        archive_path = tmp_path / "out.zip"
+
+        with patch.object(zip_writer, "PARALLEL_THRESHOLD", 0):
+            ParallelZipWriter(mock_logger, workers=2, chunk_size=CHUNK_SIZE).write(tree, archive_path)
+
+        self._assert_archive_matches(archive_path, tree)
+
+    def test_chunked_deflate_keeps_ratio_close_to_single_stream(self, mock_logger, tree, tmp_path):
+        archive_path = tmp_path / "out.zip"
+        big = tree / "src" / "pkg" / "big.log"
+
+        ParallelZipWriter(mock_logger, workers=1, chunk_size=CHUNK_SIZE).write(big, archive_path)
+
+        single_stream = len(zlib.compress(big.read_bytes(), 6))
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.getinfo("big.log").compress_size < single_stream * 1.02
+
+    def test_many_small_members_do_not_combine_crcs(self, mock_logger, tmp_path):
+        root = tmp_path / "small"
+        root.mkdir()
+        for i in range(500):
+            (root / f"file_{i}.txt").write_bytes(os.urandom(i + 1))
+        archive_path = tmp_path / "small.zip"
+
+        with patch.object(zip_writer, "_crc32_zeros_operator", wraps=zip_writer._crc32_zeros_operator) as operator:
+            stats = ParallelZipWriter(mock_logger, workers=1, chunk_size=CHUNK_SIZE).write(root, archive_path)
+
+        operator.assert_not_called()
+        assert stats.files == 500
+        self._assert_archive_matches(archive_path, root)
+
+    def test_zipfile_internals_are_supported_on_pinned_versions(self, tmp_path):
+        with zipfile.ZipFile(tmp_path / "probe.zip", 'w') as archive:
+            supported = zip_writer.zipfile_internals_supported(archive)
+
+        assert supported == (sys.version_info[:2] in zip_writer.ZIPFILE_INTERNALS_VERSIONS)
+
+    def test_unverified_python_falls_back_to_zipfile_write(self, mock_logger, tree, tmp_path):
+        archive_path = tmp_path / "out.zip"
+
+        with patch.object(zip_writer, "ZIPFILE_INTERNALS_VERSIONS", ()):
+            stats = ParallelZipWriter(mock_logger, workers=2, chunk_size=CHUNK_SIZE).write(tree, archive_path)
+
+        self._assert_archive_matches(archive_path, tree)
+        assert stats.files == 4
+        mock_logger.warning.assert_called_once()
+
+    def test_single_file_source(self, mock_logger, tree, tmp_path):
+        archive_path = tmp_path / "one.zip"
+
+        ParallelZipWriter(mock_logger, workers=1).write(tree / "src" / "small.py", archive_path)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.read("small.py") == (tree / "src" / "small.py").read_bytes()
+
+    @pytest.mark.skipif(shutil.which("unzip") is None, reason="unzip is not installed")
+    def test_archive_passes_unzip_integrity_check(self, mock_logger, tree, tmp_path):
+        archive_path = tmp_path / "out.zip"
+        ParallelZipWriter(mock_logger, workers=1, chunk_size=CHUNK_SIZE).write(tree, archive_path)
+
+        result = subprocess.run(["unzip", "-t", str(archive_path)], capture_output=True, text=True, check=False)
+
+        assert result.returncode == 0, result.stdout